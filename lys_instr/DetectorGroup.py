@@ -0,0 +1,228 @@
+import logging
+
+from lys.Qt import QtCore, QtWidgets
+from .MultiDetector import MultiDetectorInterface
+
+
+class DetectorGroup(MultiDetectorInterface):
+    """
+    Group of detectors that acquire synchronously.
+
+    This class implements the ``MultiDetectorInterface`` contract over several member detectors.
+    Starting an acquisition starts all members concurrently, and the group stays busy until every member has finished.
+    The time per acquisition is therefore the longest member exposure rather than the sum of all exposures.
+
+    Each member keeps emitting its own ``dataAcquired`` signal, so data storages should be connected to the members rather than to the group.
+    Shape and axis properties of the group refer to the primary (first) member.
+    """
+
+    def __init__(self, detectors, **kwargs):
+        """
+        Initialize the detector group.
+
+        Call ``start()`` to begin the background polling thread.
+
+        Args:
+            detectors (Sequence[MultiDetectorInterface] | dict[str, MultiDetectorInterface]): Member detectors, or a mapping of names to member detectors.
+            **kwargs: Additional keyword arguments passed to the base class.
+
+        Raises:
+            ValueError: If no member detector is given.
+        """
+        if not isinstance(detectors, dict):
+            detectors = {f"Detector {i + 1}": d for i, d in enumerate(detectors)}
+        if len(detectors) == 0:
+            raise ValueError("DetectorGroup requires at least one detector.")
+        super().__init__(exposure=self._commonExposure(detectors.values()), **kwargs)
+        self._detectors = detectors
+        self._running = []
+        self._remaining = None
+        for d in detectors.values():
+            d.busyStateChanged.connect(lambda b, d=d: self._memberBusyChanged(d, b), QtCore.Qt.DirectConnection)
+        self.start()
+
+    @staticmethod
+    def _commonExposure(detectors):
+        """
+        Return the exposure time shared by the members.
+
+        Args:
+            detectors (Iterable[MultiDetectorInterface]): Member detectors.
+
+        Returns:
+            float | None: The longest member exposure, or ``None`` if no member supports exposure.
+        """
+        exposures = [d.exposure for d in detectors if d.exposure is not None]
+        return max(exposures) if exposures else None
+
+    @property
+    def detectors(self):
+        """
+        Member detectors.
+
+        Returns:
+            dict[str, MultiDetectorInterface]: Mapping of member names to member detectors.
+        """
+        return dict(self._detectors)
+
+    @property
+    def exposure(self):
+        """
+        Exposure time of the group.
+
+        Returns:
+            float | None: The longest member exposure, or ``None`` if no member supports exposure.
+        """
+        return self._commonExposure(self._detectors.values())
+
+    @exposure.setter
+    def exposure(self, value):
+        """
+        Set the exposure time of all members that support exposure.
+
+        Args:
+            value (float | None): Exposure time to set.
+        """
+        if not hasattr(self, "_detectors"):
+            return
+        for d in self._detectors.values():
+            if d.exposure is not None:
+                d.exposure = value
+
+    def startAcq(self, iter=1, wait=False, output=False):
+        """
+        Start all members concurrently and run the group acquisition thread.
+
+        Members are started from the calling thread so that their acquisition threads behave as if they were started individually.
+        The group acquisition thread only waits for the members to finish.
+        Members that are already busy are skipped with a warning.
+
+        Args:
+            iter (int): Number of iterations passed to each member. -1 means continuous run.
+            wait (bool, optional): If True, blocks until all members have finished. Defaults to False.
+            output (bool, optional): Accepted for interface compatibility. The group itself does not buffer data, so the returned mapping is empty. Defaults to False.
+
+        Returns:
+            dict | None: Empty mapping when both ``wait`` and ``output`` are True; otherwise ``None``.
+
+        Raises:
+            ValueError: If ``output`` is "array". Stacked data must be requested from the members.
+        """
+        if output == "array":
+            raise ValueError("DetectorGroup does not buffer data. Request output='array' from the member detectors.")
+        if not self._busy:
+            started = []
+            for name, d in self._detectors.items():
+                if d.isBusy:
+                    logging.warning(f"Detector {name} is busy. It is skipped in the group acquisition.")
+                else:
+                    started.append(d)
+
+            self._remaining = QtCore.QSemaphore(0)
+            self._running = started
+            for d in started:
+                d.startAcq(iter=iter)
+        return super().startAcq(iter=iter, wait=wait, output=output)
+
+    def _run(self, iter=1):
+        """
+        Block until every member started by ``startAcq()`` has finished.
+
+        Args:
+            iter(int): Number of iterations. Unused because the members are started by ``startAcq()``.
+        """
+        self._remaining.acquire(len(self._running))
+        self._running = []
+
+    def _memberBusyChanged(self, detector, busy):
+        """
+        Count finished members of the running group acquisition.
+
+        Called directly from the member's thread when its busy state changes.
+
+        Args:
+            detector (MultiDetectorInterface): Member detector whose busy state changed.
+            busy (bool): New busy state of the member.
+        """
+        if not busy and detector in self._running:
+            self._remaining.release()
+
+    def _stop(self):
+        """
+        Stop all members that take part in the running group acquisition.
+        """
+        for d in list(self._running):
+            if d.isBusy:
+                d.stop()
+
+    def _get(self):
+        """
+        Return the data buffered by the group.
+
+        Data are delivered by the members' own ``dataAcquired`` signals, so the group itself never buffers frames.
+
+        Returns:
+            dict: Always an empty mapping.
+        """
+        return {}
+
+    def _isAlive(self):
+        """
+        Return the alive state of the group.
+
+        Returns:
+            bool: True if all members are alive, False otherwise.
+        """
+        return all(d.isAlive for d in self._detectors.values())
+
+    @property
+    def frameShape(self):
+        """
+        Shape of a single frame of the primary member.
+
+        Returns:
+            tuple[int, ...]: Dimensions of a single frame.
+        """
+        return self._primary.frameShape
+
+    @property
+    def indexShape(self):
+        """
+        Shape of the index grid of the primary member.
+
+        Returns:
+            tuple[int, ...]: Shape of the index grid.
+        """
+        return self._primary.indexShape
+
+    @property
+    def axes(self):
+        """
+        Axis coordinates of the primary member.
+
+        Returns:
+            list[numpy.ndarray]: Coordinate arrays corresponding to each axis of the index grid.
+        """
+        return self._primary.axes
+
+    @property
+    def _primary(self):
+        """
+        Primary (first) member detector.
+
+        Returns:
+            MultiDetectorInterface: The primary member.
+        """
+        return next(iter(self._detectors.values()))
+
+    def settingsWidget(self):
+        """
+        Create and return a settings widget with one tab per member.
+
+        Returns:
+            QtWidgets.QTabWidget: Tab widget holding the settings widgets of the members.
+        """
+        tabs = QtWidgets.QTabWidget()
+        for name, d in self._detectors.items():
+            tabs.addTab(d.settingsWidget(), name)
+        return tabs
@@ -0,0 +1,213 @@
+import collections
+import logging
+import multiprocessing
+from multiprocessing import shared_memory
+
+import numpy as np
+
+
+_workerBuffer = None
+
+
+def _initWorker(name, shape, dtype, slots):
+    """
+    Attach a decoding worker process to the shared output buffer.
+
+    Called once in each worker process when the pool is created.
+
+    Args:
+        name (str): Name of the shared memory block.
+        shape (tuple[int, ...]): Shape of a single decoded frame.
+        dtype (str): Data type of decoded frames.
+        slots (int): Number of frame slots in the shared buffer.
+    """
+    global _workerBuffer
+    shm = shared_memory.SharedMemory(name=name)
+    _workerBuffer = (shm, np.ndarray((slots, *shape), dtype=dtype, buffer=shm.buf))
+
+
+def _decodeInto(func, raw, slot):
+    """
+    Decode a raw frame in a worker process and write the result into a shared buffer slot.
+
+    Args:
+        func (callable): Picklable decoding function mapping a raw frame to an array.
+        raw (object): Raw (e.g., compressed or packed) frame.
+        slot (int): Index of the shared buffer slot that receives the decoded frame.
+    """
+    _workerBuffer[1][slot] = func(raw)
+
+
+class FrameDecoder:
+    """
+    Ordered frame decoder backed by a process pool and shared-memory output buffers.
+
+    Raw frames submitted by the acquisition thread are decoded in worker processes so that CPU-heavy decoding does not hold the GIL of the main process.
+    Each decoded frame is written into a slot of a shared-memory ring buffer and copied out by ``collect()`` in submission order.
+    When all slots are in use, ``submit()`` waits for the oldest frame, which bounds memory usage and provides back-pressure to the acquisition.
+
+    The decoding function must be picklable (a module-level function or a ``functools.partial`` of one) and must return an array of shape ``shape``.
+    """
+
+    def __init__(self, func, shape, dtype=float, processes=None, slots=None, context=None):
+        """
+        Initialize the decoder.
+
+        The process pool and the shared buffer are created lazily on the first ``submit()``.
+
+        Args:
+            func (callable): Picklable decoding function mapping a raw frame to an array of shape ``shape``.
+            shape (tuple[int, ...]): Shape of a single decoded frame.
+            dtype (data-type, optional): Data type of decoded frames. Defaults to float.
+            processes (int | None, optional): Number of worker processes. Defaults to ``os.cpu_count()``.
+            slots (int | None, optional): Number of shared buffer slots. Defaults to four times the number of processes.
+            context (str | None, optional): Multiprocessing start method (e.g., "fork" or "spawn"). Defaults to the platform default.
+        """
+        self._func = func
+        self._shape = tuple(shape)
+        self._dtype = np.dtype(dtype)
+        self._processes = processes or multiprocessing.cpu_count()
+        self._slots = slots or 4 * self._processes
+        self._context = multiprocessing.get_context(context)
+        self._pool = None
+        self._shm = None
+        self._buffer = None
+        self._free = collections.deque()
+        self._pending = collections.deque()
+        self._done = {}
+
+    @property
+    def shape(self):
+        """
+        Shape of a single decoded frame.
+
+        Returns:
+            tuple[int, ...]: Shape of a single decoded frame.
+        """
+        return self._shape
+
+    @property
+    def dtype(self):
+        """
+        Data type of decoded frames.
+
+        Returns:
+            numpy.dtype: Data type of decoded frames.
+        """
+        return self._dtype
+
+    @property
+    def pending(self):
+        """
+        Number of submitted frames that have not been collected yet.
+
+        Returns:
+            int: Number of frames in flight.
+        """
+        return len(self._pending) + len(self._done)
+
+    def _open(self):
+        """
+        Create the shared output buffer and the worker pool.
+        """
+        size = max(1, self._slots * int(np.prod(self._shape)) * self._dtype.itemsize)
+        self._shm = shared_memory.SharedMemory(create=True, size=size)
+        self._buffer = np.ndarray((self._slots, *self._shape), dtype=self._dtype, buffer=self._shm.buf)
+        self._free = collections.deque(range(self._slots))
+        self._pool = self._context.Pool(self._processes, initializer=_initWorker, initargs=(self._shm.name, self._shape, self._dtype.str, self._slots))
+
+    def submit(self, idx, raw):
+        """
+        Submit a raw frame for decoding.
+
+        Args:
+            idx (tuple[int, ...]): Index tuple of the frame.
+            raw (object): Raw frame passed to the decoding function.
+        """
+        if self._pool is None:
+            self._open()
+        if not self._free:
+            self._retire(*self._pending.popleft())
+        slot = self._free.popleft()
+        self._pending.append((idx, slot, self._pool.apply_async(_decodeInto, (self._func, raw, slot))))
+
+    def _retire(self, idx, slot, result):
+        """
+        Wait for a decoded frame, copy it out of the shared buffer and release its slot.
+
+        If the decoding function raised, the error is logged and only this frame is dropped.
+
+        Args:
+            idx (tuple[int, ...]): Index tuple of the frame.
+            slot (int): Shared buffer slot holding the decoded frame.
+            result (multiprocessing.pool.AsyncResult): Pending result of the decoding task.
+        """
+        try:
+            result.get()
+            self._done[idx] = self._buffer[slot].copy()
+        except Exception as e:
+            logging.warning(f"Error while decoding frame {idx}: {e}")
+        finally:
+            self._free.append(slot)
+
+    def collect(self, wait=False):
+        """
+        Return decoded frames in submission order.
+
+        Frames are returned up to the first one that is still being decoded, so the order of frames is always preserved.
+        Frames that fail to decode are logged and omitted.
+
+        Args:
+            wait (bool, optional): If True, block until all submitted frames are decoded. Defaults to False.
+
+        Returns:
+            dict[tuple, np.ndarray]: Mapping of index tuples to decoded frames, in submission order.
+        """
+        while self._pending and (wait or self._pending[0][2].ready()):
+            self._retire(*self._pending.popleft())
+        done, self._done = self._done, {}
+        return done
+
+    def reset(self):
+        """
+        Discard all frames that have not been collected, e.g., at the end of an acquisition.
+
+        Frames still being decoded are waited for, so that their slots can be reused safely.
+        """
+        while self._pending:
+            idx, slot, result = self._pending.popleft()
+            try:
+                result.wait()
+            finally:
+                self._free.append(slot)
+        self._done = {}
+
+    def decode(self, raw):
+        """
+        Decode a single raw frame in the calling process.
+
+        Args:
+            raw (object): Raw frame passed to the decoding function.
+
+        Returns:
+            np.ndarray: Decoded frame.
+        """
+        return np.asarray(self._func(raw), dtype=self._dtype).reshape(self._shape)
+
+    def close(self):
+        """
+        Terminate the worker pool and release the shared buffer.
+
+        Frames that have not been collected are discarded. The decoder can be reused after closing; a new pool is created on the next ``submit()``.
+        """
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+        self._pending.clear()
+        self._done = {}
+        if self._shm is not None:
+            self._buffer = None
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
@@ -1,5 +1,16 @@
+import asyncio
+import bisect
+import collections
+import concurrent.futures
+import contextlib
+import heapq
+import itertools
+import logging
+import queue
+import threading
+import time
+
 from lys.Qt import QtCore
-from .Utilities import preciseSleep
 
 
 def lock(func):
@@ -20,57 +31,616 @@ def lock(func):
     return wrapper
 
 
+class DeviceTimeoutError(RuntimeError):
+    """
+    Raised when a device call does not return within the call timeout of its ``HardwareInterface``.
+
+    It is a subclass of ``RuntimeError``, so that it is handled like other communication errors.
+    """
+    pass
+
+
+#: Upper bounds (in seconds) of the latency histogram bins of ``HardwareInterface.callStats``; the last bin collects slower calls.
+LATENCY_BINS = (1e-4, 1e-3, 1e-2, 1e-1, 1.0)
+
+
+class _CallStats:
+    """
+    Watchdog metrics for one kind of device call.
+    """
+
+    def __init__(self):
+        """
+        Initialize the metrics.
+        """
+        self.calls = 0
+        self.timeouts = 0
+        self.maxLatency = 0.0
+        self.histogram = [0] * (len(LATENCY_BINS) + 1)
+
+    def record(self, latency):
+        """
+        Record the latency of a completed call.
+
+        Args:
+            latency (float): Call duration in seconds.
+        """
+        self.calls += 1
+        self.maxLatency = max(self.maxLatency, latency)
+        self.histogram[bisect.bisect_left(LATENCY_BINS, latency)] += 1
+
+    def asDict(self):
+        """
+        Return the metrics as a dictionary.
+
+        Returns:
+            dict: Number of calls, number of timeouts, maximum latency (s) and histogram counts per bin of ``LATENCY_BINS``.
+        """
+        return {"calls": self.calls, "timeouts": self.timeouts, "maxLatency": self.maxLatency, "histogram": list(self.histogram)}
+
+
+class _CallWorker:
+    """
+    Daemon threads executing queued calls, one at a time per thread.
+
+    Unlike ``concurrent.futures.ThreadPoolExecutor``, the threads are daemons and are not joined at interpreter exit, so a device call that never returns does not block the process from exiting.
+    """
+
+    def __init__(self, name, threads=1):
+        """
+        Start the worker threads.
+
+        Args:
+            name (str): Thread name.
+            threads (int, optional): Number of worker threads. Defaults to 1.
+        """
+        self._queue = queue.SimpleQueue()
+        self._threads = [threading.Thread(target=self._run, name=name, daemon=True) for _ in range(threads)]
+        for t in self._threads:
+            t.start()
+
+    def submit(self, func, *args, **kwargs):
+        """
+        Queue a call.
+
+        Args:
+            func (callable): Function to call.
+            *args: Positional arguments passed to ``func``.
+            **kwargs: Keyword arguments passed to ``func``.
+
+        Returns:
+            concurrent.futures.Future: Future resolved with the return value of ``func``.
+        """
+        future = concurrent.futures.Future()
+        self._queue.put((future, func, args, kwargs))
+        return future
+
+    def _run(self):
+        """
+        Execute queued calls.
+        """
+        while True:
+            future, func, args, kwargs = self._queue.get()
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(func(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+
+
+class _SignalWaiter:
+    """
+    Bridge from a Qt signal to an asyncio future.
+
+    The waiter connects to the signal on creation, so that emissions between creation and ``wait()`` are not missed.
+    The signal may be emitted from any thread; the future is resolved in the thread running the asyncio event loop.
+    """
+
+    def __init__(self, signal, predicate=None):
+        """
+        Connect to the signal.
+
+        Must be called from a coroutine running in an asyncio event loop.
+
+        Args:
+            signal (pyqtBoundSignal): Signal to wait for.
+            predicate (callable | None): Called with the signal arguments; the waiter is resolved when it returns True. Defaults to resolving on any emission.
+        """
+        self._signal = signal
+        self._predicate = predicate
+        self._loop = asyncio.get_running_loop()
+        self._future = self._loop.create_future()
+        self._signal.connect(self._emitted, QtCore.Qt.DirectConnection)
+
+    def _emitted(self, *args):
+        """
+        Handle a signal emission in the emitting thread.
+        """
+        if self._predicate is None or self._predicate(*args):
+            self._loop.call_soon_threadsafe(self.resolve)
+
+    def resolve(self):
+        """
+        Resolve the waiter. Must be called in the thread running the event loop.
+        """
+        if not self._future.done():
+            self._future.set_result(None)
+
+    async def wait(self):
+        """
+        Wait until the waiter is resolved, then disconnect from the signal.
+        """
+        try:
+            await self._future
+        finally:
+            self._signal.disconnect(self._emitted)
+
+
+class PollingScheduler(QtCore.QThread):
+    """
+    Shared polling thread for hardware interfaces.
+
+    A single thread schedules all registered devices, each at its own (possibly adaptive) interval given by ``HardwareInterface.pollInterval``.
+    Due times are kept in a heap, so the thread only wakes up when a device is due instead of once per device and interval.
+    Due devices are polled on a small pool of worker threads, so that a slow or hung device occupies one worker and does not stop the polling of the others.
+    A device is never polled by two workers at the same time.
+    ``wake()`` reschedules a device for immediate polling; stale heap entries are skipped using a per-device sequence number.
+    Exceptions raised while polling a device are logged.
+    """
+
+    def __init__(self, workers=4):
+        """
+        Initialize the scheduler. The thread is started when the first device is registered.
+
+        Args:
+            workers (int, optional): Number of threads polling devices. Defaults to 4.
+        """
+        super().__init__()
+        self._mutex = QtCore.QMutex()
+        self._cond = QtCore.QWaitCondition()
+        self._heap = []
+        self._devices = {}
+        self._polling = set()
+        self._rewake = set()
+        self._counter = itertools.count()
+        self._wakeups = 0
+        self._pool = _CallWorker("lys_instr poller", threads=max(1, int(workers)))
+
+    def register(self, device):
+        """
+        Register a device and poll it as soon as possible.
+
+        Args:
+            device (HardwareInterface): Device to poll.
+        """
+        self.wake(device)
+        if not self.isRunning():
+            self.start()
+
+    def wake(self, device):
+        """
+        Poll a device as soon as possible, regardless of its current interval.
+
+        Args:
+            device (HardwareInterface): Device to poll.
+        """
+        with QtCore.QMutexLocker(self._mutex):
+            self._schedule(device, time.perf_counter())
+            self._cond.wakeAll()
+
+    def _schedule(self, device, due):
+        """
+        Push a heap entry for a device and invalidate its previous entry. Must be called with the mutex held.
+
+        Args:
+            device (HardwareInterface): Device to poll.
+            due (float): Due time in ``time.perf_counter()`` seconds.
+        """
+        seq = next(self._counter)
+        self._devices[device] = seq
+        heapq.heappush(self._heap, (due, seq, device))
+
+    def unregister(self, device):
+        """
+        Stop polling a device.
+
+        Args:
+            device (HardwareInterface): Device to remove.
+        """
+        with QtCore.QMutexLocker(self._mutex):
+            self._devices.pop(device, None)
+
+    @property
+    def devices(self):
+        """
+        Devices currently polled by the scheduler.
+
+        Returns:
+            list[HardwareInterface]: Registered devices.
+        """
+        with QtCore.QMutexLocker(self._mutex):
+            return list(self._devices)
+
+    @property
+    def wakeups(self):
+        """
+        Number of times the scheduler thread has woken up from sleep.
+
+        Devices that are due at the same time are polled within a single wakeup.
+
+        Returns:
+            int: Number of wakeups since the scheduler was created.
+        """
+        return self._wakeups
+
+    def run(self):
+        """
+        Poll registered devices when they are due.
+        """
+        self._mutex.lock()
+        while True:
+            if not self._heap:
+                self._cond.wait(self._mutex)
+                continue
+            due, seq, device = self._heap[0]
+            if self._devices.get(device) != seq:
+                heapq.heappop(self._heap)
+                continue
+            remaining = due - time.perf_counter()
+            if remaining > 0:
+                self._cond.wait(self._mutex, max(1, int(remaining * 1000)))
+                self._wakeups += 1
+                continue
+            heapq.heappop(self._heap)
+            if device in self._polling:
+                # Poll again as soon as the poll in progress has finished
+                self._rewake.add(device)
+                continue
+            self._polling.add(device)
+            self._pool.submit(self._poll, device, seq, due)
+
+    def _poll(self, device, seq, due):
+        """
+        Poll a device in a worker thread and schedule its next poll.
+
+        Args:
+            device (HardwareInterface): Device to poll.
+            seq (int): Sequence number of the heap entry that triggered the poll.
+            due (float): Due time of the poll.
+        """
+        try:
+            device._loadState()
+            interval = device.pollInterval
+        except Exception as e:
+            logging.warning(f"Error while polling {device}: {e}")
+            interval = device.interval
+        with QtCore.QMutexLocker(self._mutex):
+            self._polling.discard(device)
+            if device in self._rewake:
+                self._rewake.discard(device)
+                if device in self._devices:
+                    self._schedule(device, time.perf_counter())
+            elif self._devices.get(device) == seq:
+                self._schedule(device, max(due + interval, time.perf_counter()))
+            self._cond.wakeAll()
+
+
 class HardwareInterface(QtCore.QThread):
     """
     Abstract base class for hardware interfaces with background monitoring.
 
     This class provides background thread management and a standard structure for device state monitoring. 
-    Each subclass represents a hardware device and runs its own monitoring thread. 
-    The thread periodically calls ``_loadState()`` to poll and update device-specific state information.
-    The monitoring thread can be stopped by calling the instance's ``kill()`` method, or all threads can be stopped using the ``killAll()`` class method. 
+    Each subclass represents a hardware device whose state is polled in the background.
+    By default, all devices are polled by a shared ``PollingScheduler`` and its small worker pool, each at its own interval.
+    Latency-critical devices can opt out with ``dedicated=True`` and run their own monitoring thread.
+
+    The polling periodically calls ``_loadState()`` to update device-specific state information.
+    The monitoring can be stopped by calling the instance's ``kill()`` method, or for all devices using the ``killAll()`` class method. 
+
+    Device calls made through ``_call()`` are timed and, if ``callTimeout`` is given, executed in a worker thread with a deadline.
+    A call that does not return in time raises ``DeviceTimeoutError`` and calls ``_onTimeout()``, so that locks held by the caller are released;
+    further calls fail fast until the hung call returns.
+    Per-call-type metrics (calls, timeouts, latency histogram) are available from ``callStats``.
+
+    Polling is adaptive: while the device is active (see ``_isActive()``) and for ``holdTime`` seconds afterwards, it is polled every ``interval`` seconds.
+    When idle, the interval grows by ``backoff`` per poll up to the ``idleInterval`` heartbeat. ``_wake()`` triggers an immediate poll and restores the fast rate.
     
     Subclasses must implement ``_loadState()`` to provide device-specific behavior.
     """
 
     __list = []
+    __scheduler = None
+    __deferred = None
+    __deferLock = threading.Lock()
 
-    def __init__(self, interval=0.1, **kwargs):
+    def __init__(self, interval=0.1, idleInterval=1.0, backoff=2.0, holdTime=0.5, dedicated=False, callTimeout=None, **kwargs):
         """
         Initialize the hardware interface.
 
         Register the device instance and append it to the internal instance list (``__list``).
 
         Args:
-            interval (float, optional): Time interval (in seconds) between successive state polls. Defaults to 0.1.
+            interval (float, optional): Time interval (in seconds) between successive state polls while the device is active. Defaults to 0.1.
+            idleInterval (float | None, optional): Heartbeat interval (in seconds) reached when the device is idle, or ``None`` to always poll at ``interval``. Defaults to 1.0.
+            backoff (float, optional): Factor by which the interval grows per idle poll. Defaults to 2.0.
+            holdTime (float, optional): Time (in seconds) after the device was last active during which the fast interval is kept. Defaults to 0.5.
+            dedicated (bool, optional): If True, poll the device in its own thread instead of the shared scheduler. Defaults to False.
+            callTimeout (float | None, optional): Maximum duration (in seconds) of device calls made through ``_call()``, or ``None`` to call without deadline. Defaults to None.
             **kwargs: Additional keyword arguments passed to ``QtCore.QThread``.
         """
         super().__init__(**kwargs)
         self.__interval = interval
+        self.__idleInterval = idleInterval
+        self.__backoff = backoff
+        self.__holdTime = holdTime
+        self.__current = interval
+        self.__lastActive = time.perf_counter()
+        self.__dedicated = dedicated
         self.__stopped = False
+        self.__woken = False
         self.__mutex = QtCore.QMutex()
+        self.__wakeCond = QtCore.QWaitCondition()
+        self.__callTimeout = callTimeout
+        self.__executor = None
+        self.__hung = None
+        self.__executorLock = threading.Lock()
+        self.__stats = collections.defaultdict(_CallStats)
         HardwareInterface.__list.append(self)
 
+    @classmethod
+    def scheduler(cls):
+        """
+        Return the shared polling scheduler, creating it on first use.
+
+        Returns:
+            PollingScheduler: The scheduler shared by all non-dedicated devices.
+        """
+        if HardwareInterface.__scheduler is None:
+            HardwareInterface.__scheduler = PollingScheduler()
+        return HardwareInterface.__scheduler
+
+    @staticmethod
+    @contextlib.contextmanager
+    def deferredStart():
+        """
+        Context manager deferring ``start()`` of all devices until the block exits.
+
+        Devices constructed in the block, in any thread, begin monitoring only when the block exits,
+        so that polling does not compete with the construction and connection of other devices.
+        Devices killed in the block are not started. Nested blocks are merged into the outermost one.
+        """
+        with HardwareInterface.__deferLock:
+            outer = HardwareInterface.__deferred is None
+            if outer:
+                HardwareInterface.__deferred = []
+        if not outer:
+            yield
+            return
+        try:
+            yield
+        finally:
+            with HardwareInterface.__deferLock:
+                deferred, HardwareInterface.__deferred = HardwareInterface.__deferred, None
+            for device, args, kwargs in deferred:
+                if not device.__stopped:
+                    device.start(*args, **kwargs)
+
+    def warmUp(self):
+        """
+        Poll the device state once without starting background monitoring.
+
+        This is used to open connections and fill the device state while devices are being set up (see ``DeviceLauncher``).
+        The base implementation calls ``_loadState()``.
+        """
+        self._loadState()
+
+    @property
+    def interval(self):
+        """
+        Time interval (in seconds) between successive state polls while the device is active.
+
+        Returns:
+            float: Fast polling interval.
+        """
+        return self.__interval
+
+    @property
+    def idleInterval(self):
+        """
+        Heartbeat interval (in seconds) reached when the device is idle.
+
+        Returns:
+            float | None: Idle polling interval, or ``None`` if the device is always polled at ``interval``.
+        """
+        return self.__idleInterval
+
+    @property
+    def pollInterval(self):
+        """
+        Adaptive time interval (in seconds) until the next state poll.
+
+        The fast ``interval`` is used while the device is active and for ``holdTime`` seconds afterwards.
+        Otherwise the interval grows by ``backoff`` per poll until it reaches ``idleInterval``.
+
+        Returns:
+            float: Interval until the next poll.
+        """
+        now = time.perf_counter()
+        if self._isActive():
+            self.__lastActive = now
+        if self.__idleInterval is None or now - self.__lastActive < self.__holdTime:
+            self.__current = self.__interval
+        else:
+            self.__current = min(max(self.__current, self.__interval) * self.__backoff, self.__idleInterval)
+        return self.__current
+
+    def _isActive(self):
+        """
+        Return whether the device is active and should be polled at the fast rate.
+
+        Subclasses should override this method using cached state only, without device communication.
+        The base implementation returns False.
+
+        Returns:
+            bool: True if the device is active.
+        """
+        return False
+
+    def _wake(self):
+        """
+        Poll the device immediately and restore the fast polling rate.
+
+        Subclasses call this method after issuing a command (e.g., ``set()``) so that the resulting state change is detected without waiting for the idle interval.
+        """
+        self.__lastActive = time.perf_counter()
+        self.__current = self.__interval
+        if self.__dedicated:
+            with QtCore.QMutexLocker(self.__mutex):
+                self.__woken = True
+                self.__wakeCond.wakeAll()
+        elif self in self.scheduler()._devices:
+            self.scheduler().wake(self)
+
+    @property
+    def callTimeout(self):
+        """
+        Maximum duration (in seconds) of device calls made through ``_call()``.
+
+        Returns:
+            float | None: Call timeout, or ``None`` if calls have no deadline.
+        """
+        return self.__callTimeout
+
+    @property
+    def callStats(self):
+        """
+        Watchdog metrics of device calls made through ``_call()``.
+
+        Returns:
+            dict[str, dict]: Mapping of call kinds (e.g., "get", "set", "isBusy") to the number of calls, the number of timeouts,
+            the maximum latency (s) and the latency histogram over the bins of ``LATENCY_BINS``.
+        """
+        return {kind: stats.asDict() for kind, stats in list(self.__stats.items())}
+
+    def _call(self, kind, func, *args, **kwargs):
+        """
+        Call a device function with timing and, if ``callTimeout`` is set, with a deadline.
+
+        With a deadline, the function runs in a daemon worker thread of the device. Calls are executed one at a time, so the device is never accessed concurrently.
+        If a call times out, it keeps running in the worker; until it returns, further calls fail immediately with ``DeviceTimeoutError``
+        instead of piling up behind it.
+
+        Args:
+            kind (str): Call kind under which metrics are recorded, e.g., "get".
+            func (callable): Device function to call.
+            *args: Positional arguments passed to ``func``.
+            **kwargs: Keyword arguments passed to ``func``.
+
+        Returns:
+            Any: Return value of ``func``.
+
+        Raises:
+            DeviceTimeoutError: If ``func`` does not return within ``callTimeout``, or a previous call is still hung.
+        """
+        stats = self.__stats[kind]
+        start = time.perf_counter()
+        if self.__callTimeout is None:
+            result = func(*args, **kwargs)
+        else:
+            with self.__executorLock:
+                hung = self.__hung
+                if hung is not None and not hung.done():
+                    future = None
+                else:
+                    self.__hung = None
+                    if self.__executor is None:
+                        self.__executor = _CallWorker(f"lys_instr {type(self).__name__}")
+                    future = self.__executor.submit(func, *args, **kwargs)
+            if future is None:
+                stats.timeouts += 1
+                self._onTimeout(kind)
+                raise DeviceTimeoutError(f"{type(self).__name__}: {kind} rejected because a previous call has not returned.")
+            try:
+                result = future.result(self.__callTimeout)
+            except concurrent.futures.TimeoutError:
+                stats.timeouts += 1
+                with self.__executorLock:
+                    self.__hung = future
+                self._onTimeout(kind)
+                raise DeviceTimeoutError(f"{type(self).__name__}: {kind} did not return within {self.__callTimeout} s.")
+        stats.record(time.perf_counter() - start)
+        return result
+
+    def _onTimeout(self, kind):
+        """
+        Handle a device call that timed out.
+
+        Subclasses override this method to mark the device as not alive. The base implementation does nothing.
+
+        Args:
+            kind (str): Kind of the call that timed out.
+        """
+        pass
+
+    @property
+    def dedicated(self):
+        """
+        Whether the device is polled in its own thread.
+
+        Returns:
+            bool: True for a dedicated monitoring thread, False for the shared scheduler.
+        """
+        return self.__dedicated
+
+    def start(self, *args, **kwargs):
+        """
+        Start background monitoring.
+
+        Register the device with the shared scheduler, or start the dedicated monitoring thread if the device opted out.
+        Inside a ``deferredStart()`` block, monitoring begins when the block exits.
+
+        Args:
+            *args: Positional arguments passed to ``QtCore.QThread.start()`` for dedicated devices.
+            **kwargs: Keyword arguments passed to ``QtCore.QThread.start()`` for dedicated devices.
+        """
+        with HardwareInterface.__deferLock:
+            if HardwareInterface.__deferred is not None:
+                HardwareInterface.__deferred.append((self, args, kwargs))
+                return
+        if self.__dedicated:
+            super().start(*args, **kwargs)
+        else:
+            self.scheduler().register(self)
+
     def run(self):
         """
         Override ``QtCore.QThread.run()`` to define the background execution loop for a device instance.
         
-        This method is executed automatically when ``start()`` is called, which is typically done in subclasses.
-        It repeatedly calls ``_loadState()`` at the specified interval until ``kill()`` is called.
+        This method is executed automatically when ``start()`` is called for a dedicated device.
+        It repeatedly calls ``_loadState()`` at the adaptive interval until ``kill()`` is called; ``_wake()`` interrupts the wait.
         """
         while(True):
             if self.__stopped:
                 return
             self._loadState()
-            preciseSleep(self.__interval)
+            with QtCore.QMutexLocker(self.__mutex):
+                if not self.__woken and not self.__stopped:
+                    self.__wakeCond.wait(self.__mutex, max(1, int(self.pollInterval * 1000)))
+                self.__woken = False
 
     def kill(self):
         """
         Stop the monitoring thread for this device instance.
 
-        This method sets the internal stop flag under the mutex so the running thread will exit its loop and terminate cleanly.
+        This method sets the internal stop flag under the mutex so the running thread will exit its loop and terminate cleanly,
+        and removes the device from the shared scheduler.
         """
         with QtCore.QMutexLocker(self.__mutex):
             self.__stopped = True
+            self.__wakeCond.wakeAll()
+        if not self.__dedicated and HardwareInterface.__scheduler is not None:
+            HardwareInterface.__scheduler.unregister(self)
 
     def _loadState(self):
         """
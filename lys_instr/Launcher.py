@@ -0,0 +1,131 @@
+import concurrent.futures
+import logging
+import time
+
+from lys.Qt import QtCore
+from .Interfaces import HardwareInterface
+
+
+class DeviceLauncher:
+    """
+    Registry of devices that are constructed and connected concurrently.
+
+    Devices are registered with ``add()`` as factories (usually the device classes) and constructed by ``launch()`` in a thread pool,
+    so that the connection time of slow devices overlaps instead of adding up. Each device is polled once (see ``HardwareInterface.warmUp()``)
+    and moved to the thread calling ``launch()``. Background monitoring of all devices begins only after every device is ready.
+
+    Example:
+        >>> launcher = DeviceLauncher()
+        >>> launcher.add("motor", dummy.MultiMotorDummy, "x", "y")
+        >>> launcher.add("detector", dummy.MultiDetectorDummy, frameShape=(256, 256))
+        >>> devices = launcher.launch()
+    """
+
+    def __init__(self, workers=8):
+        """
+        Initialize the launcher.
+
+        Args:
+            workers (int, optional): Maximum number of devices constructed at the same time. Defaults to 8.
+        """
+        self._workers = max(1, int(workers))
+        self._entries = {}
+        self._devices = {}
+        self._timing = {}
+
+    def add(self, name, factory, *args, **kwargs):
+        """
+        Register a device.
+
+        Args:
+            name (str): Device name used as key of the launched devices.
+            factory (callable): Function or class constructing the device.
+            *args: Positional arguments passed to ``factory``.
+            **kwargs: Keyword arguments passed to ``factory``.
+
+        Returns:
+            DeviceLauncher: This launcher, so that calls can be chained.
+
+        Raises:
+            ValueError: If a device of the same name is already registered.
+        """
+        if name in self._entries:
+            raise ValueError(f"Device '{name}' is already registered.")
+        self._entries[name] = (factory, args, kwargs)
+        return self
+
+    @property
+    def devices(self):
+        """
+        Launched devices.
+
+        Returns:
+            dict[str, object]: Mapping of device names to devices, in the order of registration.
+        """
+        return dict(self._devices)
+
+    @property
+    def timing(self):
+        """
+        Startup time of each launched device, including its warm-up poll.
+
+        Returns:
+            dict[str, float]: Mapping of device names to startup times (in seconds).
+        """
+        return dict(self._timing)
+
+    def launch(self, warmUp=True):
+        """
+        Construct all registered devices concurrently and start their monitoring.
+
+        If a device cannot be constructed, the devices constructed so far are killed and none of them is started.
+
+        Args:
+            warmUp (bool, optional): If True, poll each device once after construction. Defaults to True.
+
+        Returns:
+            dict[str, object]: Mapping of device names to devices, in the order of registration.
+
+        Raises:
+            RuntimeError: If any device fails to start.
+        """
+        thread = QtCore.QThread.currentThread()
+        names = [name for name in self._entries if name not in self._devices]
+        start = time.perf_counter()
+        with HardwareInterface.deferredStart():
+            with concurrent.futures.ThreadPoolExecutor(max_workers=max(1, min(self._workers, len(names)))) as pool:
+                futures = {name: pool.submit(self._create, thread, warmUp, *self._entries[name]) for name in names}
+            errors = {name: f.exception() for name, f in futures.items() if f.exception() is not None}
+            if errors:
+                for name, f in futures.items():
+                    if name not in errors and isinstance(f.result()[0], HardwareInterface):
+                        f.result()[0].kill()
+                name, error = next(iter(errors.items()))
+                raise RuntimeError(f"Failed to start device(s) {list(errors)}: {name}: {error}") from error
+            for name in names:
+                self._devices[name], self._timing[name] = futures[name].result()
+        logging.info(f"Started {len(names)} device(s) in {time.perf_counter() - start:.3f} s: " + ", ".join(f"{name} {self._timing[name]:.3f} s" for name in names))
+        return self.devices
+
+    @staticmethod
+    def _create(thread, warmUp, factory, args, kwargs):
+        """
+        Construct and warm up a device in a pool thread.
+
+        Args:
+            thread (QtCore.QThread): Thread to which the device is moved.
+            warmUp (bool): Whether to poll the device once.
+            factory (callable): Function or class constructing the device.
+            args (tuple): Positional arguments passed to ``factory``.
+            kwargs (dict): Keyword arguments passed to ``factory``.
+
+        Returns:
+            tuple[object, float]: The device and its startup time (in seconds).
+        """
+        start = time.perf_counter()
+        device = factory(*args, **kwargs)
+        if warmUp and isinstance(device, HardwareInterface):
+            device.warmUp()
+        if isinstance(device, QtCore.QObject):
+            device.moveToThread(thread)
+        return device, time.perf_counter() - start
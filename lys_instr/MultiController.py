@@ -1,9 +1,16 @@
+import asyncio
+import collections
+import functools
+import itertools
 import logging
 import os
+import threading
+import time
+import types
 import weakref
 
 import numpy as np
-from .Interfaces import HardwareInterface, lock
+from .Interfaces import HardwareInterface, DeviceTimeoutError, lock, _SignalWaiter
 from lys.Qt import QtCore
 
 
@@ -26,6 +33,228 @@ class _AxisInfo():
         self.alive = alive
         self.target = None
 
+class _ReadCoalescer():
+    """
+    Merge concurrent and near-simultaneous device reads into a single read.
+
+    The first caller performs the read; callers arriving while it is in flight wait for it and share its result.
+    The result is reused for ``window`` seconds afterwards, until ``invalidate()`` is called (e.g., when a new target is set).
+    """
+
+    def __init__(self, window=0.01):
+        """
+        Initialize the coalescer.
+
+        Args:
+            window (float, optional): Time (in seconds) for which a completed read is shared with subsequent callers. Defaults to 0.01.
+        """
+        self._window = window
+        self._lock = threading.Lock()
+        self._pending = None
+        self._result = None
+        self._timestamp = None
+        self._start = None
+        self._generation = 0
+        self._reads = 0
+
+    @property
+    def reads(self):
+        """
+        Number of reads actually performed.
+
+        Returns:
+            int: Number of calls of the read function since creation.
+        """
+        return self._reads
+
+    def read(self, func, since=None, join=True):
+        """
+        Return the result of ``func()``, sharing it among concurrent and near-simultaneous callers.
+
+        Args:
+            func (callable): Function performing the device read.
+            since (float | None, optional): Only share reads started at or after this ``time.perf_counter()`` time. Defaults to any read within the window.
+            join (bool, optional): If False, never wait for a read in flight in another thread; read from the device instead. Callers holding a lock that the reading thread may need must pass False. Defaults to True.
+
+        Returns:
+            dict: A copy of the shared result.
+
+        Raises:
+            Exception: Any exception raised by ``func()`` is raised in all callers sharing the read.
+        """
+        with self._lock:
+            now = time.perf_counter()
+            if self._result is not None and now - self._timestamp <= self._window and (since is None or self._start >= since):
+                return dict(self._result)
+            pending = self._pending
+            if pending is not None and join and (since is None or pending[3] >= since):
+                leader = False
+            else:
+                pending = [threading.Event(), None, None, now]
+                if self._pending is None:
+                    self._pending = pending
+                generation = self._generation
+                leader = True
+
+        if not leader:
+            pending[0].wait()
+            if pending[2] is not None:
+                raise pending[2]
+            return dict(pending[1])
+
+        try:
+            self._reads += 1
+            pending[1] = func()
+            return dict(pending[1])
+        except Exception as e:
+            pending[2] = e
+            raise
+        finally:
+            with self._lock:
+                if self._pending is pending:
+                    self._pending = None
+                if pending[2] is None and generation == self._generation and (self._result is None or pending[3] >= self._start):
+                    self._result, self._timestamp, self._start = pending[1], time.perf_counter(), pending[3]
+            pending[0].set()
+
+    def invalidate(self):
+        """
+        Discard the shared result so that the next caller reads from the device.
+        """
+        with self._lock:
+            self._generation += 1
+            self._result = None
+
+
+class _CommandQueue(QtCore.QThread):
+    """
+    Worker thread applying queued targets of a controller.
+
+    Targets queued while the worker is busy are merged per axis (the latest target wins),
+    and all pending axes are applied with a single ``set`` so that the device receives one ``_set(**kwargs)`` call per batch.
+    """
+
+    def __init__(self, controller):
+        """
+        Initialize the queue. The worker thread is started on the first ``put()``.
+
+        The queue is a child of the controller, so that it follows the controller when it is moved to another thread (e.g., by ``DeviceLauncher``).
+
+        Args:
+            controller (MultiControllerInterface): Controller to which targets are applied.
+        """
+        super().__init__(controller)
+        self._controller = weakref.ref(controller)
+        self._mutex = QtCore.QMutex()
+        self._cond = QtCore.QWaitCondition()
+        self._pending = {}
+        self._applying = {}
+        self._running = False
+        self._stopped = False
+        self._batches = 0
+
+    @property
+    def batches(self):
+        """
+        Number of batches applied to the controller.
+
+        Returns:
+            int: Number of ``set`` calls made by the worker.
+        """
+        return self._batches
+
+    @property
+    def pending(self):
+        """
+        Targets that are queued or being applied.
+
+        Returns:
+            dict[str, float]: Axis-value pairs in device coordinates; queued targets override the batch being applied.
+        """
+        with QtCore.QMutexLocker(self._mutex):
+            return {**self._applying, **self._pending}
+
+    def put(self, targets):
+        """
+        Queue targets, replacing pending targets of the same axes.
+
+        Args:
+            targets (dict[str, float]): Axis-value pairs in device coordinates.
+        """
+        with QtCore.QMutexLocker(self._mutex):
+            self._pending.update(targets)
+            self._cond.wakeAll()
+        if not self.isRunning():
+            self.start()
+
+    def flush(self):
+        """
+        Block until all queued targets have been applied.
+        """
+        with QtCore.QMutexLocker(self._mutex):
+            while (self._pending or self._running) and not self._stopped:
+                self._cond.wait(self._mutex)
+
+    def clear(self):
+        """
+        Discard pending targets that have not been applied yet.
+        """
+        with QtCore.QMutexLocker(self._mutex):
+            self._pending = {}
+            self._cond.wakeAll()
+
+    def stop(self):
+        """
+        Discard pending targets and stop the worker thread.
+        """
+        with QtCore.QMutexLocker(self._mutex):
+            self._stopped = True
+            self._pending = {}
+            self._cond.wakeAll()
+
+    def run(self):
+        """
+        Apply pending targets in batches until ``stop()`` is called.
+        """
+        while True:
+            with QtCore.QMutexLocker(self._mutex):
+                while not self._pending and not self._stopped:
+                    self._cond.wait(self._mutex)
+                if self._stopped:
+                    return
+                targets, self._pending = self._pending, {}
+                self._applying = targets
+                self._running = True
+            try:
+                controller = self._controller()
+                if controller is not None:
+                    controller._apply(**targets)
+                    self._batches += 1
+            except Exception as e:
+                logging.warning(f"Error while applying queued targets {targets}: {e}")
+            finally:
+                with QtCore.QMutexLocker(self._mutex):
+                    self._running = False
+                    self._applying = {}
+                    self._cond.wakeAll()
+
+
+class StateSnapshot(collections.namedtuple("StateSnapshot", ["version", "timestamp", "values", "busy", "alive"])):
+    """
+    Immutable snapshot of the state of all axes of a controller.
+
+    A new snapshot is published atomically by the poller (and by ``set()`` and ``_notify()``) whenever the state is loaded, so readers never observe a partially updated state.
+
+    Attributes:
+        version (int): Number incremented on every publication.
+        timestamp (float): ``time.perf_counter()`` time at which the values were read.
+        values (Mapping[str, float]): Axis values in device coordinates. Empty until the first poll.
+        busy (Mapping[str, bool]): Axis busy states.
+        alive (Mapping[str, bool]): Axis alive states.
+    """
+    __slots__ = ()
+
+
 class MultiControllerInterface(HardwareInterface):
     """
     Abstract interface for multi-axis controllers (e.g., motors, switches, or similar).
@@ -34,8 +263,20 @@ class MultiControllerInterface(HardwareInterface):
     Subclasses must implement device-specific methods: ``_get()``, ``_set()``, ``_isBusy()``, and ``_isAlive()``. 
     ``_get()``, ``_set()``, and ``_isBusy()`` should raise ``RuntimeError`` on communication errors; 
     ``_isAlive()`` should return the current alive state without raising ``RuntimeError`` that interrupts monitoring.
+
+    The polled state is published as an immutable ``StateSnapshot``. Readers that must not block on device I/O use ``snapshot`` or ``get(cached=True)``,
+    which do not take the instance mutex; only commands and uncached reads go to the device.
+    ``isBusy`` falls back to the snapshot while the mutex is held. Commands issued by ``set()`` still take the mutex and therefore wait for a poll in progress;
+    use ``set(queued=True)`` to avoid blocking the caller.
+    Uncached reads from the poller and from other callers within ``coalesceWindow`` seconds are merged into a single ``_get()`` call.
+
+    Controllers that can push notifications (e.g., "motion complete" or position events) set ``eventDriven = True`` and call ``_notify()`` from their device callbacks.
+    The axis state is then updated and signals are emitted as soon as an event arrives, and polling is kept only as a slow watchdog at ``idleInterval``.
     """
 
+    #: If True, the subclass reports state changes via ``_notify()`` and polling only serves as a watchdog.
+    eventDriven = False
+
     #: Signal (dict) emitted when axis values change.
     valueChanged = QtCore.pyqtSignal(dict)
 
@@ -45,17 +286,23 @@ class MultiControllerInterface(HardwareInterface):
     #: Signal (dict) emitted when alive state changes.
     aliveStateChanged = QtCore.pyqtSignal(dict)
 
-    def __init__(self, *axisNamesAll, **kwargs):
+    def __init__(self, *axisNamesAll, coalesceWindow=0.01, **kwargs):
         """
         Initialize the interface with the given axis names.
 
         Args:
             *axisNamesAll: Names of all axes to manage.
+            coalesceWindow (float, optional): Time (in seconds) for which a device read is shared with subsequent ``get()`` calls. Defaults to 0.01.
             **kwargs: Additional keyword arguments passed to the base class.
         """
         super().__init__(**kwargs)
+        self._coalescer = _ReadCoalescer(coalesceWindow)
+        self._commands = _CommandQueue(self)
         self._info = {name: _AxisInfo() for name in axisNamesAll}
-        self._mutex = QtCore.QMutex()
+        self._mutex = QtCore.QMutex(QtCore.QMutex.Recursive)
+        self._versions = itertools.count()
+        self._snapshot = None
+        self._publish({})
 
     @lock
     def _loadState(self):
@@ -65,13 +312,21 @@ class MultiControllerInterface(HardwareInterface):
         Emit the ``busyStateChanged`` and ``aliveStateChanged`` signals if any axis state has changed.
         Log any runtime errors that occur during state loading.
         """
+        values = None
+        timedOut = False
         try:
-            bs = self._isBusy()
+            bs = self._call("isBusy", self._isBusy)
+            since = time.perf_counter()
             busyUpdate = {name: b for name, b in bs.items() if b != self._info[name].busy}
+            # Read values while moving and when the busy state changes; otherwise only refresh the snapshot once per idle interval
+            refresh = self.idleInterval or self.interval
+            if any(bs.values()) or len(busyUpdate) > 0 or len(self._snapshot.values) < len(self._info) or since - self._snapshot.timestamp >= refresh:
+                # Only reads started after the busy state was read are consistent with it (e.g., final positions)
+                values = self._coalescer.read(self._readDevice, since=since, join=False)
 
             # Emit valueChanged signal if any axis is busy
             if any(bs.values()) or len(busyUpdate) > 0:
-                vs = self.get()
+                vs = self._userValues(values)
                 self.valueChanged.emit({name: vs[name] for name, b in bs.items() if b or name in busyUpdate})
 
             # Update busy state log and emit busyStateChanged signal if any axis has changed its busy state
@@ -82,11 +337,18 @@ class MultiControllerInterface(HardwareInterface):
                         self._info[name].target = None
                 self.busyStateChanged.emit(busyUpdate)
 
+        except DeviceTimeoutError as e:
+            logging.warning(f"Device timeout in _loadState: {e}")
+            timedOut = True
+
         except RuntimeError as e:
             logging.warning(f"Runtime error in _loadState: {e}")
 
         finally:
-            al = self._isAlive()
+            try:
+                al = {name: False for name in self._info} if timedOut else self._call("isAlive", self._isAlive)
+            except DeviceTimeoutError:
+                al = {name: False for name in self._info}
             aliveUpdate = {name: a for name, a in al.items() if a != self._info[name].alive}
 
             # Update alive state if any axis has changed its alive state
@@ -94,30 +356,145 @@ class MultiControllerInterface(HardwareInterface):
                 for name, a in aliveUpdate.items():
                     self._info[name].alive = a
                 self.aliveStateChanged.emit(al)
+            self._publish(values)
 
-    def set(self, wait=False, lock=True, **kwargs):
+    def _publish(self, values=None):
+        """
+        Publish a new state snapshot from the per-axis state.
+
+        Replacing the snapshot reference is atomic, so readers always see a consistent snapshot without locking.
+
+        Args:
+            values (dict[str, float] | None): Newly read axis values in device coordinates, merged into the previous values. If None, the previous values and timestamp are kept.
+        """
+        prev = self._snapshot
+        if values is None:
+            timestamp, merged = prev.timestamp, prev.values
+        else:
+            timestamp = time.perf_counter()
+            merged = types.MappingProxyType({**prev.values, **values} if prev is not None else dict(values))
+        busy = types.MappingProxyType({name: info.busy for name, info in self._info.items()})
+        alive = types.MappingProxyType({name: info.alive for name, info in self._info.items()})
+        self._snapshot = StateSnapshot(next(self._versions), timestamp, merged, busy, alive)
+
+    @property
+    def snapshot(self):
+        """
+        Latest published state snapshot.
+
+        Reading the snapshot never blocks on device I/O.
+
+        Returns:
+            StateSnapshot: Latest snapshot of values, busy and alive states.
+        """
+        return self._snapshot
+
+    @lock
+    def _notify(self, values=None, busy=None, alive=None):
+        """
+        Report device events pushed by the controller.
+
+        Event-driven subclasses call this method from their device callbacks, in any thread, instead of waiting for the next poll.
+        Per-axis state is updated and ``valueChanged``, ``busyStateChanged`` and ``aliveStateChanged`` are emitted for changed axes only.
+        The instance mutex is recursive, so callbacks may also be invoked synchronously from ``_set()``.
+
+        Args:
+            values (dict[str, float] | None): Axis values in device coordinates, e.g., reported positions.
+            busy (dict[str, bool] | None): Axis busy states, e.g., False on "motion complete".
+            alive (dict[str, bool] | None): Axis alive states.
+        """
+        if values:
+            self.valueChanged.emit(self._userValues(values))
+        if busy:
+            busyUpdate = {name: b for name, b in busy.items() if b != self._info[name].busy}
+            for name, b in busyUpdate.items():
+                self._info[name].busy = b
+                if b is False:
+                    self._info[name].target = None
+            if busyUpdate:
+                self.busyStateChanged.emit(busyUpdate)
+        if alive:
+            aliveUpdate = {name: a for name, a in alive.items() if a != self._info[name].alive}
+            for name, a in aliveUpdate.items():
+                self._info[name].alive = a
+            if aliveUpdate:
+                self.aliveStateChanged.emit(aliveUpdate)
+        self._publish(values)
+
+    def _userValues(self, values):
+        """
+        Convert axis values reported by the device into the values emitted by ``valueChanged``.
+
+        The base implementation returns the values unchanged.
+
+        Args:
+            values (dict[str, float]): Axis values in device coordinates.
+
+        Returns:
+            dict[str, float]: Axis values in user coordinates.
+        """
+        return dict(values)
+
+    def set(self, wait=False, lock=True, queued=False, **kwargs):
         """
         Set target values for one or more axes.
 
         For each axis specified in ``kwargs``, set its target value, e.g., ``set(x=1.0, y=2.0)``.
         Optionally wait until all axes become idle after setting.
 
+        With ``queued=True``, the targets are handed to a per-controller worker thread and the call returns immediately.
+        Targets that are superseded before the worker applies them are dropped (the latest target per axis wins),
+        and all pending axes are applied with a single ``_set()`` call. This is intended for GUI input such as repeated jog clicks.
+
         Args:
             wait (bool, optional): If True, block until all axes become idle after setting. Defaults to False.
-            lock (bool, optional): If True, acquire the instance mutex while applying targets. Defaults to True.
+            lock (bool, optional): If True, acquire the instance mutex while applying targets. Ignored for queued targets, which are always applied with the mutex. Defaults to True.
+            queued (bool, optional): If True, apply the targets asynchronously via the command queue. Defaults to False.
             **kwargs: Axis-value pairs to set, e.g., x=1.0, y=2.0.
 
         Raises:
             ValueError: If any provided axis name is invalid.
         """
+        if queued:
+            self._validate(kwargs)
+            self._commands.put(kwargs)
+        else:
+            self._apply(lock=lock, **kwargs)
+
+        if wait:
+            if queued:
+                self._commands.flush()
+            self.waitForReady()
+
+    def _apply(self, lock=True, **kwargs):
+        """
+        Apply target values to axes immediately and wake the poller.
+
+        Args:
+            lock (bool, optional): If True, acquire the instance mutex while applying targets. Defaults to True.
+            **kwargs: Axis-value pairs to set.
+        """
         if lock:
             with QtCore.QMutexLocker(self._mutex):
                 self._set_impl(**kwargs)
         else:
             self._set_impl(**kwargs)
+        if not self.eventDriven:
+            self._wake()
 
-        if wait:
-            self.waitForReady()
+    def _validate(self, kwargs):
+        """
+        Check that all provided axis names are valid.
+
+        Args:
+            kwargs (dict[str, float]): Axis-value pairs.
+
+        Raises:
+            ValueError: If any provided axis name is invalid.
+        """
+        invalid = [name for name in kwargs if name not in self._info]
+        if invalid:
+            raise ValueError(f"Axis name(s) {invalid} not recognized. Available axes: {self.nameList}")
 
     def _set_impl(self, **kwargs):
         """
@@ -133,9 +510,7 @@ class MultiControllerInterface(HardwareInterface):
             ValueError: If any provided axis name is invalid.
         """
         # Validate axis names
-        invalid = [name for name in kwargs if name not in self._info]
-        if invalid:
-            raise ValueError(f"Axis name(s) {invalid} not recognized. Available axes: {self.nameList}")
+        self._validate(kwargs)
 
         # Update busy state for each axis in kwargs and emit busy state only for axes that are now busy
         updated = {name: True for name in kwargs if not self._info[name].busy}
@@ -144,16 +519,23 @@ class MultiControllerInterface(HardwareInterface):
             self._info[name].busy = True
         if len(updated) > 0:
             self.busyStateChanged.emit(updated)
+            self._publish()
 
         # Set actual values for the axes in kwargs
-        self._set(**kwargs)
+        self._coalescer.invalidate()
+        self._call("set", self._set, **kwargs)
 
-    def get(self, type=dict):
+    def get(self, type=dict, cached=False, maxAge=None):
         """
         Get the current values of all axes in the specified data type.
 
+        With ``cached=True``, values are taken from the latest ``snapshot`` without device I/O.
+        The device is read only if the snapshot holds no values yet or is older than ``maxAge``.
+
         Args:
             type (type, optional): Output type (`dict`, `list`, or `np.ndarray`). Defaults to `dict`.
+            cached (bool, optional): If True, return the values of the latest snapshot. Defaults to False.
+            maxAge (float | None, optional): Maximum age (in seconds) of cached values. Defaults to no limit.
 
         Returns:
             dict or list or np.ndarray: Axis values in the requested format.
@@ -161,7 +543,7 @@ class MultiControllerInterface(HardwareInterface):
         Raises:
             TypeError: If an unsupported output type is requested.
         """
-        valueDict = self._get()
+        valueDict = self._read(cached, maxAge)
         if type is dict:
             return valueDict
         elif type is list:
@@ -171,14 +553,50 @@ class MultiControllerInterface(HardwareInterface):
         else:
             raise TypeError("Unsupported type: {}".format(type))
 
+    def _read(self, cached=False, maxAge=None):
+        """
+        Read axis values in device coordinates from the snapshot or the device.
+
+        Args:
+            cached (bool, optional): If True, use the latest snapshot when possible. Defaults to False.
+            maxAge (float | None, optional): Maximum age (in seconds) of cached values. Defaults to no limit.
+
+        Returns:
+            dict[str, float]: Axis values in device coordinates.
+        """
+        if cached:
+            snap = self._snapshot
+            if len(snap.values) == len(self._info) and (maxAge is None or time.perf_counter() - snap.timestamp <= maxAge):
+                return dict(snap.values)
+        return self._coalescer.read(self._readDevice)
+
+    def _readDevice(self):
+        """
+        Read axis values from the device through ``_call()``.
+
+        Returns:
+            dict[str, float]: Axis values in device coordinates.
+        """
+        return self._call("get", self._get)
+
     def stop(self):
         """
         Stop all axes.
 
-        Call the instance-specific ``_stop()`` method to perform the actual stopping logic.
+        Discard queued targets and call the instance-specific ``_stop()`` method to perform the actual stopping logic.
         """
+        self._commands.clear()
+        self._coalescer.invalidate()
         self._stop()
 
+    def kill(self):
+        """
+        Stop background monitoring and the command queue of this controller.
+        """
+        self._commands.stop()
+        self._commands.wait()
+        super().kill()
+
     def waitForReady(self):
         """
         Block further interaction until all axes are idle.
@@ -189,28 +607,71 @@ class MultiControllerInterface(HardwareInterface):
         loop = QtCore.QEventLoop()
 
         def on_busy_changed():
-            if not any(self._isBusy().values()) and loop.isRunning():
+            if not self._anyBusy() and loop.isRunning():
                 loop.quit()
 
         with QtCore.QMutexLocker(self._mutex):
-            if any(self._isBusy().values()) is False:
+            if self._anyBusy() is False:
+                self._coalescer.invalidate()
                 return
             self.busyStateChanged.connect(on_busy_changed, QtCore.Qt.QueuedConnection)
         loop.exec_()
-        
+        # Reads shared before the axes stopped may hold intermediate positions
+        self._coalescer.invalidate()
+
+    async def setAsync(self, wait=True, **kwargs):
+        """
+        Set target values for one or more axes from an asyncio coroutine.
+
+        The target is applied in the default executor so that the event loop is not blocked by device latency.
+        Unlike ``set()``, this method waits for the axes to become idle by default, so that concurrent moves can be composed with ``asyncio.gather``,
+        e.g., ``await asyncio.gather(motor1.setAsync(x=1), motor2.setAsync(y=2))``.
+
+        Args:
+            wait (bool, optional): If True, wait until all axes become idle after setting. Defaults to True.
+            **kwargs: Axis-value pairs to set, e.g., x=1.0, y=2.0.
+
+        Raises:
+            ValueError: If any provided axis name is invalid.
+        """
+        await asyncio.get_running_loop().run_in_executor(None, functools.partial(self.set, **kwargs))
+        if wait:
+            await self.waitForReadyAsync()
+
+    async def waitForReadyAsync(self):
+        """
+        Wait from an asyncio coroutine until all axes are idle.
+
+        Unlike ``waitForReady()``, this method does not spin a nested Qt event loop; it works with any running asyncio event loop.
+        The busy state is taken from the per-axis state updated by the poller, so the event loop never blocks on the mutex or on device I/O.
+        """
+        def idle(*args):
+            return not any(info.busy for info in self._info.values())
+        waiter = _SignalWaiter(self.busyStateChanged, idle)
+        if idle():
+            waiter.resolve()
+        await waiter.wait()
+
     @property
     def isBusy(self):
         """
         Current busy state of all axes.
 
+        The device is queried unless the instance mutex stays held by another thread (e.g., the poller waiting for slow device I/O) for longer than ``interval``;
+        in that case the busy state of the latest ``snapshot`` is returned instead of waiting further.
+
         Returns:
             dict[str, bool]: Mapping of axis names to their busy state.
 
         Raises:
             RuntimeError: If the device is not responding or a communication error occurs.
         """
-        with QtCore.QMutexLocker(self._mutex):
-            return self._isBusy()
+        if not self._mutex.tryLock(max(1, int(self.interval * 1000))):
+            return dict(self._snapshot.busy)
+        try:
+            return self._call("isBusy", self._isBusy)
+        finally:
+            self._mutex.unlock()
 
     @property
     def isAlive(self):
@@ -242,6 +703,21 @@ class MultiControllerInterface(HardwareInterface):
         """
         return {name: info.target for name, info in self._info.items() if info.target is not None}
 
+    @property
+    def pendingTarget(self):
+        """
+        Latest requested target of each moving or queued axis, in the coordinates used by ``get()`` and ``set()``.
+
+        Queued targets (see ``set(queued=True)``) override targets already sent to the device.
+        This allows relative moves, such as repeated jog steps, to accumulate before the device has moved.
+
+        Returns:
+            dict[str, float]: Mapping of axis names to their latest requested target values.
+        """
+        targets = {name: info.target for name, info in self._info.items() if info.target is not None}
+        targets.update(self._commands.pending)
+        return self._userValues(targets)
+
     def settingsWidget(self):
         """
         Return a device-specific settings dialog.
@@ -254,6 +730,47 @@ class MultiControllerInterface(HardwareInterface):
         """
         return None
 
+    def _onTimeout(self, kind):
+        """
+        Mark all axes as not alive after a device call timed out.
+
+        This method does not take the instance mutex, since the timed-out call may have been made by a thread holding it
+        while another thread waits for the mutex. The alive flags are plain attributes and the snapshot is replaced atomically.
+
+        Args:
+            kind (str): Kind of the call that timed out.
+        """
+        aliveUpdate = {name: False for name, info in self._info.items() if info.alive}
+        for name in aliveUpdate:
+            self._info[name].alive = False
+        if aliveUpdate:
+            self.aliveStateChanged.emit(aliveUpdate)
+        self._publish()
+
+    def _anyBusy(self):
+        """
+        Return whether any axis is busy.
+
+        Event-driven controllers use the state reported by ``_notify()``; others query the device.
+
+        Returns:
+            bool: True if any axis is busy.
+        """
+        if self.eventDriven:
+            return any(info.busy for info in self._info.values())
+        return any(self._call("isBusy", self._isBusy).values())
+
+    def _isActive(self):
+        """
+        Return whether any axis is busy, so that the device is polled at the fast rate while moving.
+
+        Event-driven controllers are never active, so that polling stays at the watchdog rate.
+
+        Returns:
+            bool: True if any axis is busy.
+        """
+        return not self.eventDriven and any(info.busy for info in self._info.values())
+
     def _isBusy(self):
         """
         Should be implemented in subclasses to provide device-specific logic for determining busy state.
@@ -396,6 +913,18 @@ class OffsettableMultiMotorInterface(MultiControllerInterface):
             self.offsetChanged.connect(self.save)
         self.offsetChanged.connect(lambda: self.valueChanged.emit(self.get()))
 
+    def _userValues(self, values):
+        """
+        Subtract stored offsets from axis values reported by the device.
+
+        Args:
+            values (dict[str, float]): Axis values in device coordinates.
+
+        Returns:
+            dict[str, float]: Axis values in user coordinates.
+        """
+        return {key: value - self.offset.get(key, 0) for key, value in values.items()}
+
     def _valueChanged(self):
         """
         Notify listeners that current axis values changed (offsets applied).
@@ -404,7 +933,7 @@ class OffsettableMultiMotorInterface(MultiControllerInterface):
         """
         self.valueChanged.emit(self.get())
 
-    def set(self, **kwargs):
+    def set(self, wait=False, lock=True, queued=False, **kwargs):
         """
         Set target values for axes in user coordinates (stored offsets subtracted).
 
@@ -412,20 +941,25 @@ class OffsettableMultiMotorInterface(MultiControllerInterface):
         For example, calling ``set(x=1.0)`` will result in the value ``1.0 + self.offset.get('x', 0)`` being sent to the underlying controller.
 
         Args:
+            wait (bool, optional): If True, block until all axes become idle after setting. Defaults to False.
+            lock (bool, optional): If True, acquire the instance mutex while applying targets. Defaults to True.
+            queued (bool, optional): If True, apply the targets asynchronously via the command queue. Defaults to False.
             **kwargs (float): Axis-value pairs in user coordinates.
 
         Returns:
             None
         """
         kwargs = {key: value + self.offset.get(key, 0) for key, value in kwargs.items()}
-        super().set(**kwargs)
+        super().set(wait=wait, lock=lock, queued=queued, **kwargs)
 
-    def get(self, type=dict):
+    def get(self, type=dict, cached=False, maxAge=None):
         """
         Get current axis values in user coordinates (stored offsets subtracted).
 
         Args:
             type (type, optional): Output container type (dict, list, np.ndarray). Defaults to dict.
+            cached (bool, optional): If True, return the values of the latest snapshot without device I/O when possible. Defaults to False.
+            maxAge (float | None, optional): Maximum age (in seconds) of cached values. Defaults to no limit.
 
         Returns:
             dict | list | np.ndarray: Axis values in user coordinates (stored offsets subtracted).
@@ -433,7 +967,7 @@ class OffsettableMultiMotorInterface(MultiControllerInterface):
         Raises:
             TypeError: If an unsupported output type is requested.
         """
-        valueDict = {key: value - self.offset.get(key, 0) for key, value in super().get().items()}
+        valueDict = self._userValues(self._read(cached, maxAge))
         if type is dict:
             return valueDict
         elif type is list:
@@ -488,6 +1022,63 @@ class MultiMotorInterface(OffsettableMultiMotorInterface):
     """
     Multi-axis motor interface.
 
-    Thin subclass of OffsettableMultiMotorInterface kept for semantic clarity and for future device-specific extensions.
+    Thin subclass of OffsettableMultiMotorInterface kept for semantic clarity and for device-specific extensions.
+    Motors whose axis speed can be changed, e.g., for fly scans, implement ``_getSpeed()`` and ``_setSpeed()``.
     """
-    pass
+
+    @property
+    def speed(self):
+        """
+        Motion speed of each axis.
+
+        Returns:
+            dict[str, float]: Mapping of axis names to speeds (units per second).
+
+        Raises:
+            NotImplementedError: If the motor does not support speed control.
+        """
+        return self._call("getSpeed", self._getSpeed)
+
+    def setSpeed(self, **speeds):
+        """
+        Set the motion speed of axes.
+
+        The new speed applies to the next move of each axis.
+
+        Args:
+            **speeds (float): Axis-speed pairs (units per second).
+
+        Raises:
+            ValueError: If an axis name is not recognized or a speed is not positive.
+            NotImplementedError: If the motor does not support speed control.
+        """
+        for name, value in speeds.items():
+            if name not in self.nameList:
+                raise ValueError(f"Axis {name} is not recognized.")
+            if not value > 0:
+                raise ValueError(f"Speed of axis {name} must be positive, got {value}.")
+        self._call("setSpeed", self._setSpeed, **speeds)
+
+    def _getSpeed(self):
+        """
+        Get the motion speed of all axes from the device.
+
+        Returns:
+            dict[str, float]: Mapping of axis names to speeds.
+
+        Raises:
+            NotImplementedError: If the subclass does not support speed control.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support speed control.")
+
+    def _setSpeed(self, **speeds):
+        """
+        Set the motion speed of the given axes on the device.
+
+        Args:
+            **speeds (float): Axis-speed pairs.
+
+        Raises:
+            NotImplementedError: If the subclass does not support speed control.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support speed control.")
@@ -1,7 +1,8 @@
 import logging
+import numpy as np
 
 from lys.Qt import QtCore
-from .Interfaces import HardwareInterface
+from .Interfaces import HardwareInterface, DeviceTimeoutError, _SignalWaiter
 
 
 class _AcqThread(QtCore.QThread):
@@ -9,22 +10,30 @@ class _AcqThread(QtCore.QThread):
     Acquisition thread for ``DetectorInterface``.
 
     Runs the detector's acquisition loop as a worker thread and emits signals when new data is acquired.
+    If the detector has a ``decoder``, raw frames are decoded in its process pool and emitted in acquisition order.
+    If an output array is given, acquired frames are also written into it directly in the acquisition thread.
     """
 
     #: Signal (dict) emitted when new data is acquired.
     dataAcquired = QtCore.pyqtSignal(dict)
 
-    def __init__(self, detector, iter=1):
+    def __init__(self, detector, iter=1, out=None):
         """
         Initialize the acquisition thread for a detector.
 
         Args:
             detector (DetectorInterface): The detector instance to run acquisition for.
             iter (int, optional): Number of acquisition iterations for this thread. Defaults to 1.
+            out (np.ndarray | None, optional): Preallocated array of shape ``dataShape`` filled with acquired frames. Defaults to None.
         """
         super().__init__()
         self._detector = detector
-        self._detector.updated.connect(self._onUpdated)
+        self._decoder = detector.decoder
+        self._out = out
+        if self._decoder is None and self._out is None:
+            self._detector.updated.connect(self._onUpdated)
+        else:
+            self._detector.updated.connect(self._onUpdated, type=QtCore.Qt.DirectConnection)
         self._iteration = iter
 
     def run(self, *args, **kwargs):
@@ -35,14 +44,45 @@ class _AcqThread(QtCore.QThread):
         """
         self._detector._run(self._iteration)
         self._onUpdated()
+        if self._decoder is not None or self._out is not None:
+            self._detector.updated.disconnect(self._onUpdated)
+        if self._decoder is not None:
+            try:
+                self._emit(self._decoder.collect(wait=True))
+            finally:
+                # Frames of this acquisition must not leak into the next one
+                self._decoder.reset()
 
     def _onUpdated(self):
         """
         Emit the ``dataAcquired`` signal with the latest acquired data.
 
         Called in response to the detector's ``updated`` signal.
+        With a decoder, the raw frames are submitted for decoding and the frames decoded so far are emitted.
+        Frames that fail to decode are logged and dropped by the decoder, so the other frames of the batch are still delivered.
         """
-        self.dataAcquired.emit(self._detector._get())
+        data = self._detector._get()
+        if self._decoder is not None:
+            for idx, raw in data.items():
+                try:
+                    self._decoder.submit(idx, raw)
+                except Exception as e:
+                    # Exceptions must not escape a directly connected slot
+                    logging.warning(f"Error while submitting frame {idx} for decoding: {e}")
+            data = self._decoder.collect()
+        self._emit(data)
+
+    def _emit(self, data):
+        """
+        Write frames into the output array, if any, and emit the ``dataAcquired`` signal.
+
+        Args:
+            data (dict[tuple, np.ndarray]): Mapping of index tuples to frames.
+        """
+        if self._out is not None:
+            for idx, frame in data.items():
+                self._out[idx] = frame
+        self.dataAcquired.emit(data)
 
 
 class DetectorInterface(HardwareInterface):
@@ -54,6 +94,9 @@ class DetectorInterface(HardwareInterface):
     ``_get()`` and ``_stop()`` should raise ``RuntimeError`` if the device is not responding or a communication error occurs.
     ``_isAlive()`` should always return the current alive state and should not raise ``RuntimeError`` that interrupts monitoring.
     The ``updated`` signal is emitted by the acquisition thread when new data is available.
+
+    Detectors that deliver compressed or packed frames can set a ``decoder`` (``FrameDecoder``).
+    ``_get()`` then returns raw frames, which are decoded in a process pool before ``dataAcquired`` is emitted.
     """
 
     #: Signal (bool) emitted when alive state changes.
@@ -71,16 +114,18 @@ class DetectorInterface(HardwareInterface):
     #: Signal emitted when acquisition is stopped.
     stopped = QtCore.pyqtSignal()
 
-    def __init__(self, exposure=1, **kwargs):
+    def __init__(self, exposure=1, decoder=None, **kwargs):
         """
         Initialize the interface.
 
         Args:
             exposure (float or None): Initial exposure time.
+            decoder (FrameDecoder | None): Optional decoder applied to raw frames returned by ``_get()``.
             **kwargs: Additional keyword arguments passed to the base class.
         """
         super().__init__(**kwargs)
         self._exposure = exposure
+        self._decoder = decoder
         self._mutex = QtCore.QMutex()
         self._busy = False
 
@@ -93,47 +138,101 @@ class DetectorInterface(HardwareInterface):
         if not hasattr(self, "_alive"):
             self._alive = True
 
-        al = self._isAlive()
+        try:
+            al = self._call("isAlive", self._isAlive)
+        except DeviceTimeoutError as e:
+            logging.warning(f"Device timeout in _loadState: {e}")
+            al = False
         if self._alive != al:
             self._alive = al
             self.aliveStateChanged.emit(al)
 
-    def startAcq(self, iter=1, wait=False, output=False):
+    def startAcq(self, iter=1, wait=False, output=False, dtype=None):
         """
         Start acquisition in an acquisition thread.
 
         If both `wait` and `output` are True, the method blocks until acquisition completes and returns the acquired data.
+        With ``output="array"``, frames are written directly into a preallocated array of shape ``dataShape`` in the acquisition thread,
+        which avoids building a dictionary entry per frame when many small frames are acquired from scripts.
+        The array has the data type ``dtype``, e.g., ``np.uint16`` to keep raw counts compact.
+        Frames that are not acquired remain NaN in floating-point arrays and zero otherwise.
+        This mode requires ``wait=True`` and a detector that defines ``dataShape`` (``MultiDetectorInterface``).
 
         Args:
             iter (int): Number of iterations.
             wait (bool, optional): If True, blocks until acquisition is complete. Defaults to False.
-            output (bool, optional): If True, returns acquired data as a dictionary. Defaults to False.
+            output (bool | str, optional): If True, returns acquired data as a dictionary. If "array", returns a stacked array and its axes. Defaults to False.
+            dtype (data-type | None, optional): Data type of the stacked array. Defaults to the data type of the decoder, if any, or float.
 
         Returns:
-            dict[tuple, np.ndarray] | None: Acquired data that maps index tuples to frames when ``output`` is True; otherwise ``None``.
+            dict[tuple, np.ndarray] | tuple[np.ndarray, list[np.ndarray]] | None: Acquired data that maps index tuples to frames when ``output`` is True,
+            the stacked data and its axes when ``output`` is "array"; otherwise ``None``.
+
+        Raises:
+            ValueError: If ``output`` is an unsupported string, or "array" without ``wait``.
+            TypeError: If ``output`` is "array" and the detector does not define ``dataShape``.
         """
+        if isinstance(output, str) and output != "array":
+            raise ValueError(f"Unsupported output mode: {output}")
+        if output == "array" and not wait:
+            raise ValueError("output='array' requires wait=True. Use acquireAsync() to acquire into an array without blocking.")
+
         if self._busy:
             logging.warning("Detector is busy. Cannot start new acquisition.")
             return
 
+        stacked = wait and output == "array"
+        out = self._outputBuffer(dtype) if stacked else None
+        buffer = {} if wait and output and not stacked else None
+        self._start(iter, out, buffer)
+
+        if wait:
+            self.waitForReady()
+            if stacked:
+                return out, self.axes
+            if output:
+                return buffer
+
+    def _start(self, iter, out=None, buffer=None):
+        """
+        Mark the detector busy and start the acquisition thread.
+
+        Args:
+            iter (int): Number of iterations.
+            out (np.ndarray | None, optional): Preallocated array filled with acquired frames in the acquisition thread. Defaults to None.
+            buffer (dict | None, optional): Dictionary updated with acquired frames in the acquisition thread. Defaults to None.
+        """
         self._busy = True
         self.busyStateChanged.emit(True)
 
-        self._thread = _AcqThread(self, iter=iter)
+        self._thread = _AcqThread(self, iter=iter, out=out)
         self._thread.dataAcquired.connect(self.dataAcquired.emit, type=QtCore.Qt.DirectConnection)
         self._thread.finished.connect(self._onAcqFinished, type=QtCore.Qt.DirectConnection)
-        if wait and output:
-            buffer = {}
+        if buffer is not None:
             self._thread.dataAcquired.connect(buffer.update, type=QtCore.Qt.DirectConnection)
-
-        thread = self._thread
         self._thread.start()
 
-        if wait:
-            self.waitForReady()
-            if output:
-                thread.dataAcquired.disconnect(buffer.update)
-                return buffer
+    def _outputBuffer(self, dtype=None):
+        """
+        Allocate the stacked output array for ``output="array"``.
+
+        Args:
+            dtype (data-type | None, optional): Data type of the array. Defaults to the data type of the decoder, if any, or float.
+
+        Returns:
+            np.ndarray: Array of shape ``dataShape``, NaN-filled for floating-point types and zero-filled otherwise.
+
+        Raises:
+            TypeError: If the detector does not define ``dataShape``.
+        """
+        if not hasattr(self, "dataShape"):
+            raise TypeError(f"{type(self).__name__} does not define dataShape required for output='array'.")
+        if dtype is None:
+            dtype = self._decoder.dtype if self._decoder is not None else float
+        dtype = np.dtype(dtype)
+        if dtype.kind in "fc":
+            return np.full(self.dataShape, np.nan, dtype=dtype)
+        return np.zeros(self.dataShape, dtype=dtype)
 
     def _onAcqFinished(self):
         """
@@ -165,6 +264,52 @@ class DetectorInterface(HardwareInterface):
             self.busyStateChanged.connect(on_busy_changed, QtCore.Qt.QueuedConnection)
         loop.exec_()
 
+    async def acquireAsync(self, iter=1, output=False, dtype=None):
+        """
+        Run an acquisition from an asyncio coroutine.
+
+        The acquisition runs in the acquisition thread as with ``startAcq()``; the coroutine completes when the detector is no longer busy.
+        Acquisitions on several detectors can be overlapped with ``asyncio.gather``.
+
+        Args:
+            iter (int): Number of iterations.
+            output (bool | str, optional): If True, returns acquired data as a dictionary. If "array", returns a stacked array and its axes. Defaults to False.
+            dtype (data-type | None, optional): Data type of the stacked array. Defaults to the data type of the decoder, if any, or float.
+
+        Returns:
+            dict[tuple, np.ndarray] | tuple[np.ndarray, list[np.ndarray]] | None: Acquired data in the requested format, or ``None``.
+
+        Raises:
+            ValueError: If ``output`` is an unsupported string.
+        """
+        if isinstance(output, str) and output != "array":
+            raise ValueError(f"Unsupported output mode: {output}")
+        if self._busy:
+            logging.warning("Detector is busy. Cannot start new acquisition.")
+            return
+
+        out = self._outputBuffer(dtype) if output == "array" else None
+        buffer = {} if output and out is None else None
+        waiter = _SignalWaiter(self.busyStateChanged, lambda busy: not busy)
+        self._start(iter, out, buffer)
+        await waiter.wait()
+
+        if out is not None:
+            return out, self.axes
+        return buffer
+
+    async def waitForReadyAsync(self):
+        """
+        Wait from an asyncio coroutine until the device is no longer busy.
+
+        Unlike ``waitForReady()``, this method does not spin a nested Qt event loop; it works with any running asyncio event loop.
+        """
+        waiter = _SignalWaiter(self.busyStateChanged, lambda busy: not busy)
+        with QtCore.QMutexLocker(self._mutex):
+            if self._busy is False:
+                waiter.resolve()
+        await waiter.wait()
+
     def stop(self):
         """
         Stop the acquisition and emit the latest acquired data.
@@ -176,9 +321,26 @@ class DetectorInterface(HardwareInterface):
         if self._thread is not None and self._thread.isRunning():
             self._thread.quit()
             self._thread.wait()
-        self.dataAcquired.emit(self._get())
+        data = self._get()
+        if self._decoder is not None:
+            # Release the worker processes and shared memory; they are recreated on the next acquisition.
+            self._decoder.close()
+            try:
+                data = {idx: self._decoder.decode(raw) for idx, raw in data.items()}
+            except Exception as e:
+                logging.warning(f"Error while decoding frames: {e}")
+                data = {}
+        self.dataAcquired.emit(data)
         self.stopped.emit()
 
+    def kill(self):
+        """
+        Stop background monitoring and release the worker processes and shared memory of the decoder, if any.
+        """
+        if self._decoder is not None:
+            self._decoder.close()
+        super().kill()
+
     @property
     def exposure(self):
         """
@@ -199,6 +361,28 @@ class DetectorInterface(HardwareInterface):
         """
         self._exposure = value
 
+    @property
+    def decoder(self):
+        """
+        Decoder applied to raw frames.
+
+        Returns:
+            FrameDecoder | None: The decoder, or ``None`` if ``_get()`` returns decoded frames.
+        """
+        return self._decoder
+
+    @decoder.setter
+    def decoder(self, value):
+        """
+        Set the decoder applied to raw frames.
+
+        The new decoder takes effect from the next acquisition.
+
+        Args:
+            value (FrameDecoder | None): Decoder to set, or ``None`` to disable decoding.
+        """
+        self._decoder = value
+
     @property
     def isBusy(self):
         """
@@ -223,6 +407,26 @@ class DetectorInterface(HardwareInterface):
         """
         return self._isAlive()
 
+    def _onTimeout(self, kind):
+        """
+        Mark the detector as not alive after a device call timed out.
+
+        Args:
+            kind (str): Kind of the call that timed out.
+        """
+        if getattr(self, "_alive", True):
+            self._alive = False
+            self.aliveStateChanged.emit(False)
+
+    def _isActive(self):
+        """
+        Return whether an acquisition is running, so that the device is polled at the fast rate during acquisition.
+
+        Returns:
+            bool: True if the detector is acquiring.
+        """
+        return self._busy
+
     def _get(self):
         """
         Should be implemented in subclasses to provide device-specific logic for getting acquired data.
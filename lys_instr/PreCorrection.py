@@ -72,7 +72,12 @@ class PreCorrector(QtCore.QObject):
 
             # set y if any arg is busy
             if flg:
-                params = {arg: self._controllers[arg].get()[arg] for arg in f.argNames() if arg not in busy}
+                values = {}
+                for arg in f.argNames():
+                    c = self._controllers[arg]
+                    if arg not in busy and c not in values:
+                        values[c] = c.get()
+                params = {arg: values[self._controllers[arg]][arg] for arg in f.argNames() if arg not in busy}
                 params.update({arg: self._controllers[arg].target[arg] for arg in f.argNames() if arg in busy})
                 self._controllers[y].set(**{y: f(**params)}, lock=False)
 
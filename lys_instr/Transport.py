@@ -0,0 +1,646 @@
+import collections
+import concurrent.futures
+import logging
+import socket
+import threading
+import time
+
+
+class Transport:
+    """
+    Abstract byte-stream link to one or more devices (e.g., a serial line or a TCP socket).
+
+    Requests and responses are messages terminated by ``terminator``.
+    Subclasses must implement ``_open()``, ``_close()``, ``_write()`` and ``_read()``.
+    Transports are usually not used directly by devices but shared through a ``RequestMultiplexer``.
+    """
+
+    def __init__(self, terminator=b"\n"):
+        """
+        Initialize the transport.
+
+        Args:
+            terminator (bytes, optional): Message terminator. Defaults to b"\\n".
+        """
+        self._terminator = terminator
+        self._buffer = b""
+        self._isOpen = False
+
+    @property
+    def terminator(self):
+        """
+        Message terminator.
+
+        Returns:
+            bytes: Terminator appended to requests and expected at the end of responses.
+        """
+        return self._terminator
+
+    @property
+    def isOpen(self):
+        """
+        Whether the link is open.
+
+        Returns:
+            bool: True if ``open()`` has been called and ``close()`` has not.
+        """
+        return self._isOpen
+
+    def open(self):
+        """
+        Open the link if it is not open yet.
+        """
+        if not self._isOpen:
+            self._open()
+            self._isOpen = True
+
+    def close(self):
+        """
+        Close the link if it is open.
+        """
+        if self._isOpen:
+            self._isOpen = False
+            self._close()
+
+    def writeMessage(self, message):
+        """
+        Write a message followed by the terminator.
+
+        Args:
+            message (bytes): Message without terminator.
+        """
+        self._write(message + self._terminator)
+
+    def readMessage(self):
+        """
+        Read a single message, blocking until its terminator arrives.
+
+        Returns:
+            bytes: Message without terminator.
+
+        Raises:
+            ConnectionError: If the link is closed while reading.
+        """
+        while self._terminator not in self._buffer:
+            chunk = self._read()
+            if not chunk:
+                raise ConnectionError("Transport closed.")
+            self._buffer += chunk
+        message, self._buffer = self._buffer.split(self._terminator, 1)
+        return message
+
+    def _open(self):
+        """
+        Should be implemented in subclasses to open the link.
+
+        Raises:
+            NotImplementedError: If the subclass does not implement this method.
+        """
+        raise NotImplementedError("Subclasses must implement this method.")
+
+    def _close(self):
+        """
+        Should be implemented in subclasses to close the link.
+
+        Raises:
+            NotImplementedError: If the subclass does not implement this method.
+        """
+        raise NotImplementedError("Subclasses must implement this method.")
+
+    def _write(self, data):
+        """
+        Should be implemented in subclasses to write raw bytes.
+
+        Args:
+            data (bytes): Bytes to write.
+
+        Raises:
+            NotImplementedError: If the subclass does not implement this method.
+        """
+        raise NotImplementedError("Subclasses must implement this method.")
+
+    def _read(self):
+        """
+        Should be implemented in subclasses to read available bytes, blocking until at least one byte is available.
+
+        Returns:
+            bytes: Bytes read, or an empty bytes object if the link was closed.
+
+        Raises:
+            NotImplementedError: If the subclass does not implement this method.
+        """
+        raise NotImplementedError("Subclasses must implement this method.")
+
+
+class TCPTransport(Transport):
+    """
+    Transport over a TCP socket, e.g., for Ethernet controllers or serial-to-Ethernet converters.
+    """
+
+    def __init__(self, host, port, timeout=5, **kwargs):
+        """
+        Initialize the transport.
+
+        Args:
+            host (str): Host name or address.
+            port (int): Port number.
+            timeout (float, optional): Timeout (in seconds) for connecting. Defaults to 5.
+            **kwargs: Additional keyword arguments passed to ``Transport``.
+        """
+        super().__init__(**kwargs)
+        self._address = (host, port)
+        self._timeout = timeout
+        self._socket = None
+
+    def _open(self):
+        """
+        Connect to the remote host.
+        """
+        self._socket = socket.create_connection(self._address, timeout=self._timeout)
+        self._socket.settimeout(None)
+        self._socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def _close(self):
+        """
+        Close the socket.
+        """
+        try:
+            self._socket.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass
+        self._socket.close()
+
+    def _write(self, data):
+        """
+        Send raw bytes.
+
+        Args:
+            data (bytes): Bytes to send.
+        """
+        self._socket.sendall(data)
+
+    def _read(self):
+        """
+        Receive available bytes.
+
+        Returns:
+            bytes: Bytes received, or an empty bytes object if the connection was closed.
+        """
+        try:
+            return self._socket.recv(4096)
+        except OSError:
+            return b""
+
+
+class LoopbackTransport(Transport):
+    """
+    In-process transport that answers requests with a handler function, for tests and dummy devices.
+
+    Each request is answered ``latency`` seconds after it was written.
+    Latencies of pipelined requests overlap, as for a real device that processes queries while the previous responses are in transit.
+    """
+
+    def __init__(self, handler, latency=0, **kwargs):
+        """
+        Initialize the transport.
+
+        Args:
+            handler (callable): Function mapping a request (bytes, without terminator) to a response (bytes, without terminator), or to None for requests without response.
+            latency (float, optional): Round-trip time (in seconds) of each request. Defaults to 0.
+            **kwargs: Additional keyword arguments passed to ``Transport``.
+        """
+        super().__init__(**kwargs)
+        self._handler = handler
+        self._latency = latency
+        self._cond = threading.Condition()
+        self._responses = collections.deque()
+        self._pending = b""
+
+    def _open(self):
+        """
+        Reset the loopback buffers.
+        """
+        with self._cond:
+            self._responses.clear()
+            self._pending = b""
+
+    def _close(self):
+        """
+        Wake up pending readers.
+        """
+        with self._cond:
+            self._cond.notify_all()
+
+    def _write(self, data):
+        """
+        Pass complete requests to the handler and schedule their responses.
+
+        Args:
+            data (bytes): Bytes written to the device.
+        """
+        self._pending += data
+        while self._terminator in self._pending:
+            request, self._pending = self._pending.split(self._terminator, 1)
+            response = self._handler(request)
+            if response is not None:
+                with self._cond:
+                    self._responses.append((time.perf_counter() + self._latency, response + self._terminator))
+                    self._cond.notify_all()
+
+    def _read(self):
+        """
+        Return the next response when it is due.
+
+        Returns:
+            bytes: Response bytes, or an empty bytes object if the transport was closed.
+        """
+        with self._cond:
+            while not self._responses:
+                if not self._isOpen:
+                    return b""
+                self._cond.wait()
+            due, data = self._responses[0]
+        remaining = due - time.perf_counter()
+        if remaining > 0:
+            time.sleep(remaining)
+        with self._cond:
+            self._responses.popleft()
+        return data
+
+
+class _Request:
+    """
+    Request waiting to be written to the transport.
+    """
+
+    def __init__(self, message, reply):
+        """
+        Initialize the request.
+
+        Args:
+            message (bytes): Request message without terminator.
+            reply (bool): Whether a response is expected.
+        """
+        self.message = message
+        self.reply = reply
+        self.sent = None
+        self.future = concurrent.futures.Future()
+
+    def resolve(self, response=None, error=None):
+        """
+        Resolve the future unless it is already done (e.g., cancelled by a timed-out caller).
+
+        Args:
+            response (bytes | None, optional): Response to set. Defaults to None.
+            error (Exception | None, optional): Exception to set instead of a response. Defaults to None.
+        """
+        try:
+            if error is None:
+                self.future.set_result(response)
+            else:
+                self.future.set_exception(error)
+        except concurrent.futures.InvalidStateError:
+            pass
+
+
+class RequestMultiplexer:
+    """
+    Request/response queue sharing one transport between several devices.
+
+    Each device obtains its own channel with ``channel()``. Requests from different channels are written in round-robin order,
+    so that a device issuing many queries (e.g., fast polling while moving) cannot starve the others.
+    Up to ``depth`` requests are written before their responses arrive (pipelining), which hides the round-trip latency of independent queries.
+
+    By default, responses are matched to requests in order, so the device(s) on the link must answer in the order of the requests.
+    If a response is lost, every later response would be handed to the wrong request. To recover from this, pass ``match`` for protocols whose
+    responses echo the request (e.g., the command and the axis name): a response is then given to the oldest outstanding request it matches,
+    outstanding requests before it are failed as lost, and responses that match no request (e.g., late responses to expired requests) are discarded.
+    With ``timeout``, the oldest outstanding request is failed when its response does not arrive in time, which frees its pipelining slot.
+    Without ``match``, a response that arrives after its request expired is still taken as the response to the next request.
+
+    Multiplexers for the same link are shared through ``shared()``, which acts as a connection pool keyed by the link address.
+    """
+
+    _pool = {}
+    _poolLock = threading.Lock()
+
+    def __init__(self, transport, depth=4, timeout=None, match=None):
+        """
+        Initialize the multiplexer and open the transport.
+
+        Args:
+            transport (Transport): Link shared by all channels.
+            depth (int, optional): Maximum number of requests awaiting responses. Use 1 for devices that do not accept pipelined queries. Defaults to 4.
+            timeout (float | None, optional): Time (in seconds) after which an outstanding request is failed with ``TimeoutError``. Defaults to no limit.
+            match (callable | None, optional): Function ``match(request, response)`` of the two messages (bytes, without terminator) returning True if the response answers the request. Defaults to matching in order.
+        """
+        self._transport = transport
+        self._depth = max(1, int(depth))
+        self._timeout = timeout
+        self._match = match
+        self._cond = threading.Condition()
+        self._queues = collections.OrderedDict()
+        self._inflight = collections.deque()
+        self._closed = False
+        self._refs = 0
+        self._key = None
+        self._transport.open()
+        self._writer = threading.Thread(target=self._writeLoop, name="lys_instr transport writer", daemon=True)
+        self._reader = threading.Thread(target=self._readLoop, name="lys_instr transport reader", daemon=True)
+        self._writer.start()
+        self._reader.start()
+
+    @classmethod
+    def shared(cls, key, factory, **kwargs):
+        """
+        Return the multiplexer for a link, creating it on first use.
+
+        Each call must be paired with a ``release()``; the link is closed when the last user releases it.
+
+        Args:
+            key (hashable): Link identifier, e.g., ("tcp", host, port) or a serial port name.
+            factory (callable): Function creating the ``Transport`` when the link is not open yet.
+            **kwargs: Keyword arguments (``depth``, ``timeout``, ``match``) used when the multiplexer is created.
+
+        Returns:
+            RequestMultiplexer: The shared multiplexer.
+        """
+        with cls._poolLock:
+            mux = cls._pool.get(key)
+            if mux is None:
+                mux = cls._pool[key] = cls(factory(), **kwargs)
+                mux._key = key
+            mux._refs += 1
+            return mux
+
+    def release(self):
+        """
+        Release a multiplexer obtained with ``shared()``, closing it when no user is left.
+        """
+        with RequestMultiplexer._poolLock:
+            self._refs -= 1
+            if self._refs > 0:
+                return
+            RequestMultiplexer._pool.pop(self._key, None)
+        self.close()
+
+    @property
+    def transport(self):
+        """
+        Underlying transport.
+
+        Returns:
+            Transport: Link shared by all channels.
+        """
+        return self._transport
+
+    def channel(self, name):
+        """
+        Return a channel through which a device sends its requests.
+
+        Args:
+            name (str): Channel name, typically the device name. Requests of the same channel are written in order.
+
+        Returns:
+            _Channel: Channel for the device.
+        """
+        return _Channel(self, name)
+
+    def _submit(self, name, message, reply):
+        """
+        Queue a request of a channel.
+
+        Args:
+            name (str): Channel name.
+            message (bytes): Request message without terminator.
+            reply (bool): Whether a response is expected.
+
+        Returns:
+            concurrent.futures.Future: Future resolved with the response (bytes), or with None for requests without response.
+
+        Raises:
+            ConnectionError: If the multiplexer is closed.
+        """
+        request = _Request(message, reply)
+        with self._cond:
+            if self._closed:
+                raise ConnectionError("Transport closed.")
+            self._queues.setdefault(name, collections.deque()).append(request)
+            self._cond.notify_all()
+        return request.future
+
+    def _next(self):
+        """
+        Pop the next request in round-robin order over channels. Must be called with the condition held.
+
+        Requests cancelled by their callers before being written are dropped.
+
+        Returns:
+            _Request | None: Next request, or None if all queues are empty.
+        """
+        for name in list(self._queues):
+            queue = self._queues[name]
+            self._queues.move_to_end(name)
+            while queue:
+                request = queue.popleft()
+                if request.future.set_running_or_notify_cancel():
+                    return request
+            del self._queues[name]
+        return None
+
+    def _writeLoop(self):
+        """
+        Write queued requests while fewer than ``depth`` responses are outstanding, and expire requests whose responses are overdue.
+        """
+        while True:
+            with self._cond:
+                while True:
+                    expired = self._expire()
+                    if self._closed or expired or (len(self._inflight) < self._depth and any(self._queues.values())):
+                        break
+                    self._cond.wait(self._nextDeadline())
+                if self._closed:
+                    return
+                request = None
+                if len(self._inflight) < self._depth:
+                    request = self._next()
+                if request is not None and request.reply:
+                    request.sent = time.perf_counter()
+                    self._inflight.append(request)
+            for r in expired:
+                r.resolve(error=TimeoutError(f"No response to {r.message!r} within {self._timeout} s."))
+            if request is None:
+                continue
+            try:
+                self._transport.writeMessage(request.message)
+            except Exception as e:
+                self._fail(e)
+                return
+            if not request.reply:
+                request.resolve()
+
+    def _expire(self):
+        """
+        Remove outstanding requests that have waited longer than ``timeout``. Must be called with the condition held.
+
+        Returns:
+            list[_Request]: Expired requests, to be failed by the caller.
+        """
+        expired = []
+        if self._timeout is not None:
+            now = time.perf_counter()
+            while self._inflight and now - self._inflight[0].sent >= self._timeout:
+                expired.append(self._inflight.popleft())
+        return expired
+
+    def _nextDeadline(self):
+        """
+        Time until the oldest outstanding request expires. Must be called with the condition held.
+
+        Returns:
+            float | None: Time (in seconds) to wait, or None to wait without limit.
+        """
+        if self._timeout is None or not self._inflight:
+            return None
+        return max(0, self._inflight[0].sent + self._timeout - time.perf_counter())
+
+    def _claim(self, response):
+        """
+        Remove and return the outstanding request answered by a response. Must be called with the condition held.
+
+        Args:
+            response (bytes): Response message without terminator.
+
+        Returns:
+            tuple[_Request | None, list[_Request]]: The answered request (None if the response matches no request) and the outstanding requests before it, whose responses were lost.
+        """
+        if self._match is None:
+            return (self._inflight.popleft() if self._inflight else None), []
+        for i, request in enumerate(self._inflight):
+            if self._match(request.message, response):
+                lost = [self._inflight.popleft() for _ in range(i)]
+                return self._inflight.popleft(), lost
+        return None, []
+
+    def _readLoop(self):
+        """
+        Read responses and resolve the outstanding requests they answer.
+        """
+        while True:
+            try:
+                response = self._transport.readMessage()
+            except Exception as e:
+                self._fail(e)
+                return
+            with self._cond:
+                request, lost = self._claim(response)
+                self._cond.notify_all()
+            for r in lost:
+                r.resolve(error=ConnectionError(f"Response to {r.message!r} was lost."))
+            if request is not None:
+                request.resolve(response)
+            else:
+                logging.debug(f"Discarded unexpected response {response!r}.")
+
+    def _fail(self, error):
+        """
+        Fail all pending requests after a transport error.
+
+        Args:
+            error (Exception): Error raised by the transport.
+        """
+        with self._cond:
+            pending = list(self._inflight) + [r for q in self._queues.values() for r in q]
+            self._inflight.clear()
+            self._queues.clear()
+            closed = self._closed
+            self._closed = True
+            self._cond.notify_all()
+        for request in pending:
+            request.resolve(error=ConnectionError("Transport closed.") if closed else error)
+
+    def close(self):
+        """
+        Close the transport and fail all pending requests.
+        """
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        self._transport.close()
+        self._fail(ConnectionError("Transport closed."))
+
+
+class _Channel:
+    """
+    Per-device handle for sending requests through a ``RequestMultiplexer``.
+    """
+
+    def __init__(self, mux, name):
+        """
+        Initialize the channel.
+
+        Args:
+            mux (RequestMultiplexer): Multiplexer owning the link.
+            name (str): Channel name.
+        """
+        self._mux = mux
+        self._name = name
+
+    @property
+    def name(self):
+        """
+        Channel name.
+
+        Returns:
+            str: Channel name.
+        """
+        return self._name
+
+    def query(self, message, timeout=None):
+        """
+        Send a request and wait for its response.
+
+        Args:
+            message (str | bytes): Request message without terminator.
+            timeout (float | None, optional): Maximum time (in seconds) to wait for the response. Defaults to no limit.
+
+        Returns:
+            str | bytes: Response message, of the same type as ``message``.
+
+        Raises:
+            RuntimeError: If no response arrives within ``timeout`` or the link fails.
+        """
+        future = self.queryAsync(message)
+        try:
+            response = future.result(timeout)
+        except (concurrent.futures.TimeoutError, TimeoutError):
+            # Drop the request if it has not been written yet
+            future.cancel()
+            raise RuntimeError(f"No response to {message!r} within {timeout} s.")
+        except ConnectionError as e:
+            raise RuntimeError(f"Communication error on {self._name}: {e}")
+        return response.decode() if isinstance(message, str) else response
+
+    def queryAsync(self, message):
+        """
+        Send a request without waiting, so that independent queries can be pipelined.
+
+        Args:
+            message (str | bytes): Request message without terminator.
+
+        Returns:
+            concurrent.futures.Future: Future resolved with the response (bytes).
+        """
+        return self._mux._submit(self._name, message.encode() if isinstance(message, str) else message, True)
+
+    def send(self, message):
+        """
+        Send a request that has no response (e.g., a motion command).
+
+        Args:
+            message (str | bytes): Request message without terminator.
+
+        Returns:
+            concurrent.futures.Future: Future resolved when the request has been written.
+        """
+        return self._mux._submit(self._name, message.encode() if isinstance(message, str) else message, False)
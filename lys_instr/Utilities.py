@@ -1,22 +1,265 @@
+import asyncio
+import ctypes
+import ctypes.util
+import sys
+import threading
 import time
 
 
+class HybridTimer:
+    """
+    Low-CPU precision timer combining OS sleeps with short busy-waits.
+
+    On creation, the overshoot of the OS sleep is calibrated. Each call then selects its strategy from the remaining time:
+    if the accepted ``tolerance`` covers the calibrated ``overshoot``, the thread only sleeps in the OS;
+    otherwise it sleeps in the OS until ``overshoot`` before the deadline and busy-waits only for the rest.
+    On Linux, the OS sleep uses ``clock_nanosleep`` with an absolute deadline on ``CLOCK_MONOTONIC`` (the clock of ``time.perf_counter``),
+    which does not accumulate the latency of the calling code. On other platforms ``time.sleep`` is used.
+    Both release the GIL, so that waiting threads do not slow down acquisition threads.
+
+    The timer records the achieved lateness and the CPU time spent per call, which are reported by ``stats``.
+    """
+
+    def __init__(self, tolerance=0.0, calibrate=True):
+        """
+        Initialize the timer.
+
+        Args:
+            tolerance (float, optional): Default lateness (in seconds) that is accepted without busy-waiting. Defaults to 0, i.e., always busy-wait the rest.
+            calibrate (bool, optional): If True, calibrate the OS sleep overshoot immediately. Defaults to True.
+        """
+        self._tolerance = tolerance
+        self._overshoot = 0.001
+        self._nanosleep = _loadNanosleep()
+        self._lock = threading.Lock()
+        self.resetStats()
+        if calibrate:
+            self.calibrate()
+
+    @property
+    def absolute(self):
+        """
+        Whether OS sleeps use absolute deadlines (``clock_nanosleep``).
+
+        Returns:
+            bool: True if ``clock_nanosleep`` is used.
+        """
+        return self._nanosleep is not None
+
+    @property
+    def overshoot(self):
+        """
+        Calibrated overshoot (in seconds) of the OS sleep.
+
+        Returns:
+            float: Time by which an OS sleep typically exceeds its deadline.
+        """
+        return self._overshoot
+
+    def calibrate(self, samples=20, duration=0.001):
+        """
+        Measure the overshoot of the OS sleep.
+
+        The overshoot is taken as the 90th percentile of the measured lateness plus a safety margin of 50 µs.
+
+        Args:
+            samples (int, optional): Number of test sleeps. Defaults to 20.
+            duration (float, optional): Duration (in seconds) of each test sleep. Defaults to 1 ms.
+
+        Returns:
+            float: Calibrated overshoot in seconds.
+        """
+        late = []
+        for _ in range(samples):
+            deadline = time.perf_counter() + duration
+            self._osSleep(deadline)
+            late.append(time.perf_counter() - deadline)
+        late.sort()
+        self._overshoot = max(0.0, late[int(0.9 * (samples - 1))]) + 5e-5
+        return self._overshoot
+
+    def _osSleep(self, deadline):
+        """
+        Sleep in the OS until the deadline.
+
+        Args:
+            deadline (float): Deadline in ``time.perf_counter()`` seconds.
+        """
+        if self._nanosleep is not None:
+            self._nanosleep(deadline)
+        else:
+            remaining = deadline - time.perf_counter()
+            if remaining > 0:
+                time.sleep(remaining)
+
+    def sleepUntil(self, deadline, tolerance=None):
+        """
+        Sleep until the specified deadline.
+
+        Args:
+            deadline (float): Deadline in ``time.perf_counter()`` seconds.
+            tolerance (float | None, optional): Accepted lateness in seconds. Defaults to the tolerance of the timer.
+        """
+        if tolerance is None:
+            tolerance = self._tolerance
+        cpu = time.thread_time()
+        remaining = deadline - time.perf_counter()
+        spin = 0.0
+        if tolerance >= self._overshoot:
+            self._osSleep(deadline)
+        else:
+            if remaining > self._overshoot:
+                self._osSleep(deadline - self._overshoot)
+            start = time.perf_counter()
+            while time.perf_counter() < deadline:
+                pass
+            spin = time.perf_counter() - start
+        late = time.perf_counter() - deadline
+        cpu = time.thread_time() - cpu
+        with self._lock:
+            self._calls += 1
+            self._lateSum += late
+            self._lateMax = max(self._lateMax, late)
+            self._spin += spin
+            self._cpu += cpu
+            self._slept += max(0.0, remaining)
+
+    def sleep(self, sleepTime, tolerance=None):
+        """
+        Sleep for the specified interval.
+
+        Args:
+            sleepTime (float): Time to sleep, in seconds. Non-positive values return immediately.
+            tolerance (float | None, optional): Accepted lateness in seconds. Defaults to the tolerance of the timer.
+        """
+        self.sleepUntil(time.perf_counter() + sleepTime, tolerance)
+
+    @property
+    def stats(self):
+        """
+        Achieved precision and CPU cost since the last ``resetStats()``.
+
+        Returns:
+            dict[str, float]: Number of calls, mean and maximum lateness (s), total requested sleep (s), total busy-wait time (s),
+            total CPU time (s), CPU load as the ratio of CPU time to requested sleep, and the calibrated overshoot (s).
+        """
+        with self._lock:
+            n = max(1, self._calls)
+            return {
+                "calls": self._calls,
+                "meanLateness": self._lateSum / n,
+                "maxLateness": self._lateMax,
+                "sleepTime": self._slept,
+                "spinTime": self._spin,
+                "cpuTime": self._cpu,
+                "cpuLoad": self._cpu / self._slept if self._slept > 0 else 0.0,
+                "overshoot": self._overshoot,
+            }
+
+    def resetStats(self):
+        """
+        Reset the statistics reported by ``stats``.
+        """
+        with self._lock:
+            self._calls = 0
+            self._lateSum = 0.0
+            self._lateMax = 0.0
+            self._spin = 0.0
+            self._cpu = 0.0
+            self._slept = 0.0
+
+
+def _loadNanosleep():
+    """
+    Return a function sleeping until an absolute ``time.perf_counter()`` deadline using ``clock_nanosleep``.
+
+    Returns:
+        callable | None: Sleep function, or None if ``clock_nanosleep`` is unavailable or ``time.perf_counter`` does not use ``CLOCK_MONOTONIC``.
+    """
+    if not sys.platform.startswith("linux") or "CLOCK_MONOTONIC" not in time.get_clock_info("perf_counter").implementation:
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+        nanosleep = libc.clock_nanosleep
+    except (OSError, AttributeError, TypeError):
+        return None
+
+    class timespec(ctypes.Structure):
+        _fields_ = [("tv_sec", ctypes.c_long), ("tv_nsec", ctypes.c_long)]
+
+    nanosleep.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.POINTER(timespec), ctypes.POINTER(timespec)]
+    nanosleep.restype = ctypes.c_int
+    clock, absolute, eintr = time.CLOCK_MONOTONIC, 1, 4
+
+    def sleepUntil(deadline):
+        sec, frac = divmod(deadline, 1.0)
+        ts = timespec(int(sec), int(frac * 1e9))
+        while nanosleep(clock, absolute, ctypes.byref(ts), None) == eintr:
+            pass
+    return sleepUntil
+
+
+_defaultTimer = None
+
+
+def defaultTimer():
+    """
+    Return the shared ``HybridTimer`` used by ``preciseSleep()``, creating and calibrating it on first use.
+
+    Returns:
+        HybridTimer: The shared timer.
+    """
+    global _defaultTimer
+    if _defaultTimer is None:
+        _defaultTimer = HybridTimer()
+    return _defaultTimer
+
+
 def preciseSleep(sleepTime):
     """
     Sleep for the specified interval (in seconds) with improved temporal precision.
 
-    Avoid overshooting the requested sleep time by busy-waiting for the last ~0.5 ms.
+    Sleep in the OS until shortly before the deadline and busy-wait only for the calibrated overshoot of the OS sleep (see ``HybridTimer``).
 
     Args:
         sleepTime (float): Total time to sleep, in seconds. Non-positive values return immediately.
     """
-    wakeTime = time.perf_counter() + sleepTime
-    while True:
-        now = time.perf_counter()
-        remaining = wakeTime - now
-        if remaining > 0.001:
-            time.sleep(remaining - 0.0005)
-        elif remaining > 0:
-            pass
-        else:
-            break
\ No newline at end of file
+    defaultTimer().sleep(sleepTime)
+
+
+def sleepUntil(deadline):
+    """
+    Sleep until the specified ``time.perf_counter()`` deadline with improved temporal precision.
+
+    Unlike ``preciseSleep()``, the latency of the calling code does not accumulate in periodic loops.
+
+    Args:
+        deadline (float): Deadline in ``time.perf_counter()`` seconds.
+    """
+    defaultTimer().sleepUntil(deadline)
+
+
+_asyncLoop = None
+_asyncLock = threading.Lock()
+
+
+def runAsync(coro):
+    """
+    Run a coroutine on a dedicated asyncio event loop thread.
+
+    The loop thread is started on first use and shared by all callers.
+    This allows GUI code and scripts that do not run an asyncio event loop themselves to use the asynchronous device API
+    (e.g., ``MultiControllerInterface.setAsync`` and ``DetectorInterface.acquireAsync``) without blocking the Qt event loop.
+
+    Args:
+        coro (coroutine): Coroutine to run.
+
+    Returns:
+        concurrent.futures.Future: Future holding the result of the coroutine. Call ``result()`` to block until it completes.
+    """
+    global _asyncLoop
+    with _asyncLock:
+        if _asyncLoop is None:
+            _asyncLoop = asyncio.new_event_loop()
+            threading.Thread(target=_asyncLoop.run_forever, name="lys_instr asyncio loop", daemon=True).start()
+    return asyncio.run_coroutine_threadsafe(coro, _asyncLoop)
@@ -2,3 +2,5 @@ from .MultiController import MultiControllerInterface, MultiSwitchInterface, Mul
 from .MultiDetector import MultiDetectorInterface
 from .DataStorage import DataStorage
 from .PreCorrection import PreCorrector
+from .DetectorGroup import DetectorGroup
+from .Launcher import DeviceLauncher
@@ -1,9 +1,12 @@
 import time
+import functools
 
 from lys_instr.MultiDetector import MultiDetectorInterface
+from lys_instr.FrameDecoder import FrameDecoder
 from lys.Qt import QtWidgets, QtCore
 
-from .detectorData import RandomData, DummyDataSelector
+from .detectorData import RandomData, CompressedData, DummyDataSelector
+from .detectorData.compressed import decompressFrame
 
 
 class MultiDetectorDummy(MultiDetectorInterface):
@@ -13,9 +16,10 @@ class MultiDetectorDummy(MultiDetectorInterface):
     This class simulates a detector that Produces indexed frames from a supplied data source or by generating random frames.
     Acquisition runs in a background loop (started by ``start()`` in ``__init__``) and populates an internal buffer.
     Signals ``updated``, ``dataAcquired``, and ``aliveStateChanged``, defined in ``MultiDetectorInterface``, are emitted as appropriate.
+    In compressed mode, frames are delivered packed and decoded by a ``FrameDecoder`` process pool, which can be used to benchmark decoding.
     """
 
-    def __init__(self, data=None, indexShape=(), frameShape=(100, 100), exposure=0.1, **kwargs):
+    def __init__(self, data=None, indexShape=(), frameShape=(100, 100), exposure=0.1, compressed=False, **kwargs):
         """
         Initialize the dummy detector and start acquisition.
 
@@ -26,9 +30,11 @@ class MultiDetectorDummy(MultiDetectorInterface):
             indexShape (Tuple[int, ...]): Shape of the index grid for generated data. Ignored if ``data`` is not None.
             frameShape (Tuple[int, ...]): Shape of each data frame for generated data. Ignored if ``data`` is not None.
             exposure (float): Time in seconds to wait per frame (frame exposure).
+            compressed (bool): If True, frames are delivered as packed bytes (``CompressedData``) and decoded by a ``FrameDecoder``.
             **kwargs: Additional keyword arguments forwarded to the parent initializer.
         """
         super().__init__(**kwargs)
+        self._compressed = compressed
         self.setData(data, indexShape, frameShape)
         self.exposure = exposure
         self.error = False
@@ -134,6 +140,11 @@ class MultiDetectorDummy(MultiDetectorInterface):
             self._obj = RandomData(indexShape, frameShape)
         else:
             self._obj = data
+        if self._compressed:
+            self._obj = CompressedData(self._obj)
+            if self.decoder is not None:
+                self.decoder.close()
+            self.decoder = FrameDecoder(functools.partial(decompressFrame, shape=self._obj.decodedShape), self._obj.decodedShape)
         self._data = {}
 
 
@@ -184,6 +195,8 @@ class _OptionalPanel(QtWidgets.QWidget):
         backend = self._obj
         backend.error = not backend.error
         data = backend._get()
+        if backend.decoder is not None:
+            data = {idx: backend.decoder.decode(raw) for idx, raw in data.items()}
         if data:
             backend.dataAcquired.emit(data)
         backend.aliveStateChanged.emit(backend.isAlive)
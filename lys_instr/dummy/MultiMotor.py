@@ -1,7 +1,9 @@
+import concurrent.futures
 import sys
 import time
 
 from lys_instr import MultiMotorInterface
+from lys_instr.Transport import LoopbackTransport, RequestMultiplexer
 from lys.Qt import QtWidgets, QtCore
 
 
@@ -140,6 +142,25 @@ class MultiMotorDummy(MultiMotorInterface):
         for d in self._data.values():
             d.stop()
 
+    def _getSpeed(self):
+        """
+        Return the simulated speed of all axes.
+
+        Returns:
+            dict[str, float]: Mapping of axis names to speeds.
+        """
+        return {name: d._speed for name, d in self._data.items()}
+
+    def _setSpeed(self, **speeds):
+        """
+        Set the simulated speed of the specified axes.
+
+        Args:
+            speeds (dict[str, float]): Mapping of axis names to speeds.
+        """
+        for name, value in speeds.items():
+            self._data[name]._speed = value
+
     def _isBusy(self):
         """
         Return busy state for all axes.
@@ -190,6 +211,192 @@ class MultiMotorDummy(MultiMotorInterface):
         return _OptionalPanel(self)
 
 
+class _ControllerBoxDummy:
+    """
+    Simulated motion controller box answering a line-based text protocol, for motors sharing one link.
+
+    Requests are ``MOV <axis> <value>`` and ``STP <axis>`` without response, and ``POS? <axis>``, ``BSY? <axis>`` and ``ERR? <axis>``,
+    answered by ``POS <axis> <value>``, ``BSY <axis> 0|1`` and ``ERR <axis> 0|1``. Responses echo the command and the axis,
+    so that they can be matched to their requests (see ``matchResponse()``).
+    """
+
+    def __init__(self, speed):
+        """
+        Initialize the controller box.
+
+        Args:
+            speed (float): Simulated motion speed (units per second) of the axes.
+        """
+        self._speed = speed
+        self._axes = {}
+
+    def axis(self, name):
+        """
+        Return the simulated axis of the given name, creating it on first use.
+
+        Args:
+            name (str): Axis name.
+
+        Returns:
+            _ValueInfo: Simulated axis.
+        """
+        return self._axes.setdefault(name, _ValueInfo(self._speed))
+
+    def handle(self, request):
+        """
+        Answer a request.
+
+        Args:
+            request (bytes): Request message without terminator.
+
+        Returns:
+            bytes | None: Response message, or None for commands without response.
+        """
+        command, name, *args = request.decode().split()
+        axis = self.axis(name)
+        if command == "MOV":
+            axis.set(float(args[0]))
+        elif command == "STP":
+            axis.stop()
+        elif command == "POS?":
+            return f"POS {name} {axis.position}".encode()
+        elif command == "BSY?":
+            return f"BSY {name} {int(axis.busy)}".encode()
+        elif command == "ERR?":
+            return f"ERR {name} {int(axis.error)}".encode()
+        return None
+
+    @staticmethod
+    def matchResponse(request, response):
+        """
+        Check whether a response answers a request, by comparing the echoed command and axis.
+
+        Args:
+            request (bytes): Request message, e.g., b"POS? x".
+            response (bytes): Response message, e.g., b"POS x 1.0".
+
+        Returns:
+            bool: True if the response answers the request.
+        """
+        command, name = request.split()[:2]
+        return response.split()[:2] == [command.rstrip(b"?"), name]
+
+
+class SharedLinkMotorDummy(MultiMotorInterface):
+    """
+    Dummy multi-axis motor that talks to a simulated controller box through a ``RequestMultiplexer`` channel.
+
+    Motors created with the same ``link`` share one ``LoopbackTransport`` and one controller box, as several controllers on one serial line
+    or Ethernet converter would, so their axis names must be distinct. Queries for all axes are pipelined.
+    """
+
+    def __init__(self, *axisNamesAll, link="dummy", speed=10, latency=0.005, timeout=1, **kwargs):
+        """
+        Initialize the dummy motor and connect it to the shared link.
+
+        Args:
+            *axisNamesAll: Names of axes to simulate.
+            link (str, optional): Link name. Motors with the same link share the transport. Defaults to "dummy".
+            speed (float, optional): Simulated motion speed (units per second), used when the link is created. Defaults to 10.
+            latency (float, optional): Round-trip time (in seconds) of the link, used when the link is created. Defaults to 0.005.
+            timeout (float, optional): Time (in seconds) after which a query is considered lost. Defaults to 1.
+            **kwargs: Additional keyword arguments passed to the parent class.
+        """
+        super().__init__(*axisNamesAll, **kwargs)
+        self._timeout = timeout
+        self._mux = RequestMultiplexer.shared(("dummy", link), lambda: LoopbackTransport(_ControllerBoxDummy(speed).handle, latency=latency), timeout=timeout, match=_ControllerBoxDummy.matchResponse)
+        self._channel = self._mux.channel(",".join(self.nameList))
+        self.start()
+
+    @property
+    def link(self):
+        """
+        Multiplexer of the shared link.
+
+        Returns:
+            RequestMultiplexer: Multiplexer used by this motor.
+        """
+        return self._mux
+
+    def _queryAll(self, command):
+        """
+        Send a query for every axis at once and collect the answers.
+
+        Args:
+            command (str): Query command, e.g., "POS?".
+
+        Returns:
+            dict[str, str]: Mapping of axis names to the values in the responses.
+
+        Raises:
+            RuntimeError: If a response is lost or does not arrive in time.
+        """
+        futures = {name: self._channel.queryAsync(f"{command} {name}") for name in self.nameList}
+        try:
+            return {name: f.result(self._timeout).decode().split()[2] for name, f in futures.items()}
+        except (concurrent.futures.TimeoutError, TimeoutError, ConnectionError) as e:
+            raise RuntimeError(f"Communication error on {self._channel.name}: {e}")
+
+    def _set(self, **target):
+        """
+        Send motion commands for the specified axes.
+
+        Args:
+            target (dict[str, float]): Mapping of axis names to respective target positions.
+        """
+        for name, value in target.items():
+            self._channel.send(f"MOV {name} {value}")
+
+    def _get(self):
+        """
+        Get current positions for all axes.
+
+        Returns:
+            dict[str, float]: Mapping of axis names to respective current positions.
+        """
+        return {name: float(v) for name, v in self._queryAll("POS?").items()}
+
+    def _stop(self):
+        """
+        Send stop commands for all axes.
+        """
+        for name in self.nameList:
+            self._channel.send(f"STP {name}")
+
+    def _isBusy(self):
+        """
+        Return busy state for all axes.
+
+        Returns:
+            dict[str, bool]: Mapping of axis names to busy states.
+        """
+        return {name: v == "1" for name, v in self._queryAll("BSY?").items()}
+
+    def _isAlive(self):
+        """
+        Return alive state for all axes.
+
+        A communication error on the shared link is reported as all axes being dead instead of raising,
+        so that the device becomes unavailable rather than stopping the background monitor.
+
+        Returns:
+            dict[str, bool]: Mapping of axis names to alive states.
+        """
+        try:
+            return {name: v == "0" for name, v in self._queryAll("ERR?").items()}
+        except RuntimeError:
+            return {name: False for name in self.nameList}
+
+    def kill(self):
+        """
+        Stop background monitoring and release the shared link.
+        """
+        super().kill()
+        if self._mux is not None:
+            self._mux.release()
+            self._mux = None
+
+
 class _OptionalPanel(QtWidgets.QWidget):
     """
     Optional settings panel.
@@ -1,3 +1,3 @@
 from .MultiDetector import MultiDetectorDummy
-from .MultiMotor import MultiMotorDummy
+from .MultiMotor import MultiMotorDummy, SharedLinkMotorDummy
 from .MultiSwitch import MultiSwitchDummy
@@ -1,8 +1,10 @@
 from lys.Qt import QtWidgets, QtCore
 from .random import RandomData, RandomData2D
 from .raman import RamanData
+from .compressed import CompressedData
+from .synthetic import SyntheticData
 
-dummyOptions = [RandomData, RandomData2D, RamanData]
+dummyOptions = [RandomData, RandomData2D, RamanData, SyntheticData]
 
 
 def loadDataByName(name):
@@ -24,6 +26,8 @@ def loadDataByName(name):
         return RandomData((), (600,))
     elif name == RandomData2D.name():
         return RandomData2D()
+    elif name == SyntheticData.name():
+        return SyntheticData()
     else:
         raise ValueError(f"Unknown dummy data name: {name}")
 
@@ -58,8 +62,9 @@ class DummyDataSelector(QtWidgets.QComboBox):
         Use ``value.name()`` to find and select the matching provider in the combo box.
 
         Args:
-            value (object): Dummy data instance whose class exposes a ``name()`` method.
+            value (object): Dummy data instance whose class exposes a ``name()`` method. Wrapping providers (e.g., ``CompressedData``) are matched by their ``source``.
         """
+        value = getattr(value, "source", value)
         for cls in dummyOptions:
             if cls.name() == value.name():
                 self.setCurrentText(cls.name())
@@ -0,0 +1,152 @@
+import zlib
+import numpy as np
+from .interface import DummyDataInterface
+
+
+def compressFrame(frame, level=1):
+    """
+    Encode a frame into a synthetic packed format.
+
+    The frame is delta-encoded along its last axis and compressed with zlib.
+
+    Args:
+        frame (numpy.ndarray): Frame to encode.
+        level (int): zlib compression level.
+
+    Returns:
+        bytes: Packed frame.
+    """
+    delta = np.diff(np.asarray(frame, dtype=float), axis=-1, prepend=0)
+    return zlib.compress(delta.tobytes(), level)
+
+
+def decompressFrame(raw, shape):
+    """
+    Decode a frame packed by ``compressFrame()``.
+
+    This function is module-level so that it can be pickled and run in a ``FrameDecoder`` worker process.
+
+    Args:
+        raw (bytes): Packed frame.
+        shape (tuple[int, ...]): Shape of the decoded frame.
+
+    Returns:
+        numpy.ndarray: Decoded frame.
+    """
+    delta = np.frombuffer(zlib.decompress(raw), dtype=float).reshape(shape)
+    return np.cumsum(delta, axis=-1)
+
+
+class CompressedData(DummyDataInterface):
+    """
+    Dummy data provider that yields packed frames of another provider.
+
+    Wraps a data provider and encodes each frame with ``compressFrame()``.
+    It simulates detectors that deliver compressed frames which must be decoded in Python.
+    """
+
+    def __init__(self, source, level=1):
+        """
+        Initialize the data provider.
+
+        Args:
+            source (DummyDataInterface): Data provider whose frames are compressed.
+            level (int): zlib compression level.
+        """
+        self._source = source
+        self._level = level
+
+    @classmethod
+    def name(cls):
+        """
+        Return the name of the data provider.
+
+        Returns:
+            str: Name of the data provider ("Compressed").
+        """
+        return "Compressed"
+
+    @property
+    def source(self):
+        """
+        Wrapped data provider.
+
+        Returns:
+            DummyDataInterface: The wrapped data provider.
+        """
+        return self._source
+
+    @property
+    def frameShape(self):
+        """
+        Shape of each decoded data frame.
+
+        Returns:
+            tuple[int, ...]: Shape of each decoded data frame.
+        """
+        return self._source.frameShape
+
+    @property
+    def decodedShape(self):
+        """
+        Shape of each yielded frame after decoding, including the sub-frame dimension when ``nframes`` > 1.
+
+        Returns:
+            tuple[int, ...]: Shape of each yielded frame after decoding.
+        """
+        if self.nframes == 1:
+            return tuple(self.frameShape)
+        return (self.nframes, *self.frameShape)
+
+    @property
+    def indexShape(self):
+        """
+        Shape of the index grid to be filled by data frames.
+
+        Returns:
+            tuple[int, ...]: Shape of the index grid.
+        """
+        return self._source.indexShape
+
+    @property
+    def axes(self):
+        """
+        Axis coordinates for the full data.
+
+        Returns:
+            list[numpy.ndarray]: Coordinate arrays corresponding to each axis of the index grid.
+        """
+        return self._source.axes
+
+    @property
+    def nframes(self):
+        """
+        Number of sub-frames per yielded frame.
+
+        Returns:
+            int: Number of sub-frames per yielded frame of the wrapped provider.
+        """
+        return self._source.nframes
+
+    def __iter__(self):
+        """
+        Return an iterator over (index, packed frame) pairs.
+
+        Returns:
+            Iterator[tuple, bytes]: Iterator over (index, packed frame) pairs.
+        """
+        self._iter = iter(self._source)
+        return self
+
+    def __next__(self):
+        """
+        Return the next (index, packed frame) pair.
+
+        Returns:
+            tuple[tuple[int, ...], bytes]: (index, packed frame)
+
+        Raises:
+            StopIteration: When the wrapped provider is exhausted.
+        """
+        idx, frame = next(self._iter)
+        return idx, compressFrame(frame, self._level)
@@ -27,6 +27,7 @@ class RamanData(DummyDataInterface):
             sample = np.load(fh)
 
         self._data = np.tile(np.repeat(sample[:, :, 1, :], 3, axis=0), (8, 1, 1, 1))
+        self._frames = self._data.reshape(-1, self._data.shape[-1])
         self._axes = [np.linspace(0, 360, self._data.shape[-2], endpoint=False), sample[0, 0, 0, :]][-1 - scanLevel:]
         if scanLevel == 1:
             self._indexShape = (self._data.shape[-2],)
@@ -109,8 +110,8 @@ class RamanData(DummyDataInterface):
         if self._n >= np.prod(self._indexShape):
             raise StopIteration()
         idx = np.unravel_index(self._n, self._indexShape)
-        frame = self._data.reshape(-1, self._data.shape[-1])[self._count]
+        frame = self._frames[self._count]
         self._n += 1
         self._count += 1
-        self._count %= self._data.shape[0] * self._data.shape[1]
+        self._count %= len(self._frames)
         return idx, frame
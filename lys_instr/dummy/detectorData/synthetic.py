@@ -0,0 +1,174 @@
+import time
+import numpy as np
+from .interface import DummyDataInterface
+from lys_instr.Utilities import sleepUntil
+
+
+class SyntheticData(DummyDataInterface):
+    """
+    High-rate synthetic data provider for benchmarking.
+
+    A pool of frames is generated once with ``numpy.random.Generator`` and cycled through during iteration.
+    Index tuples are precomputed, so ``__next__`` performs no array allocation and the provider can reach rates comparable to real cameras.
+    Yielded frames are shared views into the pool and must not be modified by consumers.
+
+    Frames are paced to ``fps`` when given: ``burst`` frames are yielded back-to-back, followed by a pause so that the average rate matches ``fps``.
+    Use it with a ``MultiDetectorDummy`` whose exposure is 0 so that only the provider determines the frame rate.
+    """
+
+    def __init__(self, indexShape=(), frameShape=(256, 256), dtype=np.uint16, fps=None, burst=1, poolSize=16, seed=None):
+        """
+        Initialize the data provider and pre-generate the frame pool.
+
+        Args:
+            indexShape (tuple[int, ...]): Shape of the acquisition index grid.
+            frameShape (tuple[int, ...]): Shape of each generated frame.
+            dtype (data-type): Data type of generated frames. Integer types are filled over their full range, float types with values in [0, 1).
+            fps (float | None): Target frame rate in frames per second, or ``None`` for free-running.
+            burst (int): Number of frames yielded back-to-back before pacing.
+            poolSize (int): Number of distinct pre-generated frames.
+            seed (int | None): Seed of the random generator.
+        """
+        self._indexShape = tuple(indexShape)
+        self._frameShape = tuple(frameShape)
+        self._dtype = np.dtype(dtype)
+        self._fps = fps
+        self._burst = max(1, int(burst))
+
+        rng = np.random.default_rng(seed)
+        size = (poolSize, *self._frameShape)
+        if np.issubdtype(self._dtype, np.integer):
+            info = np.iinfo(self._dtype)
+            pool = rng.integers(info.min, info.max, size=size, dtype=self._dtype, endpoint=True)
+        else:
+            pool = rng.random(size=size).astype(self._dtype)
+        self._pool = pool
+        self._frames = list(pool)
+        self._indices = [tuple(int(i) for i in idx) for idx in np.ndindex(*self._indexShape)]
+
+    @classmethod
+    def name(cls):
+        """
+        Return the name of the data provider.
+
+        Returns:
+            str: Name of the data provider ("Synthetic").
+        """
+        return "Synthetic"
+
+    @property
+    def frameShape(self):
+        """
+        Shape of each generated data frame.
+
+        Returns:
+            tuple[int, ...]: Shape of each generated data frame.
+        """
+        return self._frameShape
+
+    @property
+    def indexShape(self):
+        """
+        Shape of the index grid to be filled by generated data frames.
+
+        Returns:
+            tuple[int, ...]: Shape of the index grid.
+        """
+        return self._indexShape
+
+    @property
+    def dtype(self):
+        """
+        Data type of generated frames.
+
+        Returns:
+            numpy.dtype: Data type of generated frames.
+        """
+        return self._dtype
+
+    @property
+    def axes(self):
+        """
+        Axis coordinates for the full data.
+
+        Returns:
+            list[numpy.ndarray]: Coordinate arrays corresponding to each axis of the index grid (evenly spaced values).
+        """
+        return [np.linspace(0, 1, s) for s in tuple([*self.indexShape, *self.frameShape])]
+
+    @property
+    def nframes(self):
+        """
+        Number of sub-frames per yielded frame.
+
+        Returns:
+            int: Number of sub-frames per yielded frame (always 1 for this provider).
+        """
+        return 1
+
+    def __iter__(self):
+        """
+        Return an iterator over (index, frame) pairs and reset pacing.
+
+        Returns:
+            Iterator[tuple, numpy.ndarray]: Iterator over (index, frame) pairs.
+        """
+        self._n = 0
+        self._start = time.perf_counter()
+        return self
+
+    def __next__(self):
+        """
+        Return the next (index, frame) pair.
+
+        Returns:
+            tuple[tuple[int, ...], numpy.ndarray]: (index, frame)
+
+        Raises:
+            StopIteration: When iteration is complete.
+        """
+        n = self._n
+        if n >= len(self._indices):
+            raise StopIteration()
+        if self._fps and n % self._burst == 0:
+            sleepUntil(self._start + n / self._fps)
+        self._n = n + 1
+        return self._indices[n], self._frames[n % len(self._frames)]
+
+
+def benchmark(nframes=10000, frameShape=(256, 256), dtype=np.uint16, fps=None, burst=1, detector=False):
+    """
+    Measure the throughput of ``SyntheticData``.
+
+    Without ``detector``, the raw iteration rate of the provider is measured.
+    With ``detector``, frames are acquired through a ``MultiDetectorDummy`` with zero exposure and counted at its ``dataAcquired`` signal,
+    which measures the overhead of the acquisition pipeline.
+
+    Args:
+        nframes (int): Number of frames to acquire.
+        frameShape (tuple[int, ...]): Shape of each frame.
+        dtype (data-type): Data type of frames.
+        fps (float | None): Target frame rate, or ``None`` for free-running.
+        burst (int): Number of frames yielded back-to-back before pacing.
+        detector (bool): If True, acquire through a ``MultiDetectorDummy``.
+
+    Returns:
+        dict[str, float]: Number of frames, elapsed seconds, achieved frames per second and throughput in MB/s.
+    """
+    data = SyntheticData(indexShape=(nframes,), frameShape=frameShape, dtype=dtype, fps=fps, burst=burst)
+    if detector:
+        from lys_instr.dummy.MultiDetector import MultiDetectorDummy
+        det = MultiDetectorDummy(data=data, exposure=0)
+        count = [0]
+        det.dataAcquired.connect(lambda d: count.__setitem__(0, count[0] + len(d)))
+        start = time.perf_counter()
+        det.startAcq(wait=True)
+        elapsed = time.perf_counter() - start
+        det.kill()
+        frames = count[0]
+    else:
+        start = time.perf_counter()
+        frames = sum(1 for _ in data)
+        elapsed = time.perf_counter() - start
+    frameBytes = int(np.prod(frameShape)) * data.dtype.itemsize
+    return {"frames": frames, "seconds": elapsed, "fps": frames / elapsed, "MBps": frames * frameBytes / elapsed / 1e6}
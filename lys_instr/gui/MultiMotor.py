@@ -108,7 +108,7 @@ class MultiMotorGUI(QtWidgets.QWidget):
         for obj in self._objs:
             targ = {name: value for name, value in targetAll.items() if name in obj.nameList}
             if len(targ) > 0:
-                obj.set(**targ)
+                obj.set(**targ, queued=True)
 
     def _busyStateChanged(self):
         """
@@ -206,7 +206,7 @@ class _MotorRowLayout(QtCore.QObject):
         Initialize the displayed value from the controller (motor).
         """
         if self.alive:
-            self._now.setValue(obj.get()[self._name])
+            self._now.setValue(obj.get(cached=True)[self._name])
         else:
             self.alive = False
             self._updateState()
@@ -296,20 +296,34 @@ class _MotorRowLayout(QtCore.QObject):
             s = ""
         self._moveTo.setText(s)
 
+    def _jogBase(self):
+        """
+        Return the position from which a jog step is taken.
+
+        The latest requested target is used while the axis is moving or a target is queued, so that repeated clicks accumulate.
+
+        Returns:
+            float: Pending target, or the cached current position of the axis.
+        """
+        pending = self._obj.pendingTarget
+        if self._name in pending:
+            return pending[self._name]
+        return self._obj.get(cached=True)[self._name]
+
     def _nega(self):
         """
         Handle negative jog button press for an axis.
         """
-        target = self._obj.get()[self._name] - self._jogStep.value()
-        self._obj.set(**{self._name: target})
+        target = self._jogBase() - self._jogStep.value()
+        self._obj.set(**{self._name: target}, queued=True)
         self._moveTo.setText(f"{target:.3f}")
 
     def _posi(self):
         """
         Handle positive jog button press for an axis.
         """
-        target = self._obj.get()[self._name] + self._jogStep.value()
-        self._obj.set(**{self._name: target})
+        target = self._jogBase() + self._jogStep.value()
+        self._obj.set(**{self._name: target}, queued=True)
         self._moveTo.setText(f"{target:.3f}")
 
 
@@ -1,6 +1,9 @@
 import os
 import numpy as np
 from lys.Qt import QtWidgets, QtCore, QtGui
+from ..scan import ScanAxis, ScanPlan, ScanEngine, ScanQueue
+from ..scan.Ordering import ORDERS
+from ..scan.Simulator import measureThroughput
 
 
 class _MotorScanRow(QtWidgets.QWidget):
@@ -617,6 +620,10 @@ class ScanWidget(QtWidgets.QWidget):
     Scan configuration and execution panel.
 
     Provides a list-based GUI for composing a sequence of motor and switch scans, configuring detector/process settings, and starting/stopping scan execution.
+    The scan itself is executed by the headless ``lys_instr.scan.ScanEngine``.
+    "Dry run" predicts the duration, per-phase breakdown and bottleneck of the configured scan without moving or acquiring,
+    and the remaining time is shown while a scan is running.
+    Configured scans can also be added to a persistent ``ScanQueue`` with a priority and run back-to-back, e.g., overnight.
     """
 
     def __init__(self, storage, motors, switches, detectors):
@@ -634,6 +641,15 @@ class ScanWidget(QtWidgets.QWidget):
         self._motorScanners = self._initMotorScanners(motors)
         self._switchScanners = self._initSwitchScanners(switches)
         self._detectors = detectors
+        self._throughput = None
+        self._closeRequested = False
+        self._engine = ScanEngine()
+        self._engine.finished.connect(self._scanFinished)
+        self._engine.progress.connect(self._updateEta)
+        self._etaTimer = QtCore.QTimer(self, interval=1000, timeout=self._updateEta)
+        devices = {name: obj for name, obj in {**self._motorScanners, **self._switchScanners, **detectors}.items() if name != "loop"}
+        self._queue = ScanQueue(devices, storage, engine=self._engine)
+        self._queue.finished.connect(self._scanFinished)
         self._initLayout(self._motorScanners, self._switchScanners, self._detectors)
 
     def _initMotorScanners(self, motors):
@@ -679,8 +695,11 @@ class ScanWidget(QtWidgets.QWidget):
         self._startBtn = QtWidgets.QPushButton("Start", clicked=self._start)
         self._stopBtn = QtWidgets.QPushButton("Stop", clicked=self._stop)
         self._stopBtn.setEnabled(False)
+        self._dryRunBtn = QtWidgets.QPushButton("Dry run", clicked=self._dryRun)
+        self._eta = QtWidgets.QLabel(objectName="ScanTab_eta")
 
         btnsLayout = QtWidgets.QHBoxLayout()
+        btnsLayout.addWidget(self._dryRunBtn)
         btnsLayout.addWidget(self._startBtn)
         btnsLayout.addWidget(self._stopBtn)
 
@@ -689,20 +708,22 @@ class ScanWidget(QtWidgets.QWidget):
         layout.addWidget(self._list)
         layout.addWidget(processBox)
         layout.addWidget(self._nameBox)
+        layout.addWidget(self.__queueBox())
         layout.addLayout(btnsLayout)
+        layout.addWidget(self._eta)
         layout.addStretch()
 
         self.setLayout(layout)
 
     def __detectorBox(self, detectors):
         """
-        Create detector selection and exposure controls.
+        Create detector selection, exposure and scan order controls.
 
         Args:
             detectors (dict): Mapping of detector names to detector objects.
 
         Returns:
-            QtWidgets.QGroupBox: Group box containing detector selection and exposure controls.
+            QtWidgets.QGroupBox: Group box containing detector selection, exposure and scan order controls.
         """
         self._detectorsBox = QtWidgets.QComboBox(objectName="ScanTab_detectors")
         self._detectorsBox.addItems(detectors.keys())
@@ -711,165 +732,214 @@ class ScanWidget(QtWidgets.QWidget):
         self._exposure.setRange(0, np.inf)
         self._exposure.setDecimals(5)
 
+        self._order = QtWidgets.QComboBox(objectName="ScanTab_order")
+        self._order.addItems(ORDERS.keys())
+
         layout = QtWidgets.QGridLayout()
         layout.addWidget(QtWidgets.QLabel("Detectors"), 0, 0)
         layout.addWidget(self._detectorsBox, 0, 1, 1, 2)
         layout.addWidget(QtWidgets.QLabel("Exposure"), 1, 0)
         layout.addWidget(self._exposure, 1, 1, 1, 2)
+        layout.addWidget(QtWidgets.QLabel("Order"), 2, 0)
+        layout.addWidget(self._order, 2, 1, 1, 2)
 
         processBox = QtWidgets.QGroupBox("Process")
         processBox.setLayout(layout)
         return processBox
 
-    def _start(self):
+    def __queueBox(self):
         """
-        Start the configured scan run.
+        Create the scan queue list and controls.
 
-        Builds the nested process chain from the configured scan list and starts the worker thread.
-        """
-        process = _DetectorProcess(self._detectors[self._detectorsBox.currentText()], self._exposure.value())
-        for s in self._list:
-            process = _ScanProcess(s.scanName, s.scanObj, s.scanRange, process)
+        Returns:
+            QtWidgets.QGroupBox: Group box containing the queued jobs and the queue controls.
+        """
+        self._queueList = QtWidgets.QListWidget(objectName="ScanTab_queue")
+        self._priority = QtWidgets.QSpinBox(objectName="ScanTab_priority")
+        self._priority.setRange(-100, 100)
+        self._queueBtn = QtWidgets.QPushButton("Add to queue", clicked=self._enqueue)
+        self._runQueueBtn = QtWidgets.QPushButton("Run queue", clicked=self._runQueue)
+        self._pauseBtn = QtWidgets.QPushButton("Pause", clicked=self._queue.pause)
+        self._pauseBtn.setEnabled(False)
+        self._removeBtn = QtWidgets.QPushButton("Remove", clicked=self._removeJob)
+        self._queue.changed.connect(self._refreshQueue)
+        self._refreshQueue()
 
-        self._storage.numbered = False
-        self._storage.enabled = True
-        self._storage.tagRequest.connect(self._setScanNames)
-        self._name = self._nameBox.text
+        layout = QtWidgets.QGridLayout()
+        layout.addWidget(self._queueList, 0, 0, 1, 4)
+        layout.addWidget(QtWidgets.QLabel("Priority"), 1, 0)
+        layout.addWidget(self._priority, 1, 1)
+        layout.addWidget(self._queueBtn, 1, 2)
+        layout.addWidget(self._removeBtn, 1, 3)
+        layout.addWidget(self._runQueueBtn, 2, 2)
+        layout.addWidget(self._pauseBtn, 2, 3)
 
-        self._loopCounts = {i: [0, 0] for i, _ in enumerate(self._list) if self._list[i].scanName == "loop"}
+        queueBox = QtWidgets.QGroupBox("Queue")
+        queueBox.setLayout(layout)
+        return queueBox
 
-        self._worker = _ScanWorker(process)
-        self._thread = QtCore.QThread(self)
+    def _plan(self):
+        """
+        Build and validate a ``ScanPlan`` from the configured scan list.
 
-        self._worker.moveToThread(self._thread)
+        A warning is shown if the plan is invalid.
 
-        self._thread.started.connect(self._worker.run)
-        self._worker.startRequested.connect(process.start, QtCore.Qt.QueuedConnection)
-        self._worker.finished.connect(self._thread.quit)
-        self._worker.finished.connect(self._worker.deleteLater)
-        self._thread.finished.connect(self._thread.deleteLater)
-        self._thread.finished.connect(self._scanFinished)
+        Returns:
+            ScanPlan | None: The plan, or None if it is invalid.
+        """
+        axes = [ScanAxis(s.scanName, None if s.scanName == "loop" else s.scanObj, s.scanRange) for s in self._list]
+        plan = ScanPlan(axes, self._detectors[self._detectorsBox.currentText()], exposure=self._exposure.value(), storage=self._storage, name=self._nameBox.text, order=self._order.currentText())
+        try:
+            plan.validate()
+        except ValueError as e:
+            QtWidgets.QMessageBox.warning(self, "Warning", str(e), QtWidgets.QMessageBox.Ok)
+            return None
+        return plan
 
-        self._worker.beforeAcquisition.connect(self._updateName)
+    def _start(self):
+        """
+        Start the configured scan run.
+
+        Builds a ``ScanPlan`` from the configured scan list, validates it and executes it with the ``ScanEngine``.
+        The engine runs in the GUI thread. The GUI stays responsive only because every device wait (``waitForReady()`` and ``startAcq(wait=True)``)
+        runs a nested Qt event loop; a device whose wait blocks without processing events freezes the GUI for its duration.
+        """
+        plan = self._plan()
+        if plan is None:
+            return
 
         self._startBtn.setEnabled(False)
+        self._dryRunBtn.setEnabled(False)
+        self._queueBtn.setEnabled(False)
+        self._runQueueBtn.setEnabled(False)
+        self._removeBtn.setEnabled(False)
         self._stopBtn.setEnabled(True)
-        self._oldName = self._storage.name
-        self._thread.start()
+        self._etaTimer.start()
+        QtCore.QTimer.singleShot(0, lambda: self._engine.run(plan))
 
-    def _scanFinished(self):
+    def _enqueue(self):
         """
-        Handle scan completion and restore GUI and storage state.
+        Add the configured scan to the queue with the selected priority and the current storage settings.
         """
-        self._startBtn.setEnabled(True)
-        self._stopBtn.setEnabled(False)
-        self._storage.name = self._oldName
-        self._storage.numbered = True
-
-        if hasattr(self, "_loopCounts"):
-            del self._loopCounts
-
-    def _updateName(self):
-        """
-        Update the storage file name using current scan parameter values.
-        """
-        name = str(self._name)
-        for i, scan in enumerate(self._list):
-            if scan.scanName == "loop":
-                num = int(self._loopCounts[i][0])
-                value = num
-                index = num
-                n = np.prod([len(self._list[j].scanRange) for j in range(i)])
-                self._loopCounts[i][1] += 1
-                self._loopCounts[i][0] += self._loopCounts[i][1] // n
-                self._loopCounts[i][0] %= len(scan.scanRange)
-                self._loopCounts[i][1] %= n
-            else:
-                value = scan.scanObj.get()[scan.scanName]
-                index = scan.scanIndex
-            name = name.replace("{" + str(i + 1) + "}", value) if type(value) == str else name.replace("{" + str(i + 1) + "}", f"{value:.5g}")
-            name = name.replace("[" + str(i + 1) + "]", str(index))
-        self._storage.name = name
+        plan = self._plan()
+        if plan is None:
+            return
+        self._queue.add(plan, priority=self._priority.value())
 
-    def _stop(self):
+    def _runQueue(self):
         """
-        Request the running scan to stop.
+        Run the queued scans back-to-back.
         """
-        if hasattr(self, "_worker"):
-            QtCore.QMetaObject.invokeMethod(self._worker, "stop", QtCore.Qt.QueuedConnection)
+        self._startBtn.setEnabled(False)
+        self._dryRunBtn.setEnabled(False)
+        self._runQueueBtn.setEnabled(False)
+        self._stopBtn.setEnabled(True)
+        self._pauseBtn.setEnabled(True)
+        self._etaTimer.start()
+        QtCore.QTimer.singleShot(0, self._queue.run)
 
-    def _setScanNames(self, scanNamesDict):
+    def _removeJob(self):
         """
-        Populate the provided mapping with the current scan axis names.
-
-        Args:
-            scanNamesDict (dict): Mutable mapping that will be updated by this method. The key ``'scanNames'`` is set to a list[str] containing the current scan axis names in order.
+        Remove the selected job from the queue.
         """
-        scanNamesDict["scanNames"] = [s.scanName for s in self._list]
+        item = self._queueList.currentItem()
+        if item is None:
+            return
+        try:
+            self._queue.remove(item.data(QtCore.Qt.UserRole))
+        except (ValueError, KeyError) as e:
+            QtWidgets.QMessageBox.warning(self, "Warning", str(e), QtWidgets.QMessageBox.Ok)
 
-    def closeEvent(self, event):
+    def _refreshQueue(self):
         """
-        Event handler for window close event.
-
-        If the scan is running when the window is closed, 
-        this method will force the scan to stop and wait for the thread to finish before accepting the close event.
+        Show the jobs of the queue in execution order.
         """
-        if hasattr(self, "_thread") and self._thread.isRunning():
-            QtCore.QMetaObject.invokeMethod(self._worker, "forceStop", QtCore.Qt.BlockingQueuedConnection)
-            self._thread.quit()
-            self._thread.wait()
-        event.accept()
-
-
-class _ScanWorker(QtCore.QObject):
-    """
-    Worker class to manage a scan process within a separate thread.
-
-    Acts as a bridge between the GUI thread and the scan execution logic. 
-    Handles signal forwarding and provides thread-safe methods to control the lifecycle of a scan process.
-    """
-    # signal emitted to request scan start
-    startRequested = QtCore.pyqtSignal()
+        self._queueList.clear()
+        for job in self._queue.jobs:
+            item = QtWidgets.QListWidgetItem(f"[{job['state']}] {job['title']} (priority {job['priority']}, {job['position']}/{job['points']})")
+            item.setData(QtCore.Qt.UserRole, job["id"])
+            self._queueList.addItem(item)
 
-    # signal emitted when the current process has finished (either after all work is done or after a stop request, once the innermost operation completes)
-    finished = QtCore.pyqtSignal()
-
-    # signal emitted before each acquisition
-    beforeAcquisition = QtCore.pyqtSignal()
-
-    def __init__(self, process):
+    def _dryRun(self):
         """
-        Initialize a scan worker with a given process.
+        Predict the duration of the configured scan and show the report.
 
-        Args:
-            process (object): Process exposing ``start()``, ``stop()``, and ``beforeAcquisition`` and ``finished`` signals.
+        The storage throughput is measured once and reused by later dry runs.
+        """
+        plan = self._plan()
+        if plan is None:
+            return
+        if self._throughput is None and self._storage is not None:
+            self._throughput = measureThroughput(self._storage)
+        report = plan.simulate(throughput=self._throughput)
+        phases = "\n".join(f"  {name}: {_formatTime(t)}" for name, t in report["phases"].items())
+        self._eta.setText(f"Predicted duration: {_formatTime(report['total'])}")
+        QtWidgets.QMessageBox.information(self, "Dry run", f"Points: {report['points']}\nTotal: {_formatTime(report['total'])}\n{phases}\nBottleneck: {report['bottleneck']}")
 
+    def _updateEta(self, *args):
         """
-        super().__init__()
-        self._process = process
-        self._process.beforeAcquisition.connect(self.beforeAcquisition.emit)
-        self._process.finished.connect(self.finished.emit)
+        Show the progress and the remaining time of the running scan.
+        """
+        eta = self._engine.eta
+        if eta is None:
+            return
+        self._eta.setText(f"Point {self._engine.position}/{len(self._engine.table)}, remaining {_formatTime(eta)}")
 
-    @QtCore.pyqtSlot()
-    def run(self):
+    def _scanFinished(self):
         """
-        Start the scan process by emitting the startRequested signal.
+        Handle scan completion and restore GUI state, unless the queue continues with the next scan.
         """
-        self.startRequested.emit()
+        if self._queue.running:
+            return
+        self._etaTimer.stop()
+        self._eta.setText(f"Finished {self._engine.stats['points']} points in {_formatTime(self._engine.stats['elapsed'])}")
+        self._startBtn.setEnabled(True)
+        self._dryRunBtn.setEnabled(True)
+        self._queueBtn.setEnabled(True)
+        self._runQueueBtn.setEnabled(True)
+        self._removeBtn.setEnabled(True)
+        self._stopBtn.setEnabled(False)
+        self._pauseBtn.setEnabled(False)
+        if self._closeRequested:
+            QtCore.QTimer.singleShot(0, self.close)
 
-    @QtCore.pyqtSlot()
-    def stop(self):
+    def _stop(self):
         """
-        Request the scan to stop by emitting the stop signal and invoking the `stop()` method of the process with a queued connection.
+        Request the running scan (and the queue, if it is running) to stop.
         """
-        QtCore.QMetaObject.invokeMethod(self._process, "stop", QtCore.Qt.QueuedConnection)
+        if self._queue.running:
+            self._queue.stop()
+        self._engine.stop()
 
-    @QtCore.pyqtSlot()
-    def forceStop(self):
+    def closeEvent(self, event):
         """
-        Force the scan to stop by invoking the `stop()` method of the process with a blocking connection.
+        Event handler for window close event.
+
+        If the scan or the queue is running when the window is closed, it is stopped and the close event is ignored,
+        because ``ScanEngine.run()`` is still on the call stack. The window is closed again once the scan has finished.
+        The queued jobs are kept and can be run after a restart.
         """
-        QtCore.QMetaObject.invokeMethod(self._process, "stop", QtCore.Qt.BlockingQueuedConnection)
+        if self._engine.running or self._queue.running:
+            self._closeRequested = True
+            self._stop()
+            event.ignore()
+            return
+        event.accept()
+
+
+def _formatTime(seconds):
+    """
+    Format a duration as h:mm:ss.
+
+    Args:
+        seconds (float): Duration (in seconds).
+
+    Returns:
+        str: Formatted duration.
+    """
+    minutes, seconds = divmod(int(round(seconds)), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{seconds:02d}"
 
 
 class _Loop(QtCore.QObject):
@@ -914,155 +984,3 @@ class _Loop(QtCore.QObject):
             dict[str, object]: Mapping of the loop names to respective current values.
         """
         return {self._name: self._value}
-
-
-class _DetectorProcess(QtCore.QObject):
-    """
-    Detector process wrapper.
-
-    Wraps a detector and exposure value and exposes ``start()`` and ``stop()`` used by the scan executor.
-    Emits ``beforeAcquisition`` before starting acquisition.
-    """
-
-    # signal emitted before starting acquisition
-    beforeAcquisition = QtCore.pyqtSignal()
-
-    # signal emitted after acquisition is finished
-    finished = QtCore.pyqtSignal()
-
-    def __init__(self, detector, exposure):
-        """
-        Create a detector process wrapper.
-
-        Args:
-            detector (object): Detector object to control.
-            exposure (float): Exposure time to apply before acquisition.
-        """
-        super().__init__()
-        self._detector = detector
-        self._exposure = exposure
-
-        detector.busyStateChanged.connect(self._busyChanged)
-
-    def start(self):
-        """
-        Start the detector process.
-
-        Configures exposure if provided, emits ``beforeAcquisition`` and starts the detector.
-        """
-        if self._detector.exposure is not None:
-            self._detector.exposure = self._exposure
-        self.beforeAcquisition.emit()
-        self._detector.startAcq()
-
-    def _busyChanged(self, busy):
-        """
-        Handle detector busy-state updates.
-
-        Emits ``finished`` when the detector is not busy anymore.
-        """
-        if not busy:
-            self.finished.emit()
-
-    def stop(self):
-        """
-        Stop the wrapped detector acquisition.
-        """
-        self._detector.stop()
-
-
-class _ScanProcess(QtCore.QObject):
-    """
-    Scan process wrapper.
-
-    Iterates a sequence of values for a single scan axis and delegates to the nested process for acquisition at each value.
-    Exposes ``start()`` and ``stop()``.
-    """
-
-    #: Signal emitted before each acquisition.
-    beforeAcquisition = QtCore.pyqtSignal()
-
-    #: Signal emitted when current scan has finished (either after all work is done or after a stop request).
-    finished = QtCore.pyqtSignal()
-
-    def __init__(self, name, obj, values, process):
-        """
-        Create a scan process for a single axis.
-
-        Args:
-            name (str): Axis name used in ``set()`` calls.
-            obj (object): Controller exposing ``set(..., wait=True)`` and ``get()``.
-            values (Iterable[float | str]): Sequence of values to iterate over (elements are numeric or label strings).
-            process (object): Nested process exposing ``start()`` and ``stop()``.
-        """
-        super().__init__()
-        self._name = name
-        self._obj = obj
-        self._values = list(values)
-        self._process = process
-        self._index = 0
-        self._shouldStop = False
-        self._finished = False
-        self._stopPending = False
-        self._process.beforeAcquisition.connect(self.beforeAcquisition.emit)
-        self._process.finished.connect(self._next)
-
-    @QtCore.pyqtSlot()
-    def start(self):
-        """
-        Start the scan process by iterating over the sequence of values, delegating acquisition to the nested process at each step.
-
-        This method emits ``beforeAcquisition`` before each acquisition and ``finished`` after all acquisitions complete or a stop is requested.
-        Call ``stop()`` to interrupt the scan.
-        """
-        self._index = 0
-        self._shouldStop = False
-        self._finished = False
-        self._next()
-
-    def _next(self):
-        """
-        Advance the scan process by one step.
-
-        If a stop has been requested or all values have been processed, emit ``finished`` and return.
-        Otherwise, set the axis to the next value and start the nested process for acquisition at that value.
-        Waits for the nested process to finish before proceeding.
-        """
-        if self._shouldStop or self._index >= len(self._values):
-            if self._stopPending:
-                self._emitFinished()
-            elif self._shouldStop:
-                self._stopPending = True
-                self._process.finished.connect(self._emitFinished)
-                self._process.stop()
-            else:
-                self._emitFinished()
-            return
-
-        value = self._values[self._index]
-        self._index += 1
-        self._obj.set(**{self._name: value}, wait=True)
-        self._process.start()
-
-    @QtCore.pyqtSlot()
-    def stop(self):
-        """
-        Request a stop and forward the stop request to the nested process.
-
-        The ``finished`` signal is emitted only after each level of the nested process has completed its stop procedure in response to a stop request.
-        """
-        self._shouldStop = True
-        self._stopPending = True
-        self._process.finished.connect(self._emitFinished)
-        self._process.stop()
-
-    def _emitFinished(self):
-        """
-        Emit the ``finished`` signal if the scan has not already been marked as finished.
-
-        This method is idempotent and does not emit the ``finished`` signal if the scan has already been marked as finished.
-        """
-        if self._finished:
-            return
-        self._finished = True
-        self.finished.emit()
@@ -75,7 +75,7 @@ class MultiSwitchGUI(QtWidgets.QWidget):
         for obj in self._objs:
             targ = {name: value for name, value in targetAll.items() if name in obj.nameList}
             if len(targ) > 0:
-                obj.set(**targ)
+                obj.set(**targ, queued=True)
 
     def _busyStateChanged(self):
         """
@@ -137,7 +137,7 @@ class _SwitchRowLayout(QtCore.QObject):
         self._label = QtWidgets.QLabel(label)
         self._label.setAlignment(QtCore.Qt.AlignCenter)
 
-        self._now = QtWidgets.QLineEdit(obj.get()[self._name])
+        self._now = QtWidgets.QLineEdit(obj.get(cached=True)[self._name])
         self._now.setAlignment(QtCore.Qt.AlignCenter)
         self._now.setReadOnly(True)
         self._now.setStyleSheet("background-color: #f0f0f0;")
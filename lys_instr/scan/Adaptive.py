@@ -0,0 +1,275 @@
+import os
+import time
+import numpy as np
+from scipy.spatial import Delaunay
+
+from lys.Qt import QtCore
+
+
+class AdaptiveScan(QtCore.QObject):
+    """
+    Scan that refines the sampling where the signal changes.
+
+    The scan starts from the coarse grid spanned by the values of ``axes``. Each acquisition is reduced to a scalar by ``reduce``,
+    and new points are inserted one at a time until ``maxPoints`` points are acquired or the ``timeBudget`` is exhausted.
+
+    To choose a new point, the acquired points are triangulated (intervals for one axis, Delaunay simplices otherwise) in coordinates normalized to the coarse grid.
+    The loss of a simplex is its longest edge times the sum of the spread of the normalized values at its vertices (the gradient) and ``uncertainty``,
+    which keeps refining large flat regions as well. The new point is the midpoint of the longest edge of the simplex with the largest loss.
+    Simplices whose longest edge is shorter than ``2 * minSpacing`` are not refined.
+
+    Since the points do not form a grid, the data is stored as a point list: if a storage is given, each acquisition is saved as ``<name>_<n>``
+    with the coordinates in the ``scanPoint`` tag, and the list of all coordinates and reduced values is saved as ``<name>_points.npz``.
+
+    Example:
+        >>> scan = AdaptiveScan([ScanAxis("x", motor, np.linspace(0, 1, 5))], detector, lambda data: data[()].mean(), maxPoints=30)
+        >>> points = scan.run()
+        >>> points["x"], points["value"]
+    """
+
+    #: Signal emitted before each acquisition.
+    beforeAcquisition = QtCore.pyqtSignal()
+
+    #: Signal (int, int) emitted after each point with the number of acquired points and ``maxPoints``.
+    progress = QtCore.pyqtSignal(int, int)
+
+    #: Signal emitted when a scan has finished, either after the budget is exhausted or after a stop request.
+    finished = QtCore.pyqtSignal()
+
+    def __init__(self, axes, detector, reduce, maxPoints=100, timeBudget=None, uncertainty=0.1, minSpacing=1e-3, exposure=None, storage=None, name="adaptive"):
+        """
+        Initialize the adaptive scan.
+
+        Args:
+            axes (Sequence[ScanAxis]): Motor axes; the values of each axis define the coarse grid and the range of the scan.
+            detector (MultiDetectorInterface): Detector acquiring at each point.
+            reduce (callable): Function ``reduce(data)`` returning a scalar for the acquired data (mapping of index tuples to frames).
+            maxPoints (int, optional): Maximum number of points, including the coarse grid. Defaults to 100.
+            timeBudget (float | None, optional): Maximum duration of the scan (in seconds). No new point is started if it is not expected to finish in time. Defaults to None (no limit).
+            uncertainty (float, optional): Weight of the simplex size relative to the value spread in the loss. Defaults to 0.1.
+            minSpacing (float, optional): Minimum distance of new points, relative to the range of the coarse grid. Defaults to 1e-3.
+            exposure (float | None, optional): Exposure time set before each acquisition. Defaults to None (unchanged).
+            storage (DataStorage | None, optional): Storage saving the acquisitions and the point list. Defaults to None.
+            name (str, optional): Base file name. Defaults to "adaptive".
+        """
+        super().__init__()
+        self.axes = list(axes)
+        self.detector = detector
+        self.reduce = reduce
+        self.maxPoints = maxPoints
+        self.timeBudget = timeBudget
+        self.uncertainty = uncertainty
+        self.minSpacing = minSpacing
+        self.exposure = exposure
+        self.storage = storage
+        self.name = name
+        self._coords = []
+        self._values = []
+        self._current = None
+        self._shouldStop = False
+        self._running = False
+        self._elapsed = 0.0
+
+    @property
+    def running(self):
+        """
+        Whether a scan is running.
+
+        Returns:
+            bool: True while ``run()`` is executing.
+        """
+        return self._running
+
+    @property
+    def elapsed(self):
+        """
+        Duration of the last (or current) scan.
+
+        Returns:
+            float: Elapsed time (in seconds).
+        """
+        return self._elapsed
+
+    @property
+    def points(self):
+        """
+        Point list of the last (or current) scan, in acquisition order.
+
+        Returns:
+            np.ndarray: Structured array with one coordinate field per axis and the reduced "value".
+        """
+        dtype = [(axis.name, float) for axis in self.axes] + [("value", float)]
+        result = np.zeros(len(self._values), dtype=dtype)
+        if self._values:
+            coords = np.array(self._coords, dtype=float)
+            for i, axis in enumerate(self.axes):
+                result[axis.name] = coords[:, i]
+            result["value"] = self._values
+        return result
+
+    def validate(self):
+        """
+        Check that the scan can be executed.
+
+        Raises:
+            ValueError: If there is no axis, an axis has no controller or fewer than two distinct numeric values, or the coarse grid exceeds ``maxPoints``.
+        """
+        if not self.axes:
+            raise ValueError("An adaptive scan requires at least one axis.")
+        for axis in self.axes:
+            if axis.obj is None or getattr(axis.obj, "labelNames", None) is not None:
+                raise ValueError(f"Axis {axis.name} of an adaptive scan must be a motor axis.")
+            if len(set(axis.values)) < 2:
+                raise ValueError(f"Axis {axis.name} must have at least two distinct values.")
+        if np.prod([len(axis.values) for axis in self.axes]) > self.maxPoints:
+            raise ValueError(f"The coarse grid has more than {self.maxPoints} points.")
+
+    def run(self):
+        """
+        Execute the scan, blocking until the budget is exhausted, no simplex can be refined, or ``stop()`` is called.
+
+        Returns:
+            np.ndarray: Point list (see ``points``).
+
+        Raises:
+            RuntimeError: If a scan is already running.
+            ValueError: If the scan is invalid (see ``validate()``).
+        """
+        if self._running:
+            raise RuntimeError("A scan is already running.")
+        self.validate()
+        self._running = True
+        self._shouldStop = False
+        self._coords, self._values = [], []
+        start = time.perf_counter()
+        storage = self.storage
+        if storage is not None:
+            oldName, oldNumbered = storage.name, storage.numbered
+            storage.numbered = False
+            storage.enabled = True
+            storage.tagRequest.connect(self._setScanPoint)
+        try:
+            grid = np.meshgrid(*[np.asarray(axis.values, dtype=float) for axis in self.axes], indexing="ij")
+            for point in np.stack([g.ravel(order="F") for g in grid], axis=1):
+                if not self._measure(point):
+                    return self.points
+            while len(self._values) < self.maxPoints and not self._shouldStop:
+                elapsed = time.perf_counter() - start
+                if self.timeBudget is not None and elapsed * (len(self._values) + 1) / len(self._values) > self.timeBudget:
+                    break
+                point = self._candidate()
+                if point is None or not self._measure(point):
+                    break
+        finally:
+            if storage is not None:
+                storage.tagRequest.disconnect(self._setScanPoint)
+                self._savePoints(storage)
+                storage.name = oldName
+                storage.numbered = oldNumbered
+            self._elapsed = time.perf_counter() - start
+            self._running = False
+            self.finished.emit()
+        return self.points
+
+    def stop(self):
+        """
+        Request the running scan to stop.
+
+        The acquisition in progress is stopped, and no further point is started.
+        """
+        if not self._running:
+            return
+        self._shouldStop = True
+        if self.detector.isBusy:
+            self.detector.stop()
+
+    def _measure(self, point):
+        """
+        Move to a point, acquire and record the reduced value.
+
+        Args:
+            point (np.ndarray): Coordinate of each axis.
+
+        Returns:
+            bool: True if the acquisition was completed, False if the scan was stopped.
+        """
+        targets = {}
+        for axis, value in zip(self.axes, point):
+            targets.setdefault(id(axis.obj), (axis.obj, {}))[1][axis.name] = float(value)
+        for obj, values in targets.values():
+            obj.set(**values)
+        for obj, _ in targets.values():
+            obj.waitForReady()
+        if self._shouldStop:
+            return False
+        self._current = point
+        if self.storage is not None:
+            self.storage.name = f"{self.name}_{len(self._values)}"
+        if self.exposure is not None and self.detector.exposure is not None:
+            self.detector.exposure = self.exposure
+        self.beforeAcquisition.emit()
+        data = self.detector.startAcq(wait=True, output=True)
+        if self._shouldStop:
+            return False
+        self._coords.append(np.array(point, dtype=float))
+        self._values.append(float(self.reduce(data)))
+        self.progress.emit(len(self._values), self.maxPoints)
+        return True
+
+    def _candidate(self):
+        """
+        Choose the next point from the triangulation of the acquired points.
+
+        Returns:
+            np.ndarray | None: Coordinates of the new point, or None if no simplex can be refined.
+        """
+        low = np.array([min(axis.values) for axis in self.axes], dtype=float)
+        span = np.array([max(axis.values) for axis in self.axes], dtype=float) - low
+        x = (np.array(self._coords) - low) / span
+        y = np.array(self._values)
+        y = (y - y.min()) / (np.ptp(y) or 1)
+        if x.shape[1] == 1:
+            order = np.argsort(x[:, 0])
+            simplices = np.stack([order[:-1], order[1:]], axis=1)
+        else:
+            simplices = Delaunay(x).simplices
+        candidates = []
+        for simplex in simplices:
+            pairs = [(a, b) for i, a in enumerate(simplex) for b in simplex[i + 1:]]
+            lengths = [np.linalg.norm(x[a] - x[b]) for a, b in pairs]
+            longest = int(np.argmax(lengths))
+            size = lengths[longest]
+            if size < 2 * self.minSpacing:
+                continue
+            loss = size * (np.ptp(y[simplex]) + self.uncertainty)
+            candidates.append((loss, pairs[longest]))
+        for _, (a, b) in sorted(candidates, key=lambda c: -c[0]):
+            mid = (x[a] + x[b]) / 2
+            if np.min(np.linalg.norm(x - mid, axis=1)) >= self.minSpacing:
+                return low + mid * span
+        return None
+
+    def _setScanPoint(self, tag):
+        """
+        Add the axis names and the coordinates of the current point to a metadata tag requested by the storage.
+
+        Args:
+            tag (dict): Mutable tag; ``'scanNames'`` is set to the axis names and ``'scanPoint'`` to the mapping of axis names to coordinates.
+        """
+        if self._running:
+            tag["scanNames"] = [axis.name for axis in self.axes]
+            tag["scanPoint"] = {axis.name: float(value) for axis, value in zip(self.axes, self._current)}
+
+    def _savePoints(self, storage):
+        """
+        Save the point list as ``<name>_points.npz`` in the folder of the storage.
+
+        Args:
+            storage (DataStorage): Storage whose base and folder are used.
+        """
+        if not storage.enabled or not self._values:
+            return
+        points = self.points
+        folder = os.path.join(storage.base, storage.folder)
+        os.makedirs(folder, exist_ok=True)
+        np.savez(os.path.join(folder, f"{self.name}_points.npz"), **{field: points[field] for field in points.dtype.names})
@@ -0,0 +1,240 @@
+import threading
+import time
+import numpy as np
+
+from lys.Qt import QtCore
+
+
+class FlyScan(QtCore.QObject):
+    """
+    Fly scan of one motor axis with a free-running detector.
+
+    Instead of stopping at every point, the axis moves once from the first to the last bin edge of the grid ``values`` at a constant velocity,
+    chosen so that ``framesPerPoint`` frames are acquired while the axis crosses one bin. The detector runs continuously during the motion,
+    and the axis position is sampled in a background thread every ``sampling`` seconds.
+
+    After the motion, each frame is tagged with the axis position at the middle of its exposure, interpolated from the position samples,
+    and the frames are averaged per bin of the grid. This removes the acceleration, settling and start/stop overhead of step scans.
+
+    The motor must support speed control (see ``MultiMotorInterface.setSpeed()``); its speed is restored after the scan.
+    Position samples are read with ``get()``, so their rate is limited by the ``coalesceWindow`` of the motor.
+
+    Example:
+        >>> fly = FlyScan(motor, "x", np.linspace(0, 1, 11), detector, framesPerPoint=3)
+        >>> result = fly.run()
+        >>> result["data"].shape
+        (11, 100, 100)
+    """
+
+    #: Signal emitted when a fly scan has finished, either after the motion or after a stop request.
+    finished = QtCore.pyqtSignal()
+
+    def __init__(self, motor, axis, values, detector, framesPerPoint=1, framePeriod=None, runUp=0, sampling=0.002):
+        """
+        Initialize the fly scan.
+
+        Args:
+            motor (MultiMotorInterface): Motor with speed control.
+            axis (str): Name of the axis to scan.
+            values (Sequence[float]): Equally spaced grid of at least two points, i.e., the centers of the bins.
+            detector (MultiDetectorInterface): Detector that acquires continuously with ``startAcq(iter=-1)``.
+            framesPerPoint (int, optional): Number of frames acquired per bin. Defaults to 1.
+            framePeriod (float | None, optional): Time between frames (in seconds). Defaults to the exposure of the detector.
+            runUp (float, optional): Distance before the first and after the last bin edge for the axis to reach and leave the constant velocity. Defaults to 0.
+            sampling (float, optional): Interval of the position samples (in seconds). Defaults to 0.002.
+
+        Raises:
+            ValueError: If ``values`` is not an equally spaced grid of at least two points, or ``framesPerPoint`` is not positive.
+        """
+        super().__init__()
+        values = np.asarray(values, dtype=float)
+        if values.ndim != 1 or len(values) < 2:
+            raise ValueError("A fly scan requires a grid of at least two points.")
+        steps = np.diff(values)
+        if steps[0] == 0 or not np.allclose(steps, steps[0]):
+            raise ValueError("A fly scan requires an equally spaced grid.")
+        if framesPerPoint < 1:
+            raise ValueError(f"framesPerPoint must be positive, got {framesPerPoint}.")
+        self._motor = motor
+        self._axis = axis
+        self._values = values
+        self._step = float(steps[0])
+        self._detector = detector
+        self._framesPerPoint = int(framesPerPoint)
+        self._framePeriod = framePeriod
+        self._runUp = abs(runUp)
+        self._sampling = sampling
+        self._shouldStop = False
+        self._samples = np.zeros((0, 2))
+        self._frames = []
+
+    @property
+    def framePeriod(self):
+        """
+        Time between frames.
+
+        Returns:
+            float: Frame period (in seconds).
+        """
+        return self._framePeriod if self._framePeriod is not None else self._detector.exposure
+
+    @property
+    def velocity(self):
+        """
+        Axis velocity during the scan, which moves the axis by one bin in ``framesPerPoint`` frame periods.
+
+        Returns:
+            float: Velocity (units per second).
+        """
+        return abs(self._step) / (self._framesPerPoint * self.framePeriod)
+
+    @property
+    def edges(self):
+        """
+        Bin edges of the grid.
+
+        Returns:
+            np.ndarray: Edges, one more than the number of points, halfway between neighbouring points.
+        """
+        return np.append(self._values - self._step / 2, self._values[-1] + self._step / 2)
+
+    @property
+    def duration(self):
+        """
+        Expected duration of the motion, including the run-up.
+
+        Returns:
+            float: Duration (in seconds).
+        """
+        return (abs(self._step) * len(self._values) + 2 * self._runUp) / self.velocity
+
+    @property
+    def samples(self):
+        """
+        Position samples of the last scan.
+
+        Returns:
+            np.ndarray: Array of shape (N, 2) of ``time.perf_counter()`` times and axis positions.
+        """
+        return self._samples
+
+    def run(self):
+        """
+        Execute the fly scan, blocking until the motion has finished or ``stop()`` is called.
+
+        Returns:
+            dict: Result of ``bin()`` for the frames acquired during the motion.
+        """
+        self._shouldStop = False
+        self._frames = []
+        direction = np.sign(self._step)
+        edges = self.edges
+        start, end = edges[0] - direction * self._runUp, edges[-1] + direction * self._runUp
+        speed = self._motor.speed[self._axis]
+        samples, connected = [], False
+        sampler = threading.Event()
+        thread = threading.Thread(target=self._sample, args=(sampler, samples), daemon=True)
+        try:
+            self._motor.set(**{self._axis: start}, wait=True)
+            if self._shouldStop:
+                return self.bin()
+            self._motor.setSpeed(**{self._axis: self.velocity})
+            thread.start()
+            self._detector.dataAcquired.connect(self._onAcquired, type=QtCore.Qt.DirectConnection)
+            connected = True
+            self._detector.startAcq(iter=-1)
+            moveStart = time.perf_counter()
+            self._motor.set(**{self._axis: end}, wait=True)
+            moveEnd = time.perf_counter()
+        finally:
+            if connected:
+                self._detector.dataAcquired.disconnect(self._onAcquired)
+                self._detector.stop()
+            sampler.set()
+            if thread.is_alive():
+                thread.join()
+            self._motor.setSpeed(**{self._axis: speed})
+            self._samples = np.array(samples, dtype=float).reshape(-1, 2)
+            self.finished.emit()
+        exposure = self.framePeriod
+        self._frames = [(t, data) for t, data in self._frames if t - exposure >= moveStart and t <= moveEnd]
+        return self.bin()
+
+    def stop(self):
+        """
+        Request the fly scan to stop, stopping the motor at its current position.
+        """
+        self._shouldStop = True
+        self._motor.stop()
+
+    def positions(self):
+        """
+        Axis positions of the frames of the last scan, interpolated at the middle of their exposure.
+
+        Returns:
+            np.ndarray: Position of each frame, in acquisition order.
+        """
+        if len(self._frames) == 0 or len(self._samples) == 0:
+            return np.zeros(0)
+        times = np.array([t for t, _ in self._frames]) - self.framePeriod / 2
+        return np.interp(times, self._samples[:, 0], self._samples[:, 1])
+
+    def bin(self):
+        """
+        Average the frames of the last scan on the grid.
+
+        Frames of a detector with an index grid are averaged per index, so that the binned data has the shape ``(len(values), *indexShape, *frameShape)``.
+        Bins without frames are NaN.
+
+        Returns:
+            dict: "values" is the grid, "data" the averaged frames, "counts" the number of frames per bin (and index),
+            and "positions" the interpolated position of each frame.
+        """
+        positions = self.positions()
+        n = len(self._values)
+        bins = np.floor((positions - self.edges[0]) / self._step).astype(int)
+        sums, counts = {}, {}
+        for b, (_, data) in zip(bins, self._frames):
+            if not 0 <= b < n:
+                continue
+            for idx, frame in data.items():
+                key = (b, *idx)
+                sums[key] = sums.get(key, 0) + np.asarray(frame, dtype=float)
+                counts[key] = counts.get(key, 0) + 1
+        indexShape = tuple(getattr(self._detector, "indexShape", ()))
+        frameShape = tuple(getattr(self._detector, "frameShape", next(iter(sums.values())).shape if sums else ()))
+        data = np.full((n, *indexShape, *frameShape), np.nan)
+        count = np.zeros((n, *indexShape), dtype=int)
+        for key, value in sums.items():
+            data[key] = value / counts[key]
+            count[key] = counts[key]
+        return {"values": self._values.copy(), "data": data, "counts": count, "positions": positions}
+
+    def _onAcquired(self, data):
+        """
+        Record acquired frames with their arrival time.
+
+        Connected directly to ``dataAcquired`` of the detector, so that the time is taken as soon as the frames are delivered.
+
+        Args:
+            data (dict[tuple, np.ndarray]): Mapping of index tuples to frames.
+        """
+        if data:
+            self._frames.append((time.perf_counter(), dict(data)))
+
+    def _sample(self, event, samples):
+        """
+        Sample the axis position until ``event`` is set. Executed in a background thread.
+
+        Each sample is timed at the middle of the read.
+
+        Args:
+            event (threading.Event): Event that ends the sampling.
+            samples (list): List to which (time, position) pairs are appended.
+        """
+        while True:
+            before = time.perf_counter()
+            position = self._motor.get()[self._axis]
+            samples.append(((before + time.perf_counter()) / 2, position))
+            if event.wait(self._sampling):
+                return
@@ -0,0 +1,196 @@
+import numpy as np
+
+
+def naturalOrder(plan, table):
+    """
+    Keep the nested order, in which every inner axis returns to its first value at each outer step.
+
+    Args:
+        plan (ScanPlan): Scan plan.
+        table (np.ndarray): Point table in nested order.
+
+    Returns:
+        np.ndarray: Row order (identity permutation).
+    """
+    return np.arange(len(table))
+
+
+def snakeOrder(plan, table):
+    """
+    Order points as a serpentine (boustrophedon) path.
+
+    Each axis is traversed backwards when the sum of the indices of the axes outside it is odd, so that consecutive points differ in a single axis by one step
+    and no axis flies back to its first value.
+
+    Args:
+        plan (ScanPlan): Scan plan.
+        table (np.ndarray): Point table in nested order.
+
+    Returns:
+        np.ndarray: Row order.
+    """
+    index = table["index"]
+    shape = np.array(plan.shape)
+    snake = index.copy()
+    outer = np.zeros(len(table), dtype=int)
+    for level in reversed(range(index.shape[1])):
+        reverse = outer % 2 == 1
+        snake[reverse, level] = shape[level] - 1 - index[reverse, level]
+        outer += snake[:, level]
+    return _linearIndex(snake, shape)
+
+
+def hilbertOrder(plan, table):
+    """
+    Order the two innermost axes along a Hilbert curve, keeping the outer axes nested.
+
+    A Hilbert curve visits neighbouring grid points consecutively and stays local, which suits stages whose moves are
+    slow in both directions. The grid is embedded into the smallest power-of-two square and unused cells are skipped.
+    The curve is traversed backwards at every other outer step, so that it starts where the previous traversal ended.
+
+    Args:
+        plan (ScanPlan): Scan plan with at least two axes.
+        table (np.ndarray): Point table in nested order.
+
+    Returns:
+        np.ndarray: Row order.
+
+    Raises:
+        ValueError: If the plan has fewer than two axes.
+    """
+    if len(plan.axes) < 2:
+        raise ValueError("Hilbert ordering requires at least two axes.")
+    index = table["index"]
+    n = 1 << int(np.ceil(np.log2(max(plan.shape[0], plan.shape[1], 2))))
+    d = _hilbertIndex(n, index[:, 0], index[:, 1])
+    outer = _linearIndex(index[:, 2:], plan.shape[2:])
+    return np.lexsort((np.where(outer % 2 == 1, -d, d), outer))
+
+
+def nearestOrder(plan, table, speeds=None):
+    """
+    Order points by the nearest-neighbour heuristic of the travelling salesman problem.
+
+    This is intended for irregular (free) point lists. Starting from the first point, the next point is always the unvisited point
+    that is reached in the shortest time, where the time is the sum over the motor axes of the distance divided by the axis speed.
+    Switch and loop axes are not reordered: the motor axes are ordered within each combination of them.
+
+    Args:
+        plan (ScanPlan): Scan plan.
+        table (np.ndarray): Point table in nested order.
+        speeds (Sequence[float | None] | None, optional): Speed of each axis. Defaults to ``ScanAxis.speed``, or 1 if not given.
+
+    Returns:
+        np.ndarray: Row order.
+    """
+    motors = [i for i, axis in enumerate(plan.axes) if _isMotor(axis)]
+    others = [i for i in range(len(plan.axes)) if i not in motors]
+    if speeds is None:
+        speeds = [axis.speed for axis in plan.axes]
+    weights = np.array([1 / (speeds[i] or 1) for i in motors])
+    coords = np.stack([table[plan.fields[i]] for i in motors], axis=1) * weights if motors else np.zeros((len(table), 0))
+    groups = _linearIndex(table["index"][:, others], [plan.shape[i] for i in others])
+
+    order = []
+    last = None
+    for group in np.unique(groups):
+        rows = np.flatnonzero(groups == group)
+        remaining = np.ones(len(rows), dtype=bool)
+        current = 0 if last is None else int(np.argmin(np.abs(coords[rows] - coords[last]).sum(axis=1)))
+        for _ in range(len(rows)):
+            remaining[current] = False
+            order.append(rows[current])
+            if not remaining.any():
+                break
+            dist = np.abs(coords[rows] - coords[rows[current]]).sum(axis=1)
+            dist[~remaining] = np.inf
+            current = int(np.argmin(dist))
+        last = order[-1]
+    return np.array(order, dtype=int)
+
+
+#: Ordering strategies available by name in ``ScanPlan(order=...)``.
+ORDERS = {"natural": naturalOrder, "snake": snakeOrder, "hilbert": hilbertOrder, "nearest": nearestOrder}
+
+
+def estimateTravel(plan, table):
+    """
+    Estimate the travel of each axis and the time spent moving when the points are visited in table order.
+
+    The time of a motor axis move is the distance divided by ``ScanAxis.speed``. The time of a step is the longest move of the step
+    if the plan moves axes concurrently, and the sum of the moves otherwise. Axes without speed contribute to the travel but not to the time.
+
+    Args:
+        plan (ScanPlan): Scan plan.
+        table (np.ndarray): Point table in the order to evaluate.
+
+    Returns:
+        dict: "travel" maps the field of each motor axis to its total travel, "moves" maps it to the number of moves,
+        and "time" is the estimated motion time (in seconds).
+    """
+    travel, moves, times = {}, {}, [np.zeros(max(len(table) - 1, 0))]
+    for i, axis in enumerate(plan.axes):
+        if not _isMotor(axis):
+            continue
+        field = plan.fields[i]
+        steps = np.abs(np.diff(table[field]))
+        travel[field] = float(steps.sum())
+        moves[field] = int(np.count_nonzero(steps))
+        if axis.speed:
+            times.append(steps / axis.speed)
+    times = np.max(times, axis=0) if plan.concurrent else np.sum(times, axis=0)
+    return {"travel": travel, "moves": moves, "time": float(times.sum())}
+
+
+def compareOrders(plan, orders=None):
+    """
+    Estimate travel and motion time of a scan plan for several ordering strategies.
+
+    Args:
+        plan (ScanPlan): Scan plan.
+        orders (Iterable[str] | None, optional): Names of the strategies in ``ORDERS``. Defaults to all strategies applicable to the plan.
+
+    Returns:
+        dict[str, dict]: Mapping of strategy names to the estimates of ``estimateTravel()``.
+    """
+    if orders is None:
+        orders = [name for name in ORDERS if name != "hilbert" or len(plan.axes) >= 2]
+    table = plan.points(order="natural")
+    return {name: estimateTravel(plan, table[ORDERS[name](plan, table)]) for name in orders}
+
+
+def _isMotor(axis):
+    """
+    Whether an axis is a numeric controller axis, whose moves take time proportional to the distance.
+    """
+    return axis.obj is not None and getattr(axis.obj, "labelNames", None) is None
+
+
+def _linearIndex(index, shape):
+    """
+    Row number of multi-indices (innermost first) in nested order.
+    """
+    result = np.zeros(len(index), dtype=int)
+    for level in reversed(range(len(shape))):
+        result = result * shape[level] + index[:, level]
+    return result
+
+
+def _hilbertIndex(n, x, y):
+    """
+    Distance along the Hilbert curve filling an ``n`` x ``n`` grid (``n`` a power of two) of the cells (x, y).
+    """
+    x, y = x.astype(np.int64).copy(), y.astype(np.int64).copy()
+    d = np.zeros(len(x), dtype=np.int64)
+    s = n // 2
+    while s > 0:
+        rx = (x & s) > 0
+        ry = (y & s) > 0
+        d += s * s * ((3 * rx) ^ ry)
+        # Rotate the quadrant so that the sub-curve is traversed in the right orientation
+        flip = ~ry
+        swap = flip & rx
+        x[swap], y[swap] = n - 1 - x[swap], n - 1 - y[swap]
+        x[flip], y[flip] = y[flip], x[flip].copy()
+        s //= 2
+    return d
@@ -0,0 +1,430 @@
+import json
+import logging
+import os
+import time
+
+from lys.Qt import QtCore
+from .ScanEngine import ScanAxis, ScanPlan, ScanEngine
+
+
+class ScanQueue(QtCore.QObject):
+    """
+    Persistent queue of scan plans executed back-to-back.
+
+    Plans are enqueued with ``add()`` together with a priority and the storage settings they are saved with.
+    ``run()`` executes the queued jobs with a ``ScanEngine``, highest priority first and in the order of addition for equal priorities,
+    until the queue is empty, ``pause()`` or ``stop()`` is called.
+
+    ``pause()`` finishes the point in progress; the paused job keeps its position and continues there when the queue is run again.
+    ``stop()`` aborts the acquisition in progress and marks the job as stopped.
+
+    The queue is saved to ``path`` whenever it changes and during a scan (at most every ``saveInterval`` seconds), and loaded on creation.
+    The queue is saved as JSON. Jobs refer to their devices by name, so the devices are passed as a mapping of names to objects, e.g., ``DeviceLauncher.devices``.
+    A job interrupted by a restart continues at the last saved position. The ``process`` function of a plan is not saved.
+
+    Example:
+        >>> queue = ScanQueue(launcher.devices, storage)
+        >>> queue.add(ScanPlan([ScanAxis("x", motor, np.linspace(0, 1, 11))], detector, name="x_[1]"), priority=1, folder="overnight")
+        >>> queue.run()
+    """
+
+    #: Signal emitted when jobs are added, removed, reordered or change their state or position.
+    changed = QtCore.pyqtSignal()
+
+    #: Signal (int) emitted with the id of a job when it starts.
+    jobStarted = QtCore.pyqtSignal(int)
+
+    #: Signal (int) emitted with the id of a job when it is done, stopped, failed or paused.
+    jobFinished = QtCore.pyqtSignal(int)
+
+    #: Signal emitted when ``run()`` returns.
+    finished = QtCore.pyqtSignal()
+
+    def __init__(self, devices, storage=None, path=".lys/lys_instr/scanQueue", engine=None, saveInterval=1):
+        """
+        Initialize the queue and load the saved jobs.
+
+        Args:
+            devices (dict[str, object]): Mapping of names to the controllers and detectors used by the jobs.
+            storage (DataStorage | None, optional): Storage used by all jobs, with the settings of each job applied while it runs. Defaults to None.
+            path (str | None, optional): File the queue is saved to. Defaults to ``.lys/lys_instr/scanQueue``. If None, the queue is not saved.
+            engine (ScanEngine | None, optional): Engine executing the jobs. Defaults to a new engine.
+            saveInterval (float, optional): Minimum interval (in seconds) between saves of the position of the running job. Defaults to 1.
+        """
+        super().__init__()
+        self._devices = devices
+        self._storage = storage
+        self._path = path
+        self._engine = engine if engine is not None else ScanEngine()
+        self._saveInterval = saveInterval
+        self._jobs = []
+        self._nextId = 0
+        self._current = None
+        self._running = False
+        self._paused = False
+        self._stopped = False
+        self._lastSave = 0
+        self._engine.progress.connect(self._onProgress)
+        self.load()
+
+    @property
+    def engine(self):
+        """
+        Engine executing the jobs.
+
+        Returns:
+            ScanEngine: The engine.
+        """
+        return self._engine
+
+    @property
+    def running(self):
+        """
+        Whether the queue is running.
+
+        Returns:
+            bool: True while ``run()`` is executing.
+        """
+        return self._running
+
+    @property
+    def paused(self):
+        """
+        Whether the queue was paused. ``run()`` resumes it.
+
+        Returns:
+            bool: True after ``pause()`` until the queue is run again.
+        """
+        return self._paused
+
+    @property
+    def current(self):
+        """
+        Id of the running job.
+
+        Returns:
+            int | None: Id of the running job, or None if no job is running.
+        """
+        return self._current
+
+    @property
+    def jobs(self):
+        """
+        All jobs in execution order: queued jobs by priority and order of addition, followed by finished jobs.
+
+        Each job is a dictionary with the keys "id", "title", "priority", "state" ("queued", "running", "done", "stopped" or "failed"),
+        "position" (number of acquired points), "points" (total number of points), "error", "plan" (settings of the plan) and "storage" (storage settings).
+
+        Returns:
+            list[dict]: Copies of the jobs.
+        """
+        return [dict(job) for job in sorted(self._jobs, key=self._sortKey)]
+
+    def add(self, plan, priority=0, title=None, base=None, folder=None):
+        """
+        Add a scan plan to the queue.
+
+        Args:
+            plan (ScanPlan): Scan to execute. Its controllers and detector must be values of ``devices``.
+            priority (int, optional): Jobs of higher priority run first. Defaults to 0.
+            title (str | None, optional): Title shown in the queue. Defaults to the name template of the plan, or the axis names if it has none.
+            base (str | None, optional): Base directory of the storage for this job. Defaults to the current base of the storage.
+            folder (str | None, optional): Folder of the storage for this job. Defaults to the current folder of the storage.
+
+        Returns:
+            int: Id of the job.
+
+        Raises:
+            ValueError: If the plan is invalid or uses a device that is not in ``devices``.
+        """
+        plan.validate()
+        storage = {}
+        if self._storage is not None:
+            storage = {"base": str(base if base is not None else self._storage.base), "folder": str(folder if folder is not None else self._storage.folder)}
+        job = {
+            "id": self._nextId,
+            "title": title if title is not None else (str(plan.name) if plan.name else ", ".join(axis.name for axis in plan.axes)),
+            "priority": int(priority),
+            "state": "queued",
+            "position": 0,
+            "points": len(plan),
+            "error": None,
+            "plan": self._planSettings(plan),
+            "storage": storage,
+        }
+        self._nextId += 1
+        self._jobs.append(job)
+        self._changed()
+        return job["id"]
+
+    def remove(self, id):
+        """
+        Remove a job that is not running.
+
+        Args:
+            id (int): Id of the job.
+
+        Raises:
+            ValueError: If the job is running.
+            KeyError: If there is no job of the given id.
+        """
+        job = self._job(id)
+        if job["state"] == "running":
+            raise ValueError(f"Job {id} is running.")
+        self._jobs.remove(job)
+        self._changed()
+
+    def setPriority(self, id, priority):
+        """
+        Change the priority of a job.
+
+        Args:
+            id (int): Id of the job.
+            priority (int): New priority.
+
+        Raises:
+            KeyError: If there is no job of the given id.
+        """
+        self._job(id)["priority"] = int(priority)
+        self._changed()
+
+    def requeue(self, id):
+        """
+        Queue a finished job again, continuing at its position (or from the start if it was done).
+
+        Args:
+            id (int): Id of the job.
+
+        Raises:
+            KeyError: If there is no job of the given id.
+        """
+        job = self._job(id)
+        if job["state"] == "running":
+            return
+        if job["state"] == "done":
+            job["position"] = 0
+        job["state"], job["error"] = "queued", None
+        self._changed()
+
+    def clear(self):
+        """
+        Remove all jobs that are not running.
+        """
+        self._jobs = [job for job in self._jobs if job["state"] == "running"]
+        self._changed()
+
+    def run(self):
+        """
+        Execute the queued jobs, blocking until the queue is empty or ``pause()`` or ``stop()`` is called.
+
+        A job whose plan fails (e.g., a device is missing or raises an error) is marked as failed, and the queue continues with the next job.
+
+        Raises:
+            RuntimeError: If the queue is already running, or the engine is running another scan.
+        """
+        if self._running:
+            raise RuntimeError("The scan queue is already running.")
+        self._checkEngine()
+        self._running = True
+        self._paused = self._stopped = False
+        try:
+            while not self._paused and not self._stopped:
+                job = next((job for job in self.jobs if job["state"] == "queued"), None)
+                if job is None:
+                    break
+                self._runJob(self._job(job["id"]))
+        finally:
+            self._running = False
+            self.finished.emit()
+
+    def pause(self):
+        """
+        Pause the queue at the next point boundary.
+
+        The point in progress is completed and the running job stays queued at its position. ``run()`` continues there.
+        """
+        if self._running:
+            self._paused = True
+            self._engine.pause()
+
+    def stop(self):
+        """
+        Stop the queue, aborting the acquisition in progress. The running job is marked as stopped.
+        """
+        if self._running:
+            self._stopped = True
+            self._engine.stop()
+
+    def save(self):
+        """
+        Save the queue to ``path``.
+        """
+        if self._path is None:
+            return
+        os.makedirs(os.path.dirname(self._path) or ".", exist_ok=True)
+        with open(self._path, "w") as file:
+            json.dump({"nextId": self._nextId, "jobs": self._jobs}, file)
+        self._lastSave = time.perf_counter()
+
+    def load(self):
+        """
+        Load the queue from ``path``, replacing the current jobs.
+
+        Jobs that were running when the queue was saved are queued again at their saved position.
+        A file that cannot be read is ignored with a warning.
+        """
+        if self._path is None or not os.path.exists(self._path):
+            return
+        try:
+            with open(self._path, "r") as file:
+                d = json.load(file)
+        except ValueError as e:
+            logging.warning(f"Scan queue {self._path} could not be loaded: {e}")
+            return
+        self._nextId = d["nextId"]
+        self._jobs = d["jobs"]
+        for job in self._jobs:
+            if job["state"] == "running":
+                job["state"] = "queued"
+        self.changed.emit()
+
+    def _runJob(self, job):
+        """
+        Execute a job with the engine, applying its storage settings while it runs.
+
+        Args:
+            job (dict): Job to execute.
+
+        Raises:
+            RuntimeError: If the engine is running another scan. The job is left queued.
+        """
+        self._checkEngine()
+        storage = self._storage
+        if storage is not None and job["storage"]:
+            old = storage.base, storage.folder
+            storage.base, storage.folder = job["storage"]["base"], job["storage"]["folder"]
+        self._current = job["id"]
+        job["state"] = "running"
+        self._changed()
+        self.jobStarted.emit(job["id"])
+        try:
+            plan = self._plan(job)
+            if job["position"] < len(plan):
+                self._engine.run(plan, start=job["position"])
+                job["position"] = self._engine.position
+            if job["position"] >= len(plan):
+                job["state"] = "done"
+            else:
+                job["state"] = "stopped" if self._stopped else "queued"
+        except Exception as e:
+            logging.warning(f"Scan job {job['id']} ({job['title']}) failed: {e}")
+            job["state"], job["error"] = "failed", str(e)
+        finally:
+            if storage is not None and job["storage"]:
+                storage.base, storage.folder = old
+            self._current = None
+            self._changed()
+            self.jobFinished.emit(job["id"])
+
+    def _onProgress(self, position, total):
+        """
+        Record the position of the running job, saving the queue at most every ``saveInterval`` seconds.
+
+        Args:
+            position (int): Number of finished points.
+            total (int): Total number of points.
+        """
+        if self._current is None:
+            return
+        self._job(self._current)["position"] = position
+        if time.perf_counter() - self._lastSave >= self._saveInterval:
+            self.save()
+        self.changed.emit()
+
+    def _checkEngine(self):
+        """
+        Check that the engine is free to execute a job.
+
+        Raises:
+            RuntimeError: If the engine is running another scan.
+        """
+        if self._engine.running:
+            raise RuntimeError("The scan engine is running another scan.")
+
+    def _changed(self):
+        """
+        Save the queue and emit ``changed``.
+        """
+        self.save()
+        self.changed.emit()
+
+    def _job(self, id):
+        """
+        Return the job of the given id.
+
+        Raises:
+            KeyError: If there is no job of the given id.
+        """
+        for job in self._jobs:
+            if job["id"] == id:
+                return job
+        raise KeyError(f"No scan job with id {id}.")
+
+    @staticmethod
+    def _sortKey(job):
+        """
+        Sort key of the execution order: running and queued jobs first, then by descending priority and ascending id.
+        """
+        return (job["state"] not in ("running", "queued"), -job["priority"], job["id"])
+
+    def _deviceName(self, obj):
+        """
+        Name of a device in ``devices``.
+
+        Raises:
+            ValueError: If the device is not in ``devices``.
+        """
+        for name, device in self._devices.items():
+            if device is obj:
+                return name
+        raise ValueError(f"{type(obj).__name__} is not a device of the scan queue.")
+
+    def _planSettings(self, plan):
+        """
+        Convert a plan into a mapping of plain values that can be saved.
+
+        Args:
+            plan (ScanPlan): Scan plan.
+
+        Returns:
+            dict: Settings of the plan, with devices referred to by name and numbers converted to builtin types.
+        """
+        axes = [{"name": axis.name, "device": None if axis.obj is None else self._deviceName(axis.obj), "values": [v if isinstance(v, str) else float(v) for v in axis.values],
+                 "speed": _optionalFloat(axis.speed), "acceleration": _optionalFloat(axis.acceleration)} for axis in plan.axes]
+        return {"axes": axes, "detector": self._deviceName(plan.detector), "exposure": _optionalFloat(plan.exposure), "name": None if plan.name is None else str(plan.name),
+                "order": plan.order, "concurrent": bool(plan.concurrent), "pipelined": bool(plan.pipelined)}
+
+    def _plan(self, job):
+        """
+        Build the plan of a job from its settings.
+
+        Args:
+            job (dict): Job.
+
+        Returns:
+            ScanPlan: Scan plan using the devices and the storage of the queue.
+
+        Raises:
+            KeyError: If a device of the job is not in ``devices``.
+        """
+        settings = job["plan"]
+        axes = [ScanAxis(a["name"], None if a["device"] is None else self._devices[a["device"]], a["values"], speed=a["speed"], acceleration=a["acceleration"]) for a in settings["axes"]]
+        return ScanPlan(axes, self._devices[settings["detector"]], exposure=settings["exposure"], storage=self._storage, name=settings["name"],
+                        order=settings["order"], concurrent=settings["concurrent"], pipelined=settings["pipelined"])
+
+
+def _optionalFloat(value):
+    """
+    Convert a number to float, keeping None.
+    """
+    return None if value is None else float(value)
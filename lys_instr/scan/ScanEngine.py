@@ -0,0 +1,564 @@
+import re
+import time
+import numpy as np
+
+from lys.Qt import QtCore
+from .Ordering import ORDERS, estimateTravel, compareOrders
+from .Simulator import simulate
+
+
+#: Placeholders of the name template: ``{i}`` for the value and ``[i]`` for the index of the i-th axis.
+_PLACEHOLDER = re.compile(r"\{(\d+)\}|\[(\d+)\]")
+
+
+class ScanAxis:
+    """
+    Declarative description of one scan axis.
+
+    An axis is a controller axis (motor or switch) and the sequence of values it takes during the scan.
+    An axis without controller (``obj=None``) only repeats the inner scan, as the "loop" rows of ``ScanWidget``.
+    """
+
+    def __init__(self, name, obj, values, speed=None, acceleration=None):
+        """
+        Initialize the scan axis.
+
+        Args:
+            name (str): Axis name used in ``obj.set()`` and in the ``scanNames`` tag of saved data.
+            obj (MultiControllerInterface | None): Controller of the axis, or None for a pure repetition.
+            values (Iterable[float | str]): Values (numbers or switch labels) the axis takes.
+            speed (float | None, optional): Speed of the axis (units per second), used to estimate motion times. Defaults to None (unknown).
+            acceleration (float | None, optional): Acceleration of the axis (units per second squared), used by ``ScanPlan.simulate()``. Defaults to None (infinite).
+        """
+        self.name = name
+        self.obj = obj
+        self.values = list(values)
+        self.speed = speed
+        self.acceleration = acceleration
+
+    def __len__(self):
+        return len(self.values)
+
+
+class ScanPlan:
+    """
+    Declarative description of a nested scan.
+
+    The axes are nested with the first axis innermost, as in the scan list of ``ScanWidget``.
+    At every point, the detector acquires once; if a storage is given, its file name is composed from ``name``.
+    In ``name``, ``{i}`` is replaced by the value and ``[i]`` by the index of the i-th axis (counted from 1).
+
+    Before running, the plan is compiled by ``points()`` into a table of all points, which allows validation, progress and ETA reporting,
+    and resuming a scan at any point.
+
+    The points are visited in the nested order by default. Other strategies of ``lys_instr.scan.Ordering.ORDERS`` ("snake", "hilbert", "nearest")
+    reduce the travel of slow stages; ``compareOrders()`` estimates the travel and motion time of each of them.
+    Since every point keeps its multi-index, file names and indices do not depend on the order.
+
+    When several axes change at a point (e.g., an inner axis wraps while an outer one steps), they are moved concurrently by default:
+    all controllers are commanded first and then waited for, so the step takes as long as the longest move.
+    With ``concurrent=False``, the axes are moved one after another, outer axes first, e.g., to avoid collisions.
+
+    The scan is pipelined by default: the moves to the next point are commanded as soon as an acquisition has finished,
+    and the acquired data is processed (``process`` and the storage hand-off) while the axes move.
+    Pipelining requires concurrent moves; with ``concurrent=False`` or ``pipelined=False``, each stage waits for the previous one.
+    """
+
+    def __init__(self, axes, detector, exposure=None, storage=None, name=None, order="natural", concurrent=True, pipelined=True, process=None):
+        """
+        Initialize the scan plan.
+
+        Args:
+            axes (Sequence[ScanAxis]): Scan axes, innermost first.
+            detector (MultiDetectorInterface): Detector acquiring at every point.
+            exposure (float | None, optional): Exposure time set before each acquisition, if the detector supports exposure. Defaults to None (unchanged).
+            storage (DataStorage | None, optional): Storage saving the acquired data. Defaults to None.
+            name (str | None, optional): File name template. Defaults to None (the storage name is not changed).
+            order (str, optional): Name of the ordering strategy. Defaults to "natural".
+            concurrent (bool, optional): If True, axes changing at the same point are moved concurrently. Defaults to True.
+            pipelined (bool, optional): If True, the data of a point is processed while the axes move to the next point. Defaults to True.
+            process (callable | None, optional): Function ``process(point, data)`` called after each acquisition with the row of the point table and
+                the acquired data (mapping of index tuples to frames). Defaults to None.
+        """
+        self.axes = list(axes)
+        self.detector = detector
+        self.exposure = exposure
+        self.storage = storage
+        self.name = name
+        self.order = order
+        self.concurrent = concurrent
+        self.pipelined = pipelined
+        self.process = process
+
+    @property
+    def shape(self):
+        """
+        Number of values of each axis, innermost first.
+
+        Returns:
+            tuple[int, ...]: Axis lengths.
+        """
+        return tuple(len(axis) for axis in self.axes)
+
+    def __len__(self):
+        n = 1
+        for axis in self.axes:
+            n *= len(axis)
+        return n
+
+    @property
+    def fields(self):
+        """
+        Field names of the axes in the point table.
+
+        The field of an axis is its name. If several axes share a name (e.g., two "loop" axes), the later ones are suffixed with their position (counted from 1), e.g., "loop_3".
+
+        Returns:
+            list[str]: Field name of each axis, innermost first.
+        """
+        fields = []
+        for i, axis in enumerate(self.axes):
+            fields.append(axis.name if axis.name not in fields and axis.name != "index" else f"{axis.name}_{i + 1}")
+        return fields
+
+    def points(self, order=None):
+        """
+        Compile the plan into a table of all points in execution order.
+
+        Args:
+            order (str | None, optional): Name of the ordering strategy. Defaults to ``order`` of the plan.
+
+        Returns:
+            np.ndarray: Structured array with one row per point. The field "index" holds the index of each axis (innermost first),
+            and the fields given by ``fields`` hold the axis values (float for numeric axes, str for labels).
+        """
+        shape = self.shape
+        n = len(self)
+        if len(shape) > 0:
+            index = np.indices(shape[::-1]).reshape(len(shape), -1)[::-1].T
+        else:
+            index = np.zeros((n, 0), dtype=int)
+        values = [np.asarray(axis.values) for axis in self.axes]
+        dtype = [("index", np.int64, (len(shape),))] + [(f, v.dtype if v.dtype.kind in "U" else float) for f, v in zip(self.fields, values)]
+        table = np.zeros(n, dtype=dtype)
+        table["index"] = index
+        for i, (f, v) in enumerate(zip(self.fields, values)):
+            table[f] = v[index[:, i]]
+        return table[ORDERS[order or self.order](self, table)]
+
+    def estimate(self):
+        """
+        Estimate travel and motion time of the plan in its order.
+
+        Returns:
+            dict: Estimates as returned by ``lys_instr.scan.Ordering.estimateTravel()``.
+        """
+        return estimateTravel(self, self.points())
+
+    def simulate(self, **models):
+        """
+        Predict the duration of the plan without moving or acquiring (dry run).
+
+        Args:
+            **models: Parameters of the timing models passed to ``lys_instr.scan.Simulator.simulate()``, e.g., ``readout`` or ``throughput``.
+
+        Returns:
+            dict: Prediction with total duration, per-phase breakdown and bottleneck, as returned by ``lys_instr.scan.Simulator.simulate()``.
+        """
+        return simulate(self, **models)
+
+    def compareOrders(self, orders=None):
+        """
+        Estimate travel and motion time of the plan for several ordering strategies.
+
+        Args:
+            orders (Iterable[str] | None, optional): Names of the strategies. Defaults to all strategies applicable to the plan.
+
+        Returns:
+            dict[str, dict]: Mapping of strategy names to estimates as returned by ``lys_instr.scan.Ordering.estimateTravel()``.
+        """
+        return compareOrders(self, orders)
+
+    def validate(self):
+        """
+        Check the plan before running it.
+
+        Raises:
+            ValueError: If the ordering strategy is unknown, the plan has no point, an axis is not provided by its controller,
+                a numeric value is not finite, or a label is not provided by its switch.
+        """
+        if self.order not in ORDERS:
+            raise ValueError(f"Unknown scan order '{self.order}'. Available orders: {list(ORDERS)}")
+        if len(self) == 0:
+            raise ValueError("The scan plan has no point.")
+        for axis in self.axes:
+            if axis.obj is None:
+                continue
+            if axis.name not in axis.obj.nameList:
+                raise ValueError(f"Axis '{axis.name}' is not provided by {type(axis.obj).__name__}. Available axes: {axis.obj.nameList}")
+            labels = getattr(axis.obj, "labelNames", None)
+            if labels is not None:
+                invalid = [v for v in axis.values if v not in labels]
+                if invalid:
+                    raise ValueError(f"Label(s) {invalid} of axis '{axis.name}' not recognized. Available labels: {labels}")
+            elif not np.all(np.isfinite(np.asarray(axis.values, dtype=float))):
+                raise ValueError(f"Axis '{axis.name}' has non-finite values.")
+
+    def fileName(self, indices):
+        """
+        Compose the file name of a scan point from the name template.
+
+        Args:
+            indices (Sequence[int]): Index of each axis, innermost first.
+
+        Returns:
+            str: File name with all placeholders replaced.
+        """
+        return self.nameFormatter()(indices)
+
+    def nameFormatter(self):
+        """
+        Compile the name template into a function composing file names.
+
+        The template is parsed once and the values of all axes are formatted once, so that composing a name only joins strings,
+        without parsing, number formatting or device I/O. Placeholders of axes that do not exist (e.g., ``{9}`` for a plan of two axes) are kept as they are.
+        Values are inserted once, so a label containing a placeholder is not substituted again.
+
+        Returns:
+            callable: Function ``format(indices)`` returning the file name for the index of each axis (innermost first).
+        """
+        texts = [[value if isinstance(value, str) else f"{value:.5g}" for value in axis.values] for axis in self.axes]
+        parts = []
+        last = 0
+        template = str(self.name)
+        for match in _PLACEHOLDER.finditer(template):
+            number = int(match.group(1) or match.group(2)) - 1
+            if not 0 <= number < len(self.axes):
+                continue
+            parts.append((template[last:match.start()], number, match.group(1) is not None))
+            last = match.end()
+        tail = template[last:]
+
+        def format(indices):
+            return "".join(text + (texts[i][indices[i]] if isValue else str(indices[i])) for text, i, isValue in parts) + tail
+        return format
+
+
+class ScanEngine(QtCore.QObject):
+    """
+    Headless executor of scan plans.
+
+    ``run()`` executes a ``ScanPlan`` in the calling thread, without widgets. The plan is validated and compiled into its point table first;
+    then, for every point, the axes whose index changes are moved, the storage file name is updated and the detector acquires.
+    It can therefore be used from scripts and by ``ScanWidget`` alike.
+    While waiting for devices, Qt events are processed, so ``stop()`` can be called from the GUI or from signal handlers.
+
+    After a stop or a ``pause()``, ``position`` is the number of the first point that was not acquired, and ``run(plan, start=position)`` resumes the scan there.
+    Durations of the scan stages are accumulated in ``stats``, e.g., to benchmark the per-point overhead and the gain of pipelining.
+    """
+
+    #: Signal emitted before each acquisition.
+    beforeAcquisition = QtCore.pyqtSignal()
+
+    #: Signal (int, int) emitted after each point with the number of finished points and the total number of points.
+    progress = QtCore.pyqtSignal(int, int)
+
+    #: Signal emitted when a scan has finished, either after all points or after a stop request.
+    finished = QtCore.pyqtSignal()
+
+    def __init__(self):
+        """
+        Initialize the scan engine.
+        """
+        super().__init__()
+        self._plan = None
+        self._shouldStop = False
+        self._shouldPause = False
+        self._stats = {}
+        self._table = None
+        self._position = 0
+        self._start = 0
+        self._startTime = None
+        self._prediction = None
+        self._fileName = None
+
+    @property
+    def running(self):
+        """
+        Whether a scan is running.
+
+        Returns:
+            bool: True while ``run()`` is executing.
+        """
+        return self._plan is not None
+
+    @property
+    def stats(self):
+        """
+        Statistics of the last (or current) scan.
+
+        The "move" time runs from commanding the moves to their arrival; with pipelining, the "process" time of the previous point overlaps with it,
+        and only "wait" is the part of the "move" time during which the scan was blocked by the axes.
+
+        Returns:
+            dict[str, float]: Number of acquired "points", total "elapsed" time and the time spent in "move", "wait", "acquire" and "process" (in seconds).
+        """
+        return dict(self._stats)
+
+    @property
+    def table(self):
+        """
+        Point table of the last (or current) scan.
+
+        Returns:
+            np.ndarray | None: Structured array returned by ``ScanPlan.points()``, or None before the first scan.
+        """
+        return self._table
+
+    @property
+    def position(self):
+        """
+        Number of the next point to be acquired.
+
+        Returns:
+            int: Row of the point table at which the current scan continues, or at which a stopped scan can be resumed.
+        """
+        return self._position
+
+    @property
+    def prediction(self):
+        """
+        Dry-run prediction of the last (or current) scan, made with the default timing models when the scan started.
+
+        Returns:
+            dict | None: Prediction as returned by ``ScanPlan.simulate()``, or None before the first scan.
+        """
+        return self._prediction
+
+    @property
+    def eta(self):
+        """
+        Estimated remaining time of the running scan.
+
+        The remaining time of the ``prediction`` is scaled by the ratio of the actual to the predicted duration of the points acquired so far,
+        so that effects not covered by the timing models (e.g., polling latency) are taken into account as the scan proceeds.
+        If the prediction is zero (e.g., no speed is known), the average duration of the points acquired so far is used.
+
+        Returns:
+            float | None: Remaining time (in seconds), or None if no scan is running.
+        """
+        if not self.running:
+            return None
+        finish = np.concatenate([[0.0], self._prediction["finish"]])
+        remaining = finish[-1] - finish[self._position]
+        done = self._position - self._start
+        if done == 0:
+            return float(remaining)
+        actual = time.perf_counter() - self._startTime
+        predicted = finish[self._position] - finish[self._start]
+        if predicted > 0:
+            return float(remaining * actual / predicted)
+        return actual / done * (len(self._table) - self._position)
+
+    def run(self, plan, start=0):
+        """
+        Execute a scan plan, blocking until all points are acquired or ``stop()`` is called.
+
+        While the scan is running, the storage of the plan saves unnumbered files named after the template,
+        and the ``scanNames`` tag of each file lists the axis names. The storage settings are restored afterwards.
+
+        Args:
+            plan (ScanPlan): Scan to execute.
+            start (int, optional): Row of the point table at which the scan starts, e.g., ``position`` after a stop. Defaults to 0.
+
+        Raises:
+            RuntimeError: If a scan is already running.
+            ValueError: If the plan is invalid (see ``ScanPlan.validate()``) or ``start`` is out of range.
+        """
+        if self.running:
+            raise RuntimeError("A scan is already running.")
+        plan.validate()
+        table = plan.points()
+        if not 0 <= start < len(table):
+            raise ValueError(f"Start point {start} is out of range for a scan of {len(table)} points.")
+        self._plan = plan
+        self._table = table
+        self._position = self._start = start
+        self._prediction = plan.simulate()
+        self._fileName = plan.nameFormatter() if plan.name is not None else None
+        self._shouldStop = False
+        self._shouldPause = False
+        self._stats = {"points": 0, "elapsed": 0.0, "move": 0.0, "wait": 0.0, "acquire": 0.0, "process": 0.0}
+        self._startTime = time.perf_counter()
+        storage = plan.storage
+        if storage is not None:
+            oldName, oldNumbered = storage.name, storage.numbered
+            storage.numbered = False
+            storage.enabled = True
+            storage.tagRequest.connect(self._setScanNames)
+        try:
+            self._runTable(plan, table)
+        finally:
+            if storage is not None:
+                storage.tagRequest.disconnect(self._setScanNames)
+                storage.name = oldName
+                storage.numbered = oldNumbered
+            self._stats["elapsed"] = time.perf_counter() - self._startTime
+            self._plan = None
+            self.finished.emit()
+
+    def _runTable(self, plan, table):
+        """
+        Iterate the point table from ``position``.
+
+        Args:
+            plan (ScanPlan): Scan being executed.
+            table (np.ndarray): Point table of the plan.
+        """
+        fields = plan.fields
+        index = table["index"]
+        columns = [table[f].tolist() for f in fields]
+        pipelined = plan.pipelined and plan.concurrent
+        previous = None
+        pending = None
+        try:
+            while self._position < len(table) and not self._shouldStop and not self._shouldPause:
+                row = self._position
+                current = index[row]
+                moves = [(plan.axes[level], columns[level][row]) for level in reversed(range(len(fields))) if previous is None or current[level] != previous[level]]
+                start = time.perf_counter()
+                if plan.concurrent:
+                    moving = self._command(moves)
+                    if pending is not None:
+                        self._process(plan, *pending)
+                        pending = None
+                    waitStart = time.perf_counter()
+                    for obj in moving:
+                        obj.waitForReady()
+                else:
+                    waitStart = start
+                    self._moveSequentially(moves)
+                end = time.perf_counter()
+                self._stats["move"] += end - start
+                self._stats["wait"] += end - waitStart
+                if self._shouldStop:
+                    return
+                previous = current
+                done, data = self._acquire(plan, current)
+                if not done:
+                    return
+                pending = (table[row], data)
+                if not pipelined:
+                    self._process(plan, *pending)
+                    pending = None
+                self._position += 1
+                self.progress.emit(self._position, len(table))
+        finally:
+            if pending is not None:
+                self._process(plan, *pending)
+
+    def _command(self, moves):
+        """
+        Command the moves to the next point without waiting, with one ``set()`` call per controller.
+
+        Args:
+            moves (list[tuple[ScanAxis, float | str]]): Axes to move and their targets, outer axes first.
+
+        Returns:
+            list[MultiControllerInterface]: Controllers to wait for.
+        """
+        targets = {}
+        for axis, value in moves:
+            if axis.obj is not None:
+                targets.setdefault(id(axis.obj), (axis.obj, {}))[1][axis.name] = value
+        for obj, values in targets.values():
+            obj.set(**values)
+        return [obj for obj, _ in targets.values()]
+
+    def _moveSequentially(self, moves):
+        """
+        Move axes one after another, waiting for each move.
+
+        Args:
+            moves (list[tuple[ScanAxis, float | str]]): Axes to move and their targets, outer axes first.
+        """
+        for axis, value in moves:
+            if axis.obj is not None and not self._shouldStop:
+                axis.obj.set(**{axis.name: value}, wait=True)
+
+    def _process(self, plan, point, data):
+        """
+        Process the data of an acquired point.
+
+        Pending Qt events are processed first, so that the storage receives the data and starts saving,
+        then ``plan.process`` is called.
+
+        Args:
+            plan (ScanPlan): Scan being executed.
+            point (np.void): Row of the point table.
+            data (dict | None): Acquired data, or None if the plan has no ``process`` function.
+        """
+        start = time.perf_counter()
+        QtCore.QCoreApplication.processEvents()
+        if plan.process is not None:
+            plan.process(point, data)
+        self._stats["process"] += time.perf_counter() - start
+
+    def _acquire(self, plan, indices):
+        """
+        Acquire at the current point.
+
+        Args:
+            plan (ScanPlan): Scan being executed.
+            indices (Sequence[int]): Index of each axis.
+
+        Returns:
+            tuple[bool, dict | None]: Whether the acquisition was completed (False if the scan was stopped before or during it),
+            and the acquired data if the plan has a ``process`` function.
+        """
+        start = time.perf_counter()
+        if plan.storage is not None and self._fileName is not None:
+            plan.storage.name = self._fileName(indices)
+        if plan.exposure is not None and plan.detector.exposure not in (None, plan.exposure):
+            plan.detector.exposure = plan.exposure
+        self.beforeAcquisition.emit()
+        if self._shouldStop:
+            return False, None
+        data = plan.detector.startAcq(wait=True, output=plan.process is not None)
+        self._stats["acquire"] += time.perf_counter() - start
+        if self._shouldStop:
+            return False, None
+        self._stats["points"] += 1
+        return True, data
+
+    def _setScanNames(self, tag):
+        """
+        Add the axis names of the running scan to a metadata tag requested by the storage.
+
+        Args:
+            tag (dict): Mutable tag; the key ``'scanNames'`` is set to the axis names, innermost first.
+        """
+        if self._plan is not None:
+            tag["scanNames"] = [axis.name for axis in self._plan.axes]
+
+    def stop(self):
+        """
+        Request the running scan to stop.
+
+        The acquisition in progress is stopped (its data is still emitted and saved), and no further point is started.
+        """
+        if not self.running:
+            return
+        self._shouldStop = True
+        if self._plan.detector.isBusy:
+            self._plan.detector.stop()
+
+    def pause(self):
+        """
+        Request the running scan to pause at the next point boundary.
+
+        Unlike ``stop()``, the point in progress is completed. ``run()`` then returns with ``position`` at the next point,
+        and ``run(plan, start=position)`` resumes the scan there.
+        """
+        if self.running:
+            self._shouldPause = True
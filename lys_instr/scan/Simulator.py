@@ -0,0 +1,143 @@
+import os
+import tempfile
+import time
+import numpy as np
+from lys import Wave
+
+from .Ordering import _isMotor
+
+
+def moveTime(distance, speed, acceleration=None):
+    """
+    Time of a point-to-point move with a trapezoidal velocity profile.
+
+    Args:
+        distance (float | np.ndarray): Distance(s) of the move.
+        speed (float): Maximum speed (units per second).
+        acceleration (float | None, optional): Acceleration and deceleration (units per second squared). Defaults to None (infinite).
+
+    Returns:
+        float | np.ndarray: Move time(s) (in seconds). Moves of zero distance take no time.
+    """
+    distance = np.abs(distance)
+    if not acceleration:
+        return distance / speed
+    # Short moves never reach the maximum speed (triangular profile)
+    return np.where(distance >= speed ** 2 / acceleration, distance / speed + speed / acceleration, 2 * np.sqrt(distance / acceleration))
+
+
+def measureThroughput(storage=None, size=1 << 22):
+    """
+    Measure the write throughput of the storage location.
+
+    A float array of about ``size`` bytes is exported as ``lys.Wave`` to a temporary file in the folder of ``storage``, as ``DataStorage`` does, and removed afterwards.
+
+    Args:
+        storage (DataStorage | None, optional): Storage whose folder is measured. Defaults to None (the temporary directory of the system).
+        size (int, optional): Number of bytes written. Defaults to 4 MiB.
+
+    Returns:
+        float: Throughput (bytes per second).
+    """
+    folder = tempfile.gettempdir() if storage is None else os.path.join(storage.base, storage.folder)
+    os.makedirs(folder, exist_ok=True)
+    data = np.random.rand(max(1, size // 8))
+    fd, path = tempfile.mkstemp(suffix=".npz", dir=folder)
+    os.close(fd)
+    try:
+        start = time.perf_counter()
+        Wave(data).export(path)
+        elapsed = time.perf_counter() - start
+    finally:
+        os.remove(path)
+    return data.nbytes / max(elapsed, 1e-9)
+
+
+def simulate(plan, readout=0, overhead=0, process=0, throughput=None, switchTime=0):
+    """
+    Replay a scan plan against timing models without moving or acquiring.
+
+    The phases of each point are modelled as follows:
+
+    - move: motor axes move with a trapezoidal profile (see ``moveTime()``) with ``ScanAxis.speed`` and ``ScanAxis.acceleration``;
+      if an axis has no speed, the speed reported by its controller (``MultiMotorInterface.speed``) is used, if supported.
+      Switch axes take ``switchTime`` per change. Axes moved concurrently take as long as the longest move.
+    - acquire: exposure (of the plan, or of the detector) and ``readout`` per frame, for each frame of the index grid of the detector.
+    - process: ``process`` per point, hidden behind the next move if the plan is pipelined.
+    - overhead: ``overhead`` per point, e.g., device polling latency.
+    - storage: each point is saved in the background at ``throughput``; saving only delays the scan when it lags behind the acquisitions.
+
+    Args:
+        plan (ScanPlan): Scan plan.
+        readout (float, optional): Readout time per frame (in seconds). Defaults to 0.
+        overhead (float, optional): Fixed overhead per point (in seconds). Defaults to 0.
+        process (float, optional): Processing time per point (in seconds). Defaults to 0.
+        throughput (float | None, optional): Storage throughput (bytes per second), e.g., from ``measureThroughput()``. Defaults to None (saving is not modelled).
+        switchTime (float, optional): Time of a switch change (in seconds). Defaults to 0.
+
+    Returns:
+        dict: "total" is the predicted duration, "phases" maps each phase to its total busy time, "bottleneck" is the phase with the largest busy time,
+        "points" is the number of points and "finish" the predicted time at which each point is acquired (relative to the start, in execution order), all in seconds.
+    """
+    table = plan.points()
+    n = len(table)
+    move = _moveTimes(plan, table, switchTime)
+    detector = plan.detector
+    exposure = plan.exposure if plan.exposure is not None and detector.exposure is not None else (detector.exposure or 0)
+    frames = int(np.prod(getattr(detector, "indexShape", ())))
+    acquire = np.full(n, frames * (exposure + readout))
+    processing = np.full(n, float(process))
+    if plan.pipelined and plan.concurrent:
+        # The processing of the previous point overlaps with the move to the current one
+        step = np.maximum(move, np.concatenate([[0], processing[:-1]])) + acquire + overhead
+        step[-1] += processing[-1]
+    else:
+        step = move + acquire + processing + overhead
+    finish = np.cumsum(step)
+    total = float(finish[-1]) if n else 0.0
+
+    phases = {"move": float(move.sum()), "acquire": float(acquire.sum()), "process": float(processing.sum()), "overhead": float(overhead * n), "storage": 0.0}
+    if throughput and plan.storage is not None and hasattr(detector, "dataShape"):
+        save = np.prod(detector.dataShape) * 8 / throughput
+        done = 0.0
+        for t in finish:
+            done = max(done, t) + save
+        phases["storage"] = float(save * n)
+        total = max(total, done)
+    return {"total": total, "phases": phases, "bottleneck": max(phases, key=phases.get), "points": n, "finish": finish}
+
+
+def _moveTimes(plan, table, switchTime=0):
+    """
+    Predicted move time to each point of the table.
+
+    Args:
+        plan (ScanPlan): Scan plan.
+        table (np.ndarray): Point table in execution order.
+        switchTime (float, optional): Time of a switch change (in seconds). Defaults to 0.
+
+    Returns:
+        np.ndarray: Move time to each point (in seconds); the first point takes no time.
+    """
+    times = [np.zeros(len(table))]
+    for i, axis in enumerate(plan.axes):
+        if axis.obj is None:
+            continue
+        values = table[plan.fields[i]]
+        if not _isMotor(axis):
+            times.append(np.concatenate([[0.0], (values[1:] != values[:-1]) * float(switchTime)]))
+            continue
+        speed = axis.speed or _controllerSpeed(axis)
+        if speed:
+            times.append(np.concatenate([[0.0], moveTime(np.diff(values), speed, axis.acceleration)]))
+    return np.max(times, axis=0) if plan.concurrent else np.sum(times, axis=0)
+
+
+def _controllerSpeed(axis):
+    """
+    Speed of an axis reported by its controller, or None if the controller does not support speed control.
+    """
+    try:
+        return axis.obj.speed[axis.name]
+    except (AttributeError, NotImplementedError, KeyError):
+        return None
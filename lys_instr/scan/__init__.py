@@ -0,0 +1,4 @@
+from .ScanEngine import ScanAxis, ScanPlan, ScanEngine
+from .FlyScan import FlyScan
+from .Adaptive import AdaptiveScan
+from .Queue import ScanQueue
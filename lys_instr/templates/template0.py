@@ -1,4 +1,4 @@
-from lys_instr import DataStorage, gui, dummy
+from lys_instr import DataStorage, DeviceLauncher, gui, dummy
 from lys.Qt import QtWidgets
 from lys.widgets import LysSubWindow
 
@@ -8,8 +8,12 @@ class Window(LysSubWindow):
         super().__init__(parent)
         self.setWindowTitle("Hands-on GUI")
         self._storage = DataStorage()
-        self._detector = dummy.MultiDetectorDummy(indexShape=(), frameShape=(128, 128), exposure=0.1)
-        self._motor = dummy.MultiMotorDummy("E")
+        launcher = DeviceLauncher()
+        launcher.add("detector", dummy.MultiDetectorDummy, indexShape=(), frameShape=(128, 128), exposure=0.1)
+        launcher.add("motor", dummy.MultiMotorDummy, "E")
+        devices = launcher.launch()
+        self._detector = devices["detector"]
+        self._motor = devices["motor"]
         self._storage.connect(self._detector)
         self._initLayout()
         self.setSettingFile("template0.dic")
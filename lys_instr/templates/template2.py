@@ -1,7 +1,7 @@
 import pyqtgraph as pg
 from lys.widgets import LysSubWindow
 from lys.Qt import QtWidgets
-from lys_instr import DataStorage, gui, dummy
+from lys_instr import DataStorage, DeviceLauncher, gui, dummy
 from lys_instr.dummy.detectorData import RamanData
 
 
@@ -20,8 +20,14 @@ class TemplateWindow(LysSubWindow):
         super().__init__()
         self.setWindowTitle("template2")
         self._storage = DataStorage()
-        self._detector = detector if detector else dummy.MultiDetectorDummy(data=RamanData(scanLevel=1), exposure=0.1)
-        self._motor = motor if motor else dummy.MultiMotorDummy("x", "y", "phi")
+        launcher = DeviceLauncher()
+        if not detector:
+            launcher.add("detector", dummy.MultiDetectorDummy, data=RamanData(scanLevel=1), exposure=0.1)
+        if not motor:
+            launcher.add("motor", dummy.MultiMotorDummy, "x", "y", "phi")
+        devices = launcher.launch()
+        self._detector = detector if detector else devices["detector"]
+        self._motor = motor if motor else devices["motor"]
         self._storage.connect(self._detector)
         self._detectorName = detectorName
         self._initLayout()
@@ -1,6 +1,6 @@
 from lys.widgets import LysSubWindow
 from lys.Qt import QtWidgets
-from lys_instr import DataStorage, gui, dummy
+from lys_instr import DataStorage, DeviceLauncher, gui, dummy
 
 
 class TemplateWindow(LysSubWindow):
@@ -8,8 +8,14 @@ class TemplateWindow(LysSubWindow):
         super().__init__()
         self.setWindowTitle("template3")
         self._storage = DataStorage()
-        self._detector = detector if detector else dummy.MultiDetectorDummy(frameShape=(256, 256))
-        self._motor = motor if motor else dummy.MultiMotorDummy("x", "y")
+        launcher = DeviceLauncher()
+        if not detector:
+            launcher.add("detector", dummy.MultiDetectorDummy, frameShape=(256, 256))
+        if not motor:
+            launcher.add("motor", dummy.MultiMotorDummy, "x", "y")
+        devices = launcher.launch()
+        self._detector = detector if detector else devices["detector"]
+        self._motor = motor if motor else devices["motor"]
         self._storage.connect(self._detector)
         self._detectorName = detectorName
         self._initLayout()
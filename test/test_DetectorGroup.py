@@ -0,0 +1,66 @@
+import unittest
+import time
+
+from PyQt5 import QtTest
+from lys_instr import DetectorGroup
+from lys_instr.dummy.MultiDetector import MultiDetectorDummy
+
+
+class TestDetectorGroup(unittest.TestCase):
+
+    def test_init(self):
+        group = DetectorGroup([MultiDetectorDummy(frameShape=(3,), exposure=0.1), MultiDetectorDummy(frameShape=(4,), exposure=0.2)])
+        self.assertTrue(group.isAlive, "Group should be alive after initialization.")
+        self.assertFalse(group.isBusy, "Group should not be busy after initialization.")
+        self.assertEqual(group.exposure, 0.2, "Group exposure should be the longest member exposure.")
+        self.assertEqual(group.frameShape, (3,), "Group frame shape should be that of the primary member.")
+
+    def test_output_array(self):
+        group = DetectorGroup([MultiDetectorDummy(frameShape=(3,), exposure=0.1)])
+        with self.assertRaises(ValueError):
+            group.startAcq(wait=True, output="array")
+        self.assertFalse(group.isBusy, "Group should not become busy when the output mode is rejected.")
+
+    def test_exposure(self):
+        d1, d2 = MultiDetectorDummy(exposure=0.1), MultiDetectorDummy(exposure=0.2)
+        group = DetectorGroup({"a": d1, "b": d2})
+        group.exposure = 0.05
+        self.assertEqual([d1.exposure, d2.exposure], [0.05, 0.05], "Setting group exposure should set all member exposures.")
+
+    def test_startAcq_concurrent(self):
+        d1 = MultiDetectorDummy(indexShape=(), frameShape=(3,), exposure=0.5)
+        d2 = MultiDetectorDummy(indexShape=(), frameShape=(3,), exposure=0.5)
+        group = DetectorGroup([d1, d2])
+        received = []
+        d1.dataAcquired.connect(lambda data: received.append(("d1", data)))
+        d2.dataAcquired.connect(lambda data: received.append(("d2", data)))
+
+        start = time.perf_counter()
+        group.startAcq(wait=True)
+        elapsed = time.perf_counter() - start
+        self.assertFalse(group.isBusy, "Group should not be busy after waiting for acquisition to finish.")
+        self.assertFalse(d1.isBusy or d2.isBusy, "No member should be busy after the group has finished.")
+        self.assertLess(elapsed, 0.9, "Members should acquire concurrently (max of exposures, not sum).")
+
+        QtTest.QTest.qWait(50)
+        self.assertTrue(any(name == "d1" and data for name, data in received), "First member should deliver data.")
+        self.assertTrue(any(name == "d2" and data for name, data in received), "Second member should deliver data.")
+
+    def test_busy_member_skipped(self):
+        d1 = MultiDetectorDummy(indexShape=(), frameShape=(3,), exposure=0.3)
+        d2 = MultiDetectorDummy(indexShape=(), frameShape=(3,), exposure=0.1)
+        group = DetectorGroup([d1, d2])
+        d1.startAcq()
+        group.startAcq(wait=True)
+        self.assertFalse(group.isBusy, "Group should finish even if a member was busy at start.")
+        d1.waitForReady()
+
+    def test_stop(self):
+        d1 = MultiDetectorDummy(indexShape=(), frameShape=(3,), exposure=0.1)
+        d2 = MultiDetectorDummy(indexShape=(), frameShape=(3,), exposure=0.1)
+        group = DetectorGroup([d1, d2])
+        group.startAcq(iter=-1)
+        QtTest.QTest.qWait(250)
+        group.stop()
+        self.assertFalse(group.isBusy, "Group should not be busy after stopping acquisition.")
+        self.assertFalse(d1.isBusy or d2.isBusy, "No member should be busy after stopping the group.")
@@ -0,0 +1,119 @@
+import time
+import unittest
+
+from PyQt5 import QtTest
+from lys_instr.Interfaces import HardwareInterface, DeviceTimeoutError
+from lys_instr.dummy.MultiMotor import MultiMotorDummy
+
+
+class TestPollingScheduler(unittest.TestCase):
+
+    def test_shared(self):
+        motors = [MultiMotorDummy('x') for _ in range(10)]
+        scheduler = HardwareInterface.scheduler()
+        self.assertTrue(all(m in scheduler.devices for m in motors), "Devices should be polled by the shared scheduler.")
+        self.assertFalse(any(m.isRunning() for m in motors), "Devices should not start their own threads.")
+
+        motors[-1].set(x=0.5, wait=True)
+        self.assertEqual(motors[-1].get()['x'], 0.5, "Motion should complete while polled by the shared scheduler.")
+        self.assertFalse(motors[-1].isBusy['x'], "Axis should not be busy after motion completes.")
+
+    def test_dedicated(self):
+        motor = MultiMotorDummy('x', dedicated=True)
+        self.assertTrue(motor.isRunning(), "Dedicated device should run its own monitoring thread.")
+        self.assertNotIn(motor, HardwareInterface.scheduler().devices, "Dedicated device should not be polled by the shared scheduler.")
+        motor.set(x=0.5, wait=True)
+        self.assertEqual(motor.get()['x'], 0.5, "Motion should complete on a dedicated device.")
+        motor.kill()
+        motor.wait()
+
+    def test_kill(self):
+        motor = MultiMotorDummy('x')
+        motor.kill()
+        self.assertNotIn(motor, HardwareInterface.scheduler().devices, "Killed device should be removed from the scheduler.")
+
+    def test_wakeups(self):
+        motors = [MultiMotorDummy('x', interval=0.1) for _ in range(5)]
+        scheduler = HardwareInterface.scheduler()
+        n = len(scheduler.devices)
+        before = scheduler.wakeups
+        QtTest.QTest.qWait(500)
+        self.assertLessEqual(scheduler.wakeups - before, n * 7, "Each device should be polled about once per interval.")
+        for m in motors:
+            m.kill()
+
+    def test_adaptive(self):
+        motor = MultiMotorDummy('x', interval=0.05, idleInterval=0.8, holdTime=0.1)
+        QtTest.QTest.qWait(1500)
+        self.assertEqual(motor.pollInterval, 0.8, "Idle device should be polled at the idle interval.")
+
+        start = time.perf_counter()
+        motor.set(x=0.1, wait=True)
+        self.assertLess(time.perf_counter() - start, 0.6, "Setting should wake the device instead of waiting for the idle interval.")
+        self.assertEqual(motor.get()['x'], 0.1, "Motion should complete.")
+        motor.kill()
+
+
+class _HangingMotor(MultiMotorDummy):
+
+    hang = False
+
+    def _get(self):
+        while self.hang:
+            time.sleep(0.01)
+        return super()._get()
+
+
+class TestWatchdog(unittest.TestCase):
+
+    def test_timeout(self):
+        motor = _HangingMotor('x', callTimeout=0.2)
+        QtTest.QTest.qWait(100)
+        motor.hang = True
+        with self.assertRaises(DeviceTimeoutError):
+            motor.get()
+        self.assertFalse(motor.isAlive['x'] and motor.snapshot.alive['x'], "Axis should be marked not alive after a timeout.")
+        # A poll may still hold the mutex while its own call waits for the deadline
+        QtTest.QTest.qWait(250)
+
+        start = time.perf_counter()
+        with self.assertRaises(DeviceTimeoutError):
+            motor.set(x=0.1)
+        self.assertLess(time.perf_counter() - start, 0.1, "Calls should fail fast while a previous call is hung.")
+        motor.hang = False
+        QtTest.QTest.qWait(100)
+        motor.set(x=0.1, wait=True)
+        self.assertEqual(motor.get()['x'], 0.1, "Device should recover after the hung call returns.")
+
+        stats = motor.callStats
+        self.assertGreaterEqual(stats["get"]["timeouts"], 1)
+        self.assertEqual(stats["get"]["calls"], sum(stats["get"]["histogram"]), "Histogram should count every completed call.")
+        self.assertEqual((stats["set"]["calls"], stats["set"]["timeouts"]), (1, 1), "The rejected set should be counted as a timeout.")
+        QtTest.QTest.qWait(300)
+        self.assertTrue(motor.snapshot.alive['x'], "Axis should be alive again after the device recovers.")
+        motor.kill()
+
+
+class _SlowDevice(HardwareInterface):
+
+    def __init__(self, delay, **kwargs):
+        super().__init__(**kwargs)
+        self.delay = delay
+        self.polls = 0
+        self.start()
+
+    def _loadState(self):
+        self.polls += 1
+        time.sleep(self.delay)
+
+
+class TestPollingPool(unittest.TestCase):
+
+    def test_isolation(self):
+        slow = _SlowDevice(1.0, interval=0.05, idleInterval=None)
+        fast = _SlowDevice(0, interval=0.05, idleInterval=None)
+        QtTest.QTest.qWait(500)
+        self.assertLessEqual(slow.polls, 1, "A device should not be polled again while its poll is in progress.")
+        self.assertGreater(fast.polls, 4, "A slow device should not stop the polling of other devices.")
+        slow.kill()
+        fast.kill()
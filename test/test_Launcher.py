@@ -0,0 +1,57 @@
+import time
+import unittest
+from PyQt5 import QtTest
+
+from lys.Qt import QtCore
+from lys_instr import DeviceLauncher
+from lys_instr.Interfaces import HardwareInterface
+from lys_instr.dummy.MultiMotor import MultiMotorDummy
+
+
+class _SlowStartDevice(HardwareInterface):
+
+    def __init__(self, delay, fail=False, **kwargs):
+        super().__init__(interval=0.05, idleInterval=None, **kwargs)
+        time.sleep(delay)
+        if fail:
+            raise RuntimeError("Connection refused.")
+        self.polls = 0
+        self.start()
+
+    def _loadState(self):
+        self.polls += 1
+
+
+class TestDeviceLauncher(unittest.TestCase):
+
+    def test_launch(self):
+        launcher = DeviceLauncher()
+        for name in ["a", "b", "c"]:
+            launcher.add(name, _SlowStartDevice, 0.3)
+        launcher.add("motor", MultiMotorDummy, "x")
+        with self.assertRaises(ValueError):
+            launcher.add("a", _SlowStartDevice, 0)
+
+        start = time.perf_counter()
+        devices = launcher.launch()
+        self.assertLess(time.perf_counter() - start, 0.6, "Devices should be constructed concurrently.")
+        self.assertEqual(list(devices), ["a", "b", "c", "motor"])
+        self.assertTrue(all(t >= 0.3 for name, t in launcher.timing.items() if name != "motor"), "Startup time should be reported per device.")
+        self.assertEqual([d.polls for d in devices.values() if isinstance(d, _SlowStartDevice)], [1, 1, 1], "Only the warm-up poll should run before launch() returns.")
+        self.assertTrue(all(d.thread() is QtCore.QThread.currentThread() for d in devices.values()), "Devices should be moved to the launching thread.")
+        self.assertIs(devices["motor"]._commands.thread(), QtCore.QThread.currentThread(), "The command queue should be moved with its controller.")
+
+        QtTest.QTest.qWait(300)
+        self.assertTrue(all(d.polls > 2 for d in devices.values() if isinstance(d, _SlowStartDevice)), "Monitoring should begin after launch.")
+        devices["motor"].set(x=0.1, wait=True)
+        self.assertEqual(devices["motor"].get(), {"x": 0.1})
+        for d in devices.values():
+            d.kill()
+
+    def test_failure(self):
+        launcher = DeviceLauncher()
+        launcher.add("ok", _SlowStartDevice, 0)
+        launcher.add("broken", _SlowStartDevice, 0, fail=True)
+        with self.assertRaises(RuntimeError):
+            launcher.launch()
+        self.assertEqual(launcher.devices, {}, "No device should be returned if any device fails.")
@@ -1,4 +1,6 @@
 import unittest
+import asyncio
+import threading
 import time
 from PyQt5 import QtTest
 
@@ -103,6 +105,104 @@ class TestMultiMotorDummy(unittest.TestCase):
         self.assertTrue(all(v == t for v, t in zip(val.values(), [1, 2])), "Axis values should match targets after recovery and motion.")
 
 
+    def test_setAsync(self):
+        motor1 = MultiMotorDummy('x', speed=5)
+        motor2 = MultiMotorDummy('y', speed=5)
+
+        async def move():
+            await asyncio.gather(motor1.setAsync(x=2), motor2.setAsync(y=2))
+
+        start = time.perf_counter()
+        asyncio.run(move())
+        elapsed = time.perf_counter() - start
+        self.assertEqual([motor1.get()['x'], motor2.get()['y']], [2, 2], "Axis values should match targets after awaiting setAsync.")
+        self.assertFalse(any(motor1.isBusy.values()) or any(motor2.isBusy.values()), "No axis should be busy after awaiting setAsync.")
+        self.assertLess(elapsed, 2 * 2 / 5, "Moves on different controllers should overlap.")
+
+    def test_eventDriven(self):
+        motor = EventMultiMotorDummy('x', idleInterval=10, holdTime=0)
+        QtTest.QTest.qWait(500)
+        polls = motor.polls
+        busy = []
+        motor.busyStateChanged.connect(busy.append, QtCore.Qt.DirectConnection)
+
+        start = time.perf_counter()
+        motor.set(x=0.5, wait=True)
+        self.assertLess(time.perf_counter() - start, 0.3, "Completion should be detected from the pushed event, not the watchdog poll.")
+        self.assertEqual(busy, [{'x': True}, {'x': False}], "Busy state should be reported by set() and the completion event.")
+        self.assertEqual(motor.get()['x'], 0.5, "Axis value should match target after completion event.")
+        self.assertLessEqual(motor.polls - polls, 1, "Event-driven device should be polled only by the watchdog.")
+        motor.kill()
+
+    def test_snapshot(self):
+        motor = MultiMotorDummy('x', speed=5)
+        motor.set(x=1, wait=True)
+        QtTest.QTest.qWait(300)
+        snap = motor.snapshot
+        self.assertEqual(dict(snap.values), {'x': 1}, "Snapshot should hold the polled value.")
+        self.assertFalse(snap.busy['x'], "Snapshot should hold the polled busy state.")
+        with self.assertRaises(TypeError):
+            snap.values['x'] = 0
+
+        idle = MultiMotorDummy('x', idleInterval=2, holdTime=0)
+        QtTest.QTest.qWait(100)
+        reads = idle._coalescer.reads
+        QtTest.QTest.qWait(1000)
+        self.assertEqual(idle._coalescer.reads, reads, "Idle polls should not read values before the idle interval has passed.")
+        idle.kill()
+
+        motor.set(x=2)
+        self.assertGreater(motor.snapshot.version, snap.version, "set() should publish a new snapshot.")
+        self.assertTrue(motor.snapshot.busy['x'], "New snapshot should report the axis as busy.")
+        self.assertGreater(motor.get(cached=True, maxAge=0)['x'], 1, "Reads older than maxAge should go to the device.")
+
+    def test_coalesce(self):
+        motor = MultiMotorDummy('x', 'y', coalesceWindow=0.2)
+        QtTest.QTest.qWait(100)
+        reads = motor._coalescer.reads
+        threads = [threading.Thread(target=motor.get) for _ in range(10)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        motor.get()
+        self.assertLessEqual(motor._coalescer.reads - reads, 2, "Near-simultaneous reads should be merged into one device read.")
+
+        motor.set(x=1)
+        QtTest.QTest.qWait(50)
+        self.assertGreater(motor.get()['x'], 0, "Setting a target should invalidate the shared read.")
+
+        motor.set(x=2, wait=True)
+        QtTest.QTest.qWait(300)
+        self.assertEqual(motor.get(cached=True)['x'], 2, "The final position should not be taken from a read made during the motion.")
+
+    def test_queued(self):
+        motor = MultiMotorDummy('x', 'y', speed=100)
+        applied = []
+        original = motor._set
+        motor._set = lambda **target: (applied.append(target), time.sleep(0.2), original(**target))
+
+        start = time.perf_counter()
+        for i in range(5):
+            motor.set(x=i, queued=True)
+        motor.set(y=1, queued=True)
+        self.assertLess(time.perf_counter() - start, 0.5, "Queued set() should not block on the device.")
+        with self.assertRaises(ValueError):
+            motor.set(z=1, queued=True)
+
+        motor.set(x=0.5, queued=True, wait=True)
+        self.assertEqual(applied[-1]['x'], 0.5, "The latest target should win.")
+        self.assertLessEqual(len(applied), 3, "Superseded targets should be dropped.")
+        self.assertTrue(any(a.get('y') == 1 and 'x' in a for a in applied), "Pending axes should be applied in one batch.")
+        self.assertEqual(motor.get(), {'x': 0.5, 'y': 1})
+
+        for _ in range(3):
+            motor.set(x=motor.pendingTarget.get('x', motor.get(cached=True)['x']) + 1, queued=True)
+        self.assertEqual(motor.pendingTarget['x'], 3.5, "Relative moves should accumulate on the pending target.")
+        motor.set(queued=True, wait=True)
+        self.assertEqual(motor.get()['x'], 3.5)
+        motor.kill()
+
     def test_lock(self):
         slowMotor = SlowMultiMotorDummy('x', 'y')
         slowMotor.set(x=1, y=2)
@@ -120,4 +220,19 @@ class SlowMultiMotorDummy(MultiMotorDummy):
             self._set_impl(**kwargs)
 
         if wait:
-            self.waitForReady()
\ No newline at end of file
+            self.waitForReady()
+
+class EventMultiMotorDummy(MultiMotorDummy):
+
+    eventDriven = True
+    polls = 0
+
+    def _loadState(self):
+        self.polls += 1
+        super()._loadState()
+
+    def _set(self, **target):
+        super()._set(**target)
+        for name, value in target.items():
+            duration = abs(value - self._data[name]._before) / self._data[name]._speed
+            threading.Timer(duration, self._notify, kwargs={"values": {name: value}, "busy": {name: False}}).start()
@@ -1,9 +1,13 @@
 import unittest
+import asyncio
 import time
 import numpy as np
 
 from PyQt5 import QtTest
 from lys_instr.dummy.MultiDetector import MultiDetectorDummy
+from lys_instr.dummy.detectorData import SyntheticData
+from lys_instr.FrameDecoder import FrameDecoder
+from lys_instr.MultiDetector import DetectorInterface
 
 
 class TestMultiDetectorDummy(unittest.TestCase):
@@ -82,3 +86,110 @@ class TestMultiDetectorDummy(unittest.TestCase):
     def test_dataShape(self):
         detector = MultiDetectorDummy(indexShape=(2, 2), frameShape=(3,), exposure=0.1)
         self.assertEqual(detector.dataShape, (2, 2, 3), "Data shape does not match expected shape.")
+
+    def test_compressed(self):
+        detector = MultiDetectorDummy(indexShape=(4,), frameShape=(8,), exposure=0.01, compressed=True)
+        try:
+            data = detector.startAcq(wait=True, output=True)
+            self.assertEqual(list(data.keys()), [(i,) for i in range(4)], "Decoded frames should be delivered in acquisition order.")
+            self.assertTrue(all(value.shape == detector.frameShape for value in data.values()), "All decoded frames should have the correct shape.")
+            self.assertTrue(all(((value >= 0) & (value < 1)).all() for value in data.values()), "Decoded frames should reproduce the random source values.")
+        finally:
+            detector.kill()
+        self.assertIsNone(detector.decoder._pool, "Killing the detector should close the decoder pool.")
+
+    def test_compressed_error(self):
+        detector = MultiDetectorDummy(indexShape=(4,), frameShape=(8,), exposure=0.01, compressed=True)
+        detector.decoder = FrameDecoder(_failingDecode, (8,), processes=1)
+        try:
+            with self.assertLogs(level="WARNING"):
+                data = detector.startAcq(wait=True, output=True)
+            self.assertEqual(data, {}, "Frames that fail to decode should be dropped.")
+            self.assertFalse(detector.isBusy, "Detector should not stay busy after decoding errors.")
+        finally:
+            detector.kill()
+
+    def test_decoder_partial_error(self):
+        decoder = FrameDecoder(_decodeUnlessTwo, (3,), processes=1, slots=2)
+        try:
+            with self.assertLogs(level="WARNING"):
+                for i in range(4):
+                    decoder.submit((i,), i)
+                data = decoder.collect(wait=True)
+            self.assertEqual(list(data.keys()), [(0,), (1,), (3,)], "Only the frame that fails to decode should be dropped.")
+            self.assertTrue(np.array_equal(data[(3,)], [3, 3, 3]))
+            self.assertEqual(decoder.collect(), {}, "No frame should be left for the next collection.")
+            decoder.submit((0,), 5)
+            decoder.reset()
+            self.assertEqual(decoder.pending, 0)
+            self.assertEqual(decoder.collect(wait=True), {}, "Reset should discard uncollected frames.")
+        finally:
+            decoder.close()
+
+    def test_startAcq_wait_output_array(self):
+        detector = MultiDetectorDummy(indexShape=(2, 2), frameShape=(3, 3), exposure=0.01)
+        data, axes = detector.startAcq(wait=True, output="array")
+        self.assertEqual(data.shape, detector.dataShape, "Stacked data should have the full data shape.")
+        self.assertFalse(np.isnan(data).any(), "All frames should have been written into the stacked data.")
+        self.assertEqual(len(axes), len(detector.dataShape), "An axis should be returned for each data dimension.")
+
+    def test_startAcq_output_array_dtype(self):
+        detector = MultiDetectorDummy(indexShape=(2,), frameShape=(3,), exposure=0.01)
+        data, _ = detector.startAcq(wait=True, output="array", dtype=np.uint16)
+        self.assertEqual(data.dtype, np.uint16, "Stacked data should have the requested data type.")
+        with self.assertRaises(ValueError):
+            detector.startAcq(output="array")
+        self.assertFalse(detector.isBusy, "Detector should not start when output='array' is requested without waiting.")
+
+    def test_startAcq_output_array_without_dataShape(self):
+        detector = _PlainDetector()
+        with self.assertRaises(TypeError):
+            detector.startAcq(wait=True, output="array")
+        self.assertFalse(detector.isBusy, "Detector should not stay busy when the output buffer cannot be allocated.")
+        detector.kill()
+
+    def test_acquireAsync(self):
+        d1 = MultiDetectorDummy(indexShape=(2,), frameShape=(3,), exposure=0.2)
+        d2 = MultiDetectorDummy(indexShape=(2,), frameShape=(3,), exposure=0.2)
+
+        async def acquire():
+            return await asyncio.gather(d1.acquireAsync(output=True), d2.acquireAsync(output="array"))
+
+        start = time.perf_counter()
+        data1, (data2, axes) = asyncio.run(acquire())
+        elapsed = time.perf_counter() - start
+        self.assertEqual(len(data1), 2, "All frames of the first detector should be returned.")
+        self.assertEqual(data2.shape, d2.dataShape, "Stacked data of the second detector should have the full data shape.")
+        self.assertFalse(d1.isBusy or d2.isBusy, "No detector should be busy after awaiting acquireAsync.")
+        self.assertLess(elapsed, 0.7, "Acquisitions on different detectors should overlap.")
+
+    def test_synthetic(self):
+        data = SyntheticData(indexShape=(3, 4), frameShape=(5, 5), dtype=np.uint16, poolSize=4, seed=0)
+        frames = list(data)
+        self.assertEqual([idx for idx, _ in frames], list(np.ndindex(3, 4)), "Indices should cover the index grid in order.")
+        self.assertTrue(all(f.dtype == np.uint16 and f.shape == (5, 5) for _, f in frames), "Frames should have the requested dtype and shape.")
+        self.assertIs(frames[0][1], frames[4][1], "Frames should be cycled from the pre-generated pool without allocation.")
+
+    def test_synthetic_fps(self):
+        data = SyntheticData(indexShape=(20,), frameShape=(4,), fps=100, burst=5)
+        start = time.perf_counter()
+        n = sum(1 for _ in data)
+        elapsed = time.perf_counter() - start
+        self.assertEqual(n, 20, "All frames should be yielded.")
+        self.assertGreater(elapsed, 0.15, "Frames should be paced to the target frame rate.")
+
+
+class _PlainDetector(DetectorInterface):
+
+    def _isAlive(self):
+        return True
+
+
+def _failingDecode(raw):
+    raise ValueError("corrupt frame")
+
+
+def _decodeUnlessTwo(raw):
+    if raw == 2:
+        raise ValueError("corrupt frame")
+    return np.full(3, raw)
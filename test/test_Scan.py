@@ -0,0 +1,388 @@
+import json
+import os
+import tempfile
+import time
+import unittest
+import numpy as np
+from PyQt5 import QtTest
+
+from lys_instr.DataStorage import DataStorage
+from lys_instr.dummy.MultiMotor import MultiMotorDummy
+from lys_instr.dummy.MultiDetector import MultiDetectorDummy
+from lys_instr import MultiMotorInterface
+from lys_instr.scan import ScanAxis, ScanPlan, ScanEngine, FlyScan, AdaptiveScan, ScanQueue
+from lys_instr.scan.Simulator import moveTime, measureThroughput
+
+
+def _waitForSaving(storage, timeout=5):
+    start = time.time()
+    while storage.saving and time.time() - start < timeout:
+        QtTest.QTest.qWait(20)
+
+
+class TestScanEngine(unittest.TestCase):
+
+    def test_run(self):
+        motor = MultiMotorDummy('x', 'y', speed=100)
+        detector = MultiDetectorDummy(frameShape=(4, 4), exposure=0.01)
+        with tempfile.TemporaryDirectory() as tmpdir:
+            storage = DataStorage()
+            storage.base = tmpdir
+            storage.connect(detector)
+            tags, visited = [], []
+            storage.tagRequest.connect(lambda tag: tags.append(tag))
+
+            engine = ScanEngine()
+            engine.beforeAcquisition.connect(lambda: visited.append(tuple(motor.get().values())))
+            plan = ScanPlan([ScanAxis('x', motor, [0, 0.5]), ScanAxis('loop', None, range(2)), ScanAxis('y', motor, [1, 2, 3])],
+                            detector, exposure=0.02, storage=storage, name="y{3}/x_[1]_[2]")
+            self.assertEqual((plan.shape, len(plan)), ((2, 2, 3), 12))
+            engine.run(plan)
+            _waitForSaving(storage)
+
+            self.assertEqual(engine.stats["points"], 12)
+            self.assertEqual(visited[:4], [(0, 1), (0.5, 1), (0, 1), (0.5, 1)], "The first axis should be innermost.")
+            self.assertEqual(detector.exposure, 0.02)
+            self.assertEqual(sorted(os.listdir(os.path.join(tmpdir, "folder"))), ["y1", "y2", "y3"])
+            self.assertEqual(sorted(os.listdir(os.path.join(tmpdir, "folder", "y2"))), ["x_0_0.npz", "x_0_1.npz", "x_1_0.npz", "x_1_1.npz"])
+            self.assertEqual(tags[0]["scanNames"], ["x", "loop", "y"])
+            self.assertEqual((storage.name, storage.numbered), ("data", True), "Storage settings should be restored.")
+        motor.kill()
+        detector.kill()
+
+    def test_stop(self):
+        motor = MultiMotorDummy('x', speed=100)
+        detector = MultiDetectorDummy(frameShape=(4, 4), exposure=0.05)
+        engine = ScanEngine()
+        finished, progress = [], []
+        engine.finished.connect(lambda: finished.append(True))
+        engine.progress.connect(lambda done, total: progress.append((done, total)))
+        stopAt = engine.beforeAcquisition.connect(lambda: engine.position == 2 and engine.stop())
+        plan = ScanPlan([ScanAxis('x', motor, range(10))], detector)
+        engine.run(plan)
+        self.assertEqual((engine.stats["points"], engine.position), (2, 2), "The scan should stop before the next acquisition.")
+        self.assertEqual(progress, [(1, 10), (2, 10)])
+        self.assertFalse(engine.running)
+        self.assertEqual(finished, [True])
+
+        engine.beforeAcquisition.disconnect(stopAt)
+        engine.run(plan, start=engine.position)
+        self.assertEqual(engine.stats["points"], 8, "The scan should resume at the first point that was not acquired.")
+        self.assertEqual(motor.get()['x'], 9)
+        motor.kill()
+        detector.kill()
+
+    def test_plan(self):
+        motor = MultiMotorDummy('x', 'y')
+        plan = ScanPlan([ScanAxis('x', motor, [0, 1]), ScanAxis('loop', None, range(2)), ScanAxis('loop', None, range(3))], None)
+        table = plan.points()
+        self.assertEqual(plan.fields, ['x', 'loop', 'loop_3'])
+        self.assertEqual(len(table), 12)
+        self.assertEqual(table["index"][:3].tolist(), [[0, 0, 0], [1, 0, 0], [0, 1, 0]])
+        self.assertEqual(table["x"][:3].tolist(), [0, 1, 0])
+        self.assertEqual(table["loop_3"][-1], 2)
+
+        plan.name = "x{1}_[1]_l[3]/{2}{9}[0]"
+        self.assertEqual(plan.fileName([1, 0, 2]), "x1_1_l2/0{9}[0]")
+        plan.axes[0] = ScanAxis('x', motor, ["{2}", 0.123456789])
+        names = plan.nameFormatter()
+        self.assertEqual(names([0, 1, 0]), "x{2}_0_l0/1{9}[0]", "Inserted values should not be substituted again.")
+        self.assertEqual(names([1, 1, 0]), "x0.12346_1_l0/1{9}[0]")
+
+        with self.assertRaises(ValueError):
+            ScanPlan([ScanAxis('z', motor, [0])], None).validate()
+        with self.assertRaises(ValueError):
+            ScanPlan([ScanAxis('x', motor, [0, float("nan")])], None).validate()
+        with self.assertRaises(ValueError):
+            ScanPlan([ScanAxis('x', motor, [])], None).validate()
+        motor.kill()
+
+
+class TestOrdering(unittest.TestCase):
+
+    def test_orders(self):
+        motor = MultiMotorDummy('x', 'y', 'z')
+        axes = [ScanAxis('x', motor, np.linspace(0, 1, 4), speed=1), ScanAxis('y', motor, np.linspace(0, 1, 4), speed=1), ScanAxis('z', motor, [0, 1, 2], speed=1)]
+        plan = ScanPlan(axes, None, name="[1]_[2]_[3]")
+        natural = plan.points()
+        for order in ["snake", "hilbert"]:
+            table = plan.points(order)
+            self.assertEqual(sorted(map(tuple, table["index"].tolist())), sorted(map(tuple, natural["index"].tolist())), "Every point should be visited once.")
+            steps = np.abs(np.diff(table["index"], axis=0)).sum(axis=1)
+            self.assertEqual(steps.max(), 1, f"Consecutive points of the {order} order should be neighbours.")
+            i, j, k = table["index"][5]
+            self.assertEqual(plan.fileName(table["index"][5]), f"{i}_{j}_{k}", "File names should follow the indices of the points.")
+            self.assertEqual(table["x"][5], axes[0].values[i])
+
+        report = plan.compareOrders()
+        self.assertEqual(set(report), {"natural", "snake", "hilbert", "nearest"})
+        self.assertLess(report["snake"]["time"], report["natural"]["time"], "The serpentine order should reduce fly-back moves.")
+        self.assertAlmostEqual(report["snake"]["travel"]["x"], 3 * 4 * 1)
+        motor.kill()
+
+    def test_nearest(self):
+        motor = MultiMotorDummy('x', 'y')
+        rng = np.random.default_rng(0)
+        points = rng.uniform(0, 10, 50)
+        plan = ScanPlan([ScanAxis('x', motor, points, speed=1), ScanAxis('loop', None, range(2))], None, order="nearest")
+        table = plan.points()
+        self.assertEqual(len(table), 100)
+        self.assertTrue(np.all(np.diff(table["index"][:, 1]) >= 0), "Loop axes should not be reordered.")
+        report = plan.compareOrders(["natural", "nearest"])
+        self.assertLess(report["nearest"]["travel"]["x"], report["natural"]["travel"]["x"] / 5)
+        with self.assertRaises(ValueError):
+            ScanPlan([ScanAxis('x', motor, points)], None, order="spiral").validate()
+        motor.kill()
+
+    def test_run_snake(self):
+        motor = MultiMotorDummy('x', 'y', speed=100)
+        detector = MultiDetectorDummy(frameShape=(4, 4), exposure=0.01)
+        engine, visited = ScanEngine(), []
+        engine.beforeAcquisition.connect(lambda: visited.append(tuple(motor.get().values())))
+        engine.run(ScanPlan([ScanAxis('x', motor, [0, 1, 2]), ScanAxis('y', motor, [0, 1])], detector, order="snake"))
+        self.assertEqual(visited, [(0, 0), (1, 0), (2, 0), (2, 1), (1, 1), (0, 1)])
+        motor.kill()
+        detector.kill()
+
+
+class TestConcurrentMoves(unittest.TestCase):
+
+    def test_concurrent(self):
+        motor1, motor2 = MultiMotorDummy('x', speed=10), MultiMotorDummy('y', 'z', speed=10)
+        detector = MultiDetectorDummy(frameShape=(4, 4), exposure=0.01)
+        axes = [ScanAxis('x', motor1, [0, 1], speed=10), ScanAxis('y', motor2, [0, 1], speed=10), ScanAxis('z', motor2, [0, 1], speed=10)]
+        engine, visited = ScanEngine(), []
+        engine.beforeAcquisition.connect(lambda: visited.append((motor1.get()['x'], *motor2.get().values())))
+        times = {}
+        for concurrent in [False, True]:
+            for m in [motor1, motor2]:
+                m.set(**{name: 0 for name in m.nameList}, wait=True)
+            plan = ScanPlan(axes, detector, concurrent=concurrent)
+            engine.run(plan)
+            times[concurrent] = engine.stats["move"]
+            self.assertAlmostEqual(plan.estimate()["time"], 0.7 if concurrent else 1.1)
+        self.assertEqual(visited[:8], visited[8:], "Concurrent moves should reach the same points.")
+        self.assertEqual(visited[7], (1, 1, 1))
+        self.assertLess(times[True], times[False] - 0.2, "Axes changing at the same point should move at the same time.")
+        motor1.kill()
+        motor2.kill()
+        detector.kill()
+
+
+class TestPipelinedScan(unittest.TestCase):
+
+    def test_pipelined(self):
+        motor = MultiMotorDummy('x', speed=10)
+        detector = MultiDetectorDummy(frameShape=(4, 4), exposure=0.01)
+        engine, stats = ScanEngine(), {}
+        for pipelined in [False, True]:
+            motor.set(x=0, wait=True)
+            processed = []
+
+            def process(point, data):
+                time.sleep(0.1)
+                processed.append((float(point["x"]), len(data)))
+
+            engine.run(ScanPlan([ScanAxis('x', motor, [0, 1, 2, 3, 4])], detector, pipelined=pipelined, process=process))
+            self.assertEqual(processed, [(x, 1) for x in range(5)], "Every point should be processed once, in order.")
+            stats[pipelined] = engine.stats
+        self.assertGreater(stats[False]["wait"], 0.3)
+        self.assertLess(stats[True]["wait"], stats[False]["wait"] - 0.2, "Processing should overlap with the moves.")
+        self.assertLess(stats[True]["elapsed"], stats[False]["elapsed"] - 0.2)
+        motor.kill()
+        detector.kill()
+
+
+class TestFlyScan(unittest.TestCase):
+
+    def test_fly(self):
+        motor = MultiMotorDummy('x', speed=10)
+        detector = MultiDetectorDummy(frameShape=(4, 4), exposure=0.02)
+        fly = FlyScan(motor, 'x', np.linspace(0, 1, 5), detector, framesPerPoint=3)
+        self.assertAlmostEqual(fly.velocity, 0.25 / 0.06)
+        self.assertTrue(np.allclose(fly.edges, [-0.125, 0.125, 0.375, 0.625, 0.875, 1.125]))
+
+        start = time.perf_counter()
+        result = fly.run()
+        self.assertLess(time.perf_counter() - start, fly.duration + 0.5)
+        self.assertEqual(motor.speed, {'x': 10}, "The speed of the motor should be restored.")
+        self.assertAlmostEqual(motor.get()['x'], 1.125)
+
+        samples = fly.samples
+        self.assertGreater(len(samples), 50)
+        moving = (samples[:, 1] > -0.1) & (samples[:, 1] < 1.1)
+        slope = np.polyfit(samples[moving, 0], samples[moving, 1], 1)[0]
+        self.assertAlmostEqual(slope, fly.velocity, delta=0.3, msg="The axis should move at the computed velocity.")
+
+        positions = result["positions"]
+        self.assertTrue(np.all(np.diff(positions) > 0), "Frames should be tagged with increasing positions.")
+        self.assertEqual(result["data"].shape, (5, 4, 4))
+        self.assertEqual(result["counts"].sum(), np.count_nonzero((positions >= -0.125) & (positions < 1.125)))
+        self.assertTrue(np.all(result["counts"] >= 1), "Every bin should receive frames.")
+        self.assertFalse(np.isnan(result["data"]).any())
+        motor.kill()
+        detector.kill()
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            FlyScan(None, 'x', [0], None)
+        with self.assertRaises(ValueError):
+            FlyScan(None, 'x', [0, 1, 3], None)
+        with self.assertRaises(NotImplementedError):
+            MultiMotorInterface('x').speed
+
+
+class TestAdaptiveScan(unittest.TestCase):
+
+    def test_refine(self):
+        motor = MultiMotorDummy('x', 'y', speed=100)
+        detector = MultiDetectorDummy(frameShape=(2, 2), exposure=0.005)
+        step = lambda data: np.tanh((motor.get()['x'] - 0.6) * 50)
+        scan = AdaptiveScan([ScanAxis('x', motor, np.linspace(0, 1, 5))], detector, step, maxPoints=20)
+        points = scan.run()
+        self.assertEqual(len(points), 20)
+        self.assertEqual(len(np.unique(points['x'])), 20)
+        self.assertTrue(np.allclose(points['value'], np.tanh((points['x'] - 0.6) * 50), atol=1e-6))
+        near = np.count_nonzero(np.abs(points['x'] - 0.6) < 0.1)
+        self.assertGreaterEqual(near, 6, "Points should be inserted where the signal changes.")
+
+        with tempfile.TemporaryDirectory() as tmp:
+            storage = DataStorage()
+            storage.base, storage.folder = tmp, "adaptive"
+            storage.connect(detector)
+            scan = AdaptiveScan([ScanAxis('x', motor, [0, 1]), ScanAxis('y', motor, [0, 1])], detector, step, maxPoints=8, storage=storage, name="map")
+            points = scan.run()
+            _waitForSaving(storage)
+            self.assertEqual(len(points), 8)
+            self.assertEqual(len(np.unique(points[['x', 'y']])), 8)
+            saved = np.load(os.path.join(tmp, "adaptive", "map_points.npz"))
+            self.assertTrue(np.array_equal(saved['x'], points['x']))
+            self.assertTrue(os.path.exists(os.path.join(tmp, "adaptive", "map_7.npz")))
+        motor.kill()
+        detector.kill()
+
+    def test_budget(self):
+        motor = MultiMotorDummy('x', speed=100)
+        detector = MultiDetectorDummy(frameShape=(2, 2), exposure=0.02)
+        scan = AdaptiveScan([ScanAxis('x', motor, [0, 1])], detector, lambda data: 0, maxPoints=1000, timeBudget=0.5)
+        points = scan.run()
+        self.assertLess(scan.elapsed, 0.6)
+        self.assertGreaterEqual(len(points), 3)
+        with self.assertRaises(ValueError):
+            AdaptiveScan([ScanAxis('x', motor, [0])], detector, lambda data: 0).run()
+        motor.kill()
+        detector.kill()
+
+
+class TestSimulator(unittest.TestCase):
+
+    def test_moveTime(self):
+        self.assertAlmostEqual(moveTime(1, 2), 0.5)
+        self.assertAlmostEqual(moveTime(4, 2, acceleration=1), 4)
+        self.assertAlmostEqual(moveTime(1, 2, acceleration=1), 2)
+
+    def test_simulate(self):
+        motor = MultiMotorDummy('x', 'y', speed=10)
+        detector = MultiDetectorDummy(frameShape=(4, 4), exposure=0.02)
+        plan = ScanPlan([ScanAxis('x', motor, [0, 1, 2]), ScanAxis('y', motor, [0, 1])], detector)
+        report = plan.simulate(overhead=0.01)
+        self.assertEqual(report["points"], 6)
+        self.assertAlmostEqual(report["phases"]["move"], 0.2 * 2 + 0.2, msg="The speed should be read from the controller.")
+        self.assertAlmostEqual(report["phases"]["acquire"], 0.12)
+        self.assertAlmostEqual(report["total"], 0.6 + 0.12 + 0.06)
+        self.assertEqual(report["bottleneck"], "move")
+        self.assertAlmostEqual(report["finish"][-1], report["total"])
+
+        storage = DataStorage()
+        plan.storage = storage
+        report = plan.simulate(throughput=1000)
+        self.assertEqual(report["bottleneck"], "storage")
+        self.assertGreater(report["total"], report["finish"][-1] + 16 * 8 / 1000 - 1e-9, "Saving should delay the end of the scan.")
+        self.assertGreater(measureThroughput(), 0)
+        plan.storage = None
+
+        engine, etas = ScanEngine(), []
+        engine.progress.connect(lambda i, n: etas.append(engine.eta))
+        engine.run(plan)
+        self.assertAlmostEqual(engine.prediction["total"], 0.6 + 0.12)
+        self.assertEqual(len(etas), 6)
+        self.assertEqual(etas[-1], 0)
+        self.assertLess(abs(etas[0] - engine.stats["elapsed"] * 5 / 6), 0.3, "The ETA should follow the actual duration.")
+        self.assertIsNone(engine.eta)
+        motor.kill()
+        detector.kill()
+
+
+class TestScanQueue(unittest.TestCase):
+
+    def test_queue(self):
+        motor = MultiMotorDummy('x', speed=100)
+        detector = MultiDetectorDummy(frameShape=(4, 4), exposure=0.01)
+        devices = {"motor": motor, "detector": detector}
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "queue")
+            storage = DataStorage()
+            storage.base, storage.folder = tmp, "default"
+            storage.connect(detector)
+            queue = ScanQueue(devices, storage, path=path)
+            low = queue.add(ScanPlan([ScanAxis('x', motor, [0, 1])], detector, name="low_[1]"), folder="low")
+            high = queue.add(ScanPlan([ScanAxis('x', motor, [0, 1, 2]), ScanAxis('loop', None, range(2))], detector, name="high_[1]_[2]"), priority=1, folder="high")
+            self.assertEqual([job["id"] for job in queue.jobs], [high, low], "Jobs of higher priority should run first.")
+            with self.assertRaises(ValueError):
+                queue.add(ScanPlan([ScanAxis('x', MultiMotorDummy('x'), [0])], detector))
+
+            started = []
+            queue.jobStarted.connect(started.append)
+            queue.engine.progress.connect(lambda i, n: queue.pause() if (queue.current, i) == (high, 2) else None)
+            queue.run()
+            self.assertTrue(queue.paused)
+            self.assertEqual(queue.jobs[0]["state"], "queued")
+            self.assertEqual(queue.jobs[0]["position"], 2, "The queue should pause at a point boundary.")
+
+            restored = ScanQueue(devices, storage, path=path)
+            self.assertEqual(restored.jobs, queue.jobs, "The queue should survive a restart.")
+            restored.run()
+            _waitForSaving(storage)
+            self.assertEqual([job["state"] for job in restored.jobs], ["done", "done"])
+            self.assertEqual(started, [high])
+            self.assertEqual(sorted(os.listdir(os.path.join(tmp, "high"))), sorted(f"high_{i}_{j}.npz" for i in range(3) for j in range(2)))
+            self.assertEqual(sorted(os.listdir(os.path.join(tmp, "low"))), ["low_0.npz", "low_1.npz"])
+            self.assertEqual(storage.folder, "default", "The storage settings should be restored.")
+
+            restored.requeue(low)
+            restored.remove(high)
+            del devices["motor"]
+            restored.run()
+            self.assertEqual(restored.jobs[0]["state"], "failed")
+        motor.kill()
+        detector.kill()
+
+    def test_engineBusy(self):
+        motor = MultiMotorDummy('x', speed=100)
+        detector = MultiDetectorDummy(frameShape=(4, 4), exposure=0.01)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "queue")
+            queue = ScanQueue({"motor": motor, "detector": detector}, path=path)
+            id = queue.add(ScanPlan([ScanAxis('x', motor, np.array([0, 1]))], detector, exposure=np.float64(0.01)), priority=np.int64(2))
+            with open(path) as file:
+                self.assertEqual(json.load(file)["jobs"][0]["plan"]["exposure"], 0.01, "The queue should be saved as JSON with builtin numbers.")
+            self.assertEqual(ScanQueue({}, path=path).jobs, queue.jobs)
+
+            errors = []
+
+            def runQueue(i, n):
+                try:
+                    queue.run()
+                except RuntimeError as e:
+                    errors.append(e)
+            queue.engine.progress.connect(runQueue)
+            queue.engine.run(ScanPlan([ScanAxis('x', motor, [0])], detector))
+            self.assertEqual(len(errors), 1, "The queue should not run while the engine runs another scan.")
+            self.assertEqual(queue.jobs[0]["state"], "queued", "The job should stay queued.")
+            self.assertFalse(queue.running)
+            queue.engine.progress.disconnect(runQueue)
+            queue.run()
+            self.assertEqual(queue.jobs[0]["state"], "done")
+            self.assertEqual(queue.jobs[0]["id"], id)
+        motor.kill()
+        detector.kill()
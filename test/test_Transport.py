@@ -0,0 +1,118 @@
+import socketserver
+import threading
+import time
+import unittest
+from PyQt5 import QtTest
+
+from lys_instr.dummy.MultiMotor import SharedLinkMotorDummy
+from lys_instr.Transport import LoopbackTransport, TCPTransport, RequestMultiplexer
+
+
+class _UpperHandler(socketserver.StreamRequestHandler):
+
+    def handle(self):
+        for line in self.rfile:
+            self.wfile.write(line.upper())
+
+
+class TestRequestMultiplexer(unittest.TestCase):
+
+    def test_pipelining(self):
+        mux = RequestMultiplexer(LoopbackTransport(lambda r: r.upper(), latency=0.05), depth=4)
+        ch = mux.channel("motor")
+        start = time.perf_counter()
+        futures = [ch.queryAsync(f"pos{i}") for i in range(8)]
+        self.assertEqual([f.result(5) for f in futures], [f"POS{i}".encode() for i in range(8)], "Responses should be matched to requests in order.")
+        self.assertLess(time.perf_counter() - start, 8 * 0.05 / 2, "Pipelined queries should overlap their latencies.")
+        self.assertEqual(ch.query("a"), "A")
+        mux.close()
+        with self.assertRaises(ConnectionError):
+            ch.queryAsync("a")
+
+    def test_fairness(self):
+        order = []
+        mux = RequestMultiplexer(LoopbackTransport(lambda r: order.append(r[:1]) or r, latency=0.01), depth=1)
+        busy, idle = mux.channel("busy"), mux.channel("idle")
+        futures = [busy.queryAsync(f"b{i}") for i in range(10)]
+        futures += [idle.queryAsync(f"i{i}") for i in range(2)]
+        for f in futures:
+            f.result(5)
+        self.assertLess(order.index(b"i"), 4, "Requests of other channels should not wait behind a busy channel.")
+        mux.close()
+
+    def test_send(self):
+        received = []
+        mux = RequestMultiplexer(LoopbackTransport(lambda r: received.append(r)))
+        ch = mux.channel("motor")
+        ch.send("move 1").result(5)
+        self.assertEqual(received, [b"move 1"], "Commands without response should be written.")
+        mux.close()
+
+    def test_resync(self):
+        def handler(request):
+            if request == b"GET lost":
+                return None
+            return request.replace(b"GET", b"VAL")
+
+        def match(request, response):
+            return request.split()[1] == response.split()[1]
+
+        mux = RequestMultiplexer(LoopbackTransport(handler, latency=0.01), depth=4, timeout=0.2, match=match)
+        ch = mux.channel("motor")
+        lost, a, b = ch.queryAsync("GET lost"), ch.queryAsync("GET a"), ch.queryAsync("GET b")
+        self.assertEqual((a.result(5), b.result(5)), (b"VAL a", b"VAL b"), "Responses should be matched to their requests after a lost response.")
+        with self.assertRaises(ConnectionError):
+            lost.result(5)
+        mux.close()
+
+        mux = RequestMultiplexer(LoopbackTransport(handler, latency=0.01), depth=1, timeout=0.1)
+        ch = mux.channel("motor")
+        with self.assertRaises(RuntimeError):
+            ch.query("GET lost", timeout=5)
+        self.assertEqual(ch.query("GET a", timeout=5), "VAL a", "An expired request should free its slot.")
+        mux.close()
+
+    def test_tcp(self):
+        server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), _UpperHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        host, port = server.server_address
+        key = ("tcp", host, port)
+        mux1 = RequestMultiplexer.shared(key, lambda: TCPTransport(host, port))
+        mux2 = RequestMultiplexer.shared(key, lambda: TCPTransport(host, port))
+        self.assertIs(mux1, mux2, "Devices on the same link should share one connection.")
+        self.assertEqual(mux1.channel("x").query("abc", timeout=5), "ABC")
+        mux1.release()
+        self.assertTrue(mux2.transport.isOpen, "Link should stay open while it is in use.")
+        mux2.release()
+        self.assertFalse(mux2.transport.isOpen, "Link should be closed when released by all users.")
+        server.shutdown()
+        server.server_close()
+
+
+class TestSharedLinkMotor(unittest.TestCase):
+
+    def test_sharedLink(self):
+        m1 = SharedLinkMotorDummy('x', 'y', link="test_sharedLink", speed=100)
+        m2 = SharedLinkMotorDummy('z', link="test_sharedLink", speed=100)
+        self.assertIs(m1.link, m2.link, "Motors on the same link should share one multiplexer.")
+        m1.set(x=0.5, y=1)
+        m2.set(z=2, wait=True)
+        m1.waitForReady()
+        self.assertEqual(m1.get(), {'x': 0.5, 'y': 1})
+        self.assertEqual(m2.get(), {'z': 2})
+        self.assertTrue(all(m1.isAlive.values()))
+        transport = m1.link.transport
+        m1.kill()
+        QtTest.QTest.qWait(100)
+        self.assertEqual(m2.get(), {'z': 2}, "The link should stay open while another motor uses it.")
+        m2.kill()
+        self.assertFalse(transport.isOpen, "The link should be closed when all motors are killed.")
+
+    def test_communicationError(self):
+        m = SharedLinkMotorDummy('x', 'y', link="test_communicationError", speed=100)
+
+        def lost(command):
+            raise RuntimeError("lost")
+        m._queryAll = lost
+        self.assertEqual(m._isAlive(), {'x': False, 'y': False}, "A communication error should mark all axes as dead.")
+        m.kill()
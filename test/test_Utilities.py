@@ -0,0 +1,30 @@
+import time
+import unittest
+
+from lys_instr.Utilities import HybridTimer, preciseSleep
+
+
+class TestHybridTimer(unittest.TestCase):
+
+    def test_precision(self):
+        timer = HybridTimer()
+        for _ in range(20):
+            timer.sleep(0.005)
+        stats = timer.stats
+        self.assertEqual(stats["calls"], 20)
+        self.assertGreaterEqual(stats["meanLateness"], 0, "Busy-waiting timer should never wake up early.")
+        self.assertLess(stats["meanLateness"], 0.002, "Mean lateness should be well below the OS sleep granularity.")
+        self.assertLess(stats["spinTime"], stats["sleepTime"] / 2, "Most of the time should be spent in the OS sleep.")
+
+    def test_tolerance(self):
+        timer = HybridTimer(tolerance=0.01)
+        timer.sleep(0.005)
+        self.assertEqual(timer.stats["spinTime"], 0, "No busy-wait should be used when the tolerance covers the overshoot.")
+        timer.resetStats()
+        self.assertEqual(timer.stats["calls"], 0)
+
+    def test_preciseSleep(self):
+        start = time.perf_counter()
+        preciseSleep(0.01)
+        self.assertGreaterEqual(time.perf_counter() - start, 0.01)
+        preciseSleep(-1)